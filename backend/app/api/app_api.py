@@ -1,47 +1,31 @@
-from fastapi import FastAPI, Depends, HTTPException, Query
+from datetime import date
+
+from fastapi import FastAPI, Depends, HTTPException, Query, Request
+from fastapi.middleware.gzip import GZipMiddleware
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
-from app.core.database import SessionLocal
+from app.api.deps import get_db, get_read_db
+from app.api.lifespan import lifespan
+from app.core.admission import AdmissionControlMiddleware
+from app.core.config import COMPRESS_MIN_BYTES, GZIP_LEVEL
+from app.core.query_guard import QueryGuardMiddleware
+from app.core.regions import format_region_code, to_region_code
+from app.core.serialization import FastJSONResponse, negotiate
+from app.repositories.station_repository import find_stations
+from app.repositories.stats_repository import REGISTRATION_DIMENSIONS, find_air_pollution, find_registration_totals
+from app.services.dimension_service import get_filters, get_regions
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan, default_response_class=FastJSONResponse)
 
-# -------------------------
-# 요청 1건당 DB 세션
-# -------------------------
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+# 엔드포인트가 직접 압축하지 않은 응답만 gzip (Content-Encoding이 이미 있으면 건너뜀, SSE(text/event-stream)도 건너뜀)
+app.add_middleware(GZipMiddleware, minimum_size=COMPRESS_MIN_BYTES, compresslevel=GZIP_LEVEL)
 
+# 쿼리 실행 예산(MAX_EXECUTION_TIME) + 클라이언트가 끊기면 진행 중인 쿼리 KILL (app.core.query_guard)
+app.add_middleware(QueryGuardMiddleware)
 
-# -------------------------
-# 지역 코드/이름 매핑 (DB에 region_code<->name 테이블이 없어서 코드로 고정)
-# registrations는 region_name만 있어서, 코드로 필터 들어오면 이름으로 변환해서 조회함
-# -------------------------
-REGION_CODE_TO_NAME = {
-    "11": "서울특별시",
-    "41": "경기도",
-    "28": "인천광역시",
-    "42": "강원도",
-    "43": "충청북도",
-    "44": "충청남도",
-    "30": "대전광역시",
-    "36": "세종특별자치시",
-    "47": "경상북도",
-    "48": "경상남도",
-    "27": "대구광역시",
-    "31": "울산광역시",
-    "26": "부산광역시",
-    "45": "전라북도",
-    "46": "전라남도",
-    "29": "광주광역시",
-    "50": "제주특별자치도",
-}
-REGION_NAME_TO_CODE = {v: k for k, v in REGION_CODE_TO_NAME.items()}
-
+# 경로별 동시 실행 제한 + 대기열 (가장 바깥에서 먼저 걸러냄, app.core.admission)
+app.add_middleware(AdmissionControlMiddleware)
 
 def _yyyymm_from_date_str(date_str: str) -> int:
     # MySQL DATE -> "YYYY-MM-DD"
@@ -50,6 +34,31 @@ def _yyyymm_from_date_str(date_str: str) -> int:
     return y * 100 + m
 
 
+def _parse_month(value: str | None) -> date | None:
+    """'202401' / '2024-01' -> 해당 월 1일"""
+    if not value:
+        return None
+    digits = value.replace("-", "")
+    if len(digits) != 6 or not digits.isdigit() or not 1 <= int(digits[4:6]) <= 12:
+        raise ValueError(f"invalid month (YYYYMM or YYYY-MM): {value}")
+    return date(int(digits[0:4]), int(digits[4:6]), 1)
+
+
+# group_by 값은 쿼리 파라미터 이름(car_type/usage)으로 와도 받아줌
+_GROUP_BY_ALIASES = {"car_type": "vehicle_type", "usage": "usage_type", "sido": "region"}
+
+
+def _parse_group_by(value: str | None) -> tuple[str, ...]:
+    """'region,car_type' -> ("region", "vehicle_type") (순서는 REGISTRATION_DIMENSIONS 기준, 없으면 전체)"""
+    if value is None:
+        return REGISTRATION_DIMENSIONS
+    names = {_GROUP_BY_ALIASES.get(v.strip(), v.strip()) for v in value.split(",") if v.strip()}
+    unknown = names - set(REGISTRATION_DIMENSIONS)
+    if unknown:
+        raise ValueError(f"unknown group_by: {', '.join(sorted(unknown))} (choose from {', '.join(REGISTRATION_DIMENSIONS)})")
+    return tuple(d for d in REGISTRATION_DIMENSIONS if d in names)
+
+
 # -------------------------
 # 기본
 # -------------------------
@@ -65,23 +74,14 @@ def db_ping(db: Session = Depends(get_db)):
 
 
 # -------------------------
-# 1) /regions (실DB 기반 + 매핑)
-# - DB에는 region_name만 있어서, region_name을 distinct로 뽑고 code를 매핑
-# - 매핑에 없으면 code는 region_name 그대로 반환 (깨지지 않게)
+# 1) /regions (실DB, region_dim)
+# - region_dim(정수 코드 + 이름) 중 등록 통계에 나오는 지역
+# - 데이터 버전별 캐시 (dimension_service)
 # -------------------------
 @app.get("/regions")
-def regions(db: Session = Depends(get_db)):
+def regions(db: Session = Depends(get_read_db)):
     try:
-        rows = db.execute(
-            text("SELECT DISTINCT region_name FROM car_registration_stats ORDER BY region_name")
-        ).mappings().all()
-
-        result = []
-        for r in rows:
-            name = r["region_name"]
-            code = REGION_NAME_TO_CODE.get(name, name)
-            result.append({"code": code, "name": name})
-        return result
+        return get_regions(db)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"/regions DB error: {e}")
 
@@ -91,25 +91,12 @@ def regions(db: Session = Depends(get_db)):
 # - years: base_month(date)에서 YEAR 추출
 # - car_types: vehicle_type distinct
 # - usages: usage_type distinct
+# - 데이터 버전별 캐시 (dimension_service)
 # -------------------------
 @app.get("/filters")
-def filters(db: Session = Depends(get_db)):
+def filters(db: Session = Depends(get_read_db)):
     try:
-        years = db.execute(
-            text("SELECT DISTINCT YEAR(base_month) AS y FROM car_registration_stats ORDER BY y")
-        ).mappings().all()
-        car_types = db.execute(
-            text("SELECT DISTINCT vehicle_type AS v FROM car_registration_stats ORDER BY v")
-        ).mappings().all()
-        usages = db.execute(
-            text("SELECT DISTINCT usage_type AS u FROM car_registration_stats ORDER BY u")
-        ).mappings().all()
-
-        return {
-            "years": [row["y"] for row in years if row["y"] is not None],
-            "car_types": [row["v"] for row in car_types if row["v"] is not None],
-            "usages": [row["u"] for row in usages if row["u"] is not None],
-        }
+        return get_filters(db)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"/filters DB error: {e}")
 
@@ -117,17 +104,23 @@ def filters(db: Session = Depends(get_db)):
 # -------------------------
 # 3) /stats/registrations (실DB)
 # Query:
-# - year (int)  -> YEAR(base_month) 필터
-# - sido_code (str) -> region_name로 변환해서 필터
+# - year (int)  -> base_month 범위 필터 (해당 연도)
+# - from_month / to_month (YYYYMM 또는 YYYY-MM) -> base_month 범위 (양끝 포함)
+# - sido_code (str) -> region_dim.region_code (정수 키) 로 변환해서 필터 (시/도 이름이 와도 변환)
 # - car_type (str) -> vehicle_type
 # - usage (str) -> usage_type
+# - granularity: month(기본) | quarter | year | total -> 기간 단위 합계 (DB에서 집계, PERIOD_SQL)
+# - group_by: region,vehicle_type,usage_type 중 일부 (쉼표 구분, 없으면 전체)
+#   -> 빠진 차원은 합쳐서 내려줌 (예: granularity=year&group_by=region -> 지역 x 연도 합계)
+# 같은 조건의 동시 요청은 DB 쿼리 하나로 합쳐짐 (stats_repository, single-flight)
 #
-# 응답은 프론트 DTO 형태 유지:
+# 응답은 프론트 DTO 형태 유지 (Accept에 따라 JSON/MessagePack, 큰 응답은 br/gzip):
 # {
 #   "filters": {...},
 #   "data": [
 #     {
-#       "base_month": 202401,
+#       "base_month": 202401,            <- 기간 시작 월 (total이면 없음)
+#       "period": "2024-Q1",             <- month가 아닐 때만
 #       "region": {"code":"11","name":"서울특별시"},
 #       "vehicle_type":"EV",
 #       "usage_type":"PRIVATE",
@@ -135,113 +128,90 @@ def filters(db: Session = Depends(get_db)):
 #     }, ...
 #   ]
 # }
+# (region / vehicle_type / usage_type 은 group_by에 있을 때만)
 # -------------------------
 @app.get("/stats/registrations")
 def stats_registrations(
+    request: Request,
     year: int | None = None,
+    from_month: str | None = None,
+    to_month: str | None = None,
     sido_code: str | None = None,
     car_type: str | None = None,
     usage: str | None = None,
-    db: Session = Depends(get_db),
+    granularity: str = Query(default="month", description="month | quarter | year | total"),
+    group_by: str | None = Query(default=None, description="region,vehicle_type,usage_type 중 일부 (쉼표 구분)"),
+    db: Session = Depends(get_read_db),
 ):
     try:
-        where = []
-        params = {}
-
-        if year is not None:
-            where.append("YEAR(base_month) = :year")
-            params["year"] = year
-
-        region_name = None
-        if sido_code is not None:
-            region_name = REGION_CODE_TO_NAME.get(sido_code, None)
-            if region_name is None:
-                # 혹시 프론트가 name을 code로 넣는 케이스 방어
-                region_name = sido_code
-            where.append("region_name = :region_name")
-            params["region_name"] = region_name
-
-        if car_type is not None:
-            where.append("vehicle_type = :vehicle_type")
-            params["vehicle_type"] = car_type
-
-        if usage is not None:
-            where.append("usage_type = :usage_type")
-            params["usage_type"] = usage
-
-        where_sql = ("WHERE " + " AND ".join(where)) if where else ""
-
-        # 월 단위 합(같은 월/지역/차종/용도 합산)
-        sql = text(f"""
-            SELECT
-                DATE_FORMAT(base_month, '%Y-%m-%d') AS base_month,
-                region_name,
-                vehicle_type,
-                usage_type,
-                SUM(registration_count) AS registration_count
-            FROM car_registration_stats
-            {where_sql}
-            GROUP BY base_month, region_name, vehicle_type, usage_type
-            ORDER BY base_month, region_name, vehicle_type, usage_type
-        """)
-
-        rows = db.execute(sql, params).mappings().all()
+        dims = _parse_group_by(group_by)
+        rows = find_registration_totals(
+            db,
+            granularity,
+            dims,
+            year,
+            _parse_month(from_month),
+            _parse_month(to_month),
+            to_region_code(sido_code),
+            car_type,
+            usage,
+        )
 
         data = []
         for r in rows:
-            name = r["region_name"]
-            code = REGION_NAME_TO_CODE.get(name, name)
-            base_month_yyyymm = _yyyymm_from_date_str(r["base_month"])
-            data.append({
-                "base_month": base_month_yyyymm,
-                "region": {"code": code, "name": name},
-                "vehicle_type": r["vehicle_type"],
-                "usage_type": r["usage_type"],
-                "registration_count": int(r["registration_count"] or 0),
-            })
-
-        return {
-            "filters": {"year": year, "sido_code": sido_code, "car_type": car_type, "usage": usage},
+            item = {}
+            if granularity != "total":
+                item["base_month"] = _yyyymm_from_date_str(r["period_start"])
+                if granularity != "month":
+                    item["period"] = r["period"]
+            if "region" in dims:
+                item["region"] = {"code": format_region_code(r["region_code"]), "name": r["region_name"]}
+            if "vehicle_type" in dims:
+                item["vehicle_type"] = r["vehicle_type"]
+            if "usage_type" in dims:
+                item["usage_type"] = r["usage_type"]
+            item["registration_count"] = int(r["registration_count"] or 0)
+            data.append(item)
+
+        return negotiate(request, {
+            "filters": {
+                "year": year,
+                "from_month": from_month,
+                "to_month": to_month,
+                "sido_code": sido_code,
+                "car_type": car_type,
+                "usage": usage,
+                "granularity": granularity,
+                "group_by": list(dims),
+            },
             "data": data,
-        }
+        })
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"/stats/registrations DB error: {e}")
 
 
 # -------------------------
 # 4) /stats/air-pollution (실DB)
-# air_pollution: year, region_code, pollution_degree
+# air_pollution: year, region_code, pollution_degree (지역 이름은 region_dim 조인)
 # region_code는 smallint라서 "11"처럼 문자열 코드로 포맷
+# 같은 연도의 동시 요청은 DB 쿼리 하나로 합쳐짐
 # -------------------------
 @app.get("/stats/air-pollution")
 def stats_air_pollution(
     year: int | None = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     try:
-        where_sql = ""
-        params = {}
-        if year is not None:
-            where_sql = "WHERE year = :year"
-            params["year"] = year
-
-        sql = text(f"""
-            SELECT year, region_code, pollution_degree
-            FROM air_pollution
-            {where_sql}
-            ORDER BY year, region_code
-        """)
-
-        rows = db.execute(sql, params).mappings().all()
+        rows = find_air_pollution(db, year)
 
         result = []
         for r in rows:
-            code = str(r["region_code"]).zfill(2)  # 11, 41 같은 형태 맞추기
-            name = REGION_CODE_TO_NAME.get(code, "")
             result.append({
                 "year": int(r["year"]),
-                "region": {"code": code, "name": name},
+                "region": {"code": format_region_code(r["region_code"]), "name": r["region_name"] or ""},
                 "pollution_degree": int(r["pollution_degree"] or 0),
             })
         return result
@@ -256,7 +226,7 @@ def stats_air_pollution(
 # 프론트는 source 같은 필드가 있을 수 있어서 company를 source로 내림
 # -------------------------
 @app.get("/faqs")
-def faqs(db: Session = Depends(get_db)):
+def faqs(db: Session = Depends(get_read_db)):
     try:
         sql = text("""
             SELECT question, answer, company, category
@@ -281,54 +251,65 @@ def faqs(db: Session = Depends(get_db)):
 # -------------------------
 # 6) /stations (실DB)
 # station: name, address, latitude, longtitude(오타), type
-# 응답에서는 longitude로 정리
+# 응답에서는 longitude로 정리 (Accept에 따라 JSON/MessagePack, 큰 응답은 br/gzip)
+# 같은 조건의 동시 요청은 DB 쿼리 하나로 합쳐짐 (station_repository)
 # -------------------------
 @app.get("/stations")
 def get_stations(
+    request: Request,
     station_type: str | None = None,
     q: str | None = None,
     has_coord: bool = True,
     limit: int = Query(default=500, ge=1, le=5000),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     try:
-        where = []
-        params = {}
+        return negotiate(request, find_stations(db, station_type, q, has_coord, limit))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"/stations DB error: {e}")
 
-        if station_type:
-            where.append("type = :station_type")
-            params["station_type"] = station_type
+# -------------------------
+# 7) 분리된 라우터 등록
+# -------------------------
+from app.api.endpoints.tiles import router as tiles_router
+app.include_router(tiles_router, tags=["Tiles"])
 
-        if q:
-            where.append("name LIKE :q")
-            params["q"] = f"%{q}%"
+from app.api.endpoints.heatmaps import router as heatmaps_router
+app.include_router(heatmaps_router, tags=["Heatmaps"])
 
-        if has_coord:
-            where.append("latitude IS NOT NULL AND longtitude IS NOT NULL")
+from app.api.endpoints.analysis import router as analysis_router
+app.include_router(analysis_router, tags=["Analysis"])
 
-        where_sql = ("WHERE " + " AND ".join(where)) if where else ""
+from app.api.endpoints.timeseries import router as timeseries_router
+app.include_router(timeseries_router, tags=["Stats"])
 
-        sql = text(f"""
-            SELECT id, name, address, latitude, longtitude, type
-            FROM station
-            {where_sql}
-            ORDER BY id DESC
-            LIMIT :limit
-        """)
-        params["limit"] = limit
+from app.api.endpoints.region_summary import router as region_summary_router
+app.include_router(region_summary_router, tags=["Stats"])
 
-        rows = db.execute(sql, params).mappings().all()
+from app.api.endpoints.rankings import router as rankings_router
+app.include_router(rankings_router, tags=["Stats"])
+
+from app.api.endpoints.station_clusters import router as station_clusters_router
+app.include_router(station_clusters_router, tags=["Stations"])
+
+from app.api.endpoints.availability import router as availability_router
+app.include_router(availability_router, tags=["Stations"])
+
+from app.api.endpoints.station_page import router as station_page_router
+app.include_router(station_page_router, tags=["Stations"])
+
+from app.api.endpoints.faqs import router as faqs_router
+app.include_router(faqs_router, tags=["FAQ"])
+
+from app.api.endpoints.subsidies import router as subsidies_router
+app.include_router(subsidies_router, tags=["Subsidies"])
+
+from app.api.endpoints.dashboard import router as dashboard_router
+app.include_router(dashboard_router, tags=["Dashboard"])
+
+from app.api.endpoints.ready import router as ready_router
+app.include_router(ready_router, tags=["Health"])
+
+from app.api.endpoints.metrics import router as metrics_router
+app.include_router(metrics_router, tags=["Health"])
 
-        return [
-            {
-                "id": r["id"],
-                "name": r["name"],
-                "address": r["address"],
-                "latitude": r["latitude"],
-                "longitude": r["longtitude"],  # DB 컬럼 오타 보정
-                "type": r["type"],
-            }
-            for r in rows
-        ]
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"/stations DB error: {e}")
\ No newline at end of file
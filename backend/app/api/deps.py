@@ -1,9 +1,26 @@
 from typing import Generator
-from app.core.database import SessionLocal
 
+from app.core.database import ReadSessionLocal, SessionLocal
+
+# -------------------------
+# 요청 1건당 DB 세션 (FastAPI 의존성)
+# - app_api와 모든 엔드포인트가 이 정의만 씀 -> dependency_overrides 하나로 전부 바뀜
+# - get_db: primary (쓰기 / 헬스 체크)
+# - get_read_db: 조회용, 정상 레플리카 라운드로빈 (app.core.database)
+# -------------------------
 def get_db() -> Generator:
+    """primary (쓰기)"""
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+def get_read_db() -> Generator:
+    """조회 전용 (정상 레플리카, 없으면 primary)"""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
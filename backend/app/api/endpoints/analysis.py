@@ -0,0 +1,29 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_read_db
+from app.services.analysis_service import get_correlation
+
+router = APIRouter()
+
+
+@router.get("/analysis/correlation")
+def analysis_correlation(
+    car_type: Optional[str] = Query(default=None, description="차종 (예: EV, ICE / 없으면 전체)"),
+    usage: Optional[str] = Query(default=None, description="용도 (예: PRIVATE)"),
+    max_lag: int = Query(default=3, ge=0, le=10, description="최대 시차(년)"),
+    db: Session = Depends(get_read_db),
+):
+    """
+    등록대수와 대기오염도의 상관계수 (Pearson / Spearman)
+
+    - 지역별 + 전국(등록 합계, 오염도 평균)
+    - lag k: k년 전 등록대수와 해당 연도 오염도의 상관
+    - 표본(연도 쌍)이 3개 미만이면 null
+    """
+    try:
+        return get_correlation(db, car_type, usage, max_lag)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"/analysis/correlation DB error: {e}")
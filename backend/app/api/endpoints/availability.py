@@ -0,0 +1,99 @@
+import asyncio
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from app.core.config import AVAILABILITY_HEARTBEAT_SEC
+from app.core.serialization import dumps_json
+from app.services.availability_service import (
+    event_id,
+    get_availability,
+    hub,
+    parse_event_id,
+    parse_station_ids,
+    store,
+)
+
+router = APIRouter()
+
+# 지도/목록 iframe(Streamlit)에서 EventSource로 직접 붙으므로 CORS 허용
+_STREAM_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",  # nginx 등 프록시가 모아서 보내지 않도록
+    "Access-Control-Allow-Origin": "*",
+}
+
+
+def _event(event: str, seq: int, data) -> bytes:
+    return b"id: %s\nevent: %s\ndata: %s\n\n" % (event_id(seq).encode(), event.encode(), dumps_json(data))
+
+
+@router.get("/stations/availability")
+def stations_availability(
+    ids: Optional[str] = Query(default=None, description="station.id 목록 (쉼표 구분, 없으면 전체)"),
+):
+    """
+    충전소별 충전기 상태 요약 스냅샷
+
+    - stations: [{"stat_id", "station_id", "available", "charging", "unavailable", "total", "updated_at"}, ...]
+    - seq: 이 스냅샷 시점의 이벤트 id ("EPOCH-순번", /stations/availability/stream 과 같은 형식, 워커마다 EPOCH가 다름)
+    """
+    try:
+        return get_availability(parse_station_ids(ids))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/stations/availability/stream")
+async def stations_availability_stream(
+    request: Request,
+    ids: Optional[str] = Query(default=None, description="station.id 목록 (쉼표 구분, 없으면 전체)"),
+    last_event_id: Optional[str] = Header(default=None, alias="Last-Event-ID"),
+):
+    """
+    충전기 상태 변경 스트림 (Server-Sent Events)
+
+    - 처음: event: snapshot (요약 전체), 이후: event: delta (요약이 바뀐 충전소만)
+    - id: "EPOCH-순번". 재접속 시 같은 워커면 Last-Event-ID 이후 변경분을 이어서 보내고,
+      다른 워커(EPOCH가 다름)거나 너무 오래됐으면 snapshot부터
+    - 변경이 없으면 AVAILABILITY_HEARTBEAT_SEC마다 주석(: ping)으로 연결 유지
+    """
+    try:
+        station_ids = parse_station_ids(ids)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # 스냅샷보다 먼저 구독 -> 그 사이에 생긴 변경분도 놓치지 않음 (중복은 같은 값 덮어쓰기라 무해)
+    sub = hub.subscribe(station_ids)
+    # 다른 워커(또는 재시작 전 프로세스)가 준 id면 순번이 달라서 이어 보낼 수 없음 -> 스냅샷부터
+    replay = None
+    last_seq = parse_event_id(last_event_id)
+    if last_seq is not None:
+        replay = hub.since(last_seq)
+
+    async def events():
+        try:
+            if replay is None:
+                yield _event("snapshot", hub.seq, store.snapshot(station_ids))
+            else:
+                for seq, changes in replay:
+                    picked = [c for c in changes if sub.wants(c)]
+                    if picked:
+                        yield _event("delta", seq, picked)
+
+            while not await request.is_disconnected():
+                try:
+                    seq, changes = await asyncio.wait_for(sub.queue.get(), AVAILABILITY_HEARTBEAT_SEC)
+                except asyncio.TimeoutError:
+                    yield b": ping\n\n"
+                    continue
+                if changes is None:
+                    sub.resync = False
+                    yield _event("snapshot", seq, store.snapshot(station_ids))
+                else:
+                    yield _event("delta", seq, changes)
+        finally:
+            hub.unsubscribe(sub)
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers=_STREAM_HEADERS)
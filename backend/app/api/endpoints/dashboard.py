@@ -0,0 +1,32 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_read_db
+from app.core.serialization import negotiate
+from app.services.dashboard_service import get_dashboard_bundle
+
+router = APIRouter()
+
+
+@router.get("/dashboard/bundle")
+def dashboard_bundle(
+    request: Request,
+    year: Optional[int] = Query(default=None, description="조회 연도 (없으면 최신)"),
+    sparklines: bool = Query(default=False, description="지역별 연도 추이(spark) 포함"),
+    db: Session = Depends(get_read_db),
+):
+    """
+    메인 대시보드 데이터 한 번에 조회
+
+    - regions: [{"code", "name", "reg_total", "pollution_degree", "spark"?}, ...]
+    - sparklines=true면 spark.reg / spark.poll 이 spark_years 순서로 들어간다.
+    - 직렬화/압축된 바이트를 캐시해 두고 Accept/Accept-Encoding에 맞는 것을 그대로 내려준다. (ETag / 304 지원)
+    """
+    try:
+        bundle = get_dashboard_bundle(db, year, sparklines)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"/dashboard/bundle DB error: {e}")
+
+    return negotiate(request, bundle, headers={"Cache-Control": "public, max-age=60"})
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends
 from fastapi.responses import JSONResponse
 from sqlalchemy import text
 from sqlalchemy.orm import Session
-from app.core.database import get_db
+from app.api.deps import get_db
 import logging
 
 router = APIRouter()
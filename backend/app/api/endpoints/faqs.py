@@ -0,0 +1,38 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_read_db
+from app.services.faq_search import SEARCH_MODES, get_faq_index
+
+router = APIRouter()
+
+
+@router.get("/faqs/search")
+def faqs_search(
+    q: str = Query(default="", description="검색어"),
+    category: Optional[str] = Query(default=None, description="카테고리"),
+    vehicle_type: Optional[str] = Query(default=None, description="차종 (승용/승합/화물/이륜)"),
+    usage: Optional[str] = Query(default=None, description="용도 (자가용/영업용)"),
+    page: int = Query(default=1, ge=1, description="페이지 (1부터)"),
+    size: int = Query(default=10, ge=1, le=50, description="페이지 크기"),
+    mode: str = Query(default="exact", description="exact | fuzzy (오타 교정 + 초성 검색)"),
+    db: Session = Depends(get_read_db),
+):
+    """
+    FAQ 검색 (BM25 랭킹)
+
+    - 역색인은 앱 시작 시 만들어 두고, faq_table이 바뀌었을 때만 다시 만든다.
+    - highlights: question/answer 안에서 검색어가 나타나는 [start, end) 구간
+    - 차종/용도 태그가 없는 FAQ는 공통 FAQ로 보고 항상 포함한다.
+    - mode=fuzzy: "ㅂㅈㄱ" 같은 초성 검색, "보조굼" 같은 오타를 사전 단어로 교정해서 함께 검색
+      (expansions: 검색어 -> 실제로 검색에 쓴 단어 목록)
+    """
+    if mode not in SEARCH_MODES:
+        raise HTTPException(status_code=400, detail=f"mode must be one of {', '.join(SEARCH_MODES)}")
+    try:
+        index = get_faq_index(db)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"/faqs/search DB error: {e}")
+    return index.search(q, category, vehicle_type, usage, page, size, mode)
@@ -0,0 +1,69 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_read_db
+from app.core.serialization import not_modified, quote_etag
+from app.services.heatmap_service import get_heatmap
+
+router = APIRouter()
+
+
+def _load(db, layer, year, car_type, usage, station_type, bins, sigma) -> dict:
+    try:
+        return get_heatmap(db, layer, year, car_type, usage, station_type, bins, sigma)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"/heatmaps DB error: {e}")
+
+
+def _respond(request: Request, result: dict, body: bytes, media_type: str) -> Response:
+    """캐시 키(필터 + 데이터 버전)를 ETag로, If-None-Match가 맞으면 304"""
+    headers = {"ETag": quote_etag(result["key"]), "Cache-Control": "public, max-age=600"}
+    cached = not_modified(request, headers["ETag"], headers)
+    if cached is not None:
+        return cached
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+@router.get("/heatmaps/{layer}.png")
+def heatmap_png(
+    request: Request,
+    layer: str,
+    year: Optional[int] = Query(default=None, description="조회 연도 (없으면 최신)"),
+    car_type: Optional[str] = Query(default=None, description="차종 (예: EV)"),
+    usage: Optional[str] = Query(default=None, description="용도 (예: PRIVATE)"),
+    station_type: Optional[str] = Query(default=None, description="충전소 타입 (stations 레이어)"),
+    bins: int = Query(default=160, ge=20, le=400, description="세로 격자 칸 수"),
+    sigma: Optional[float] = Query(default=None, gt=0, le=30, description="평활화 폭 (격자 칸 단위)"),
+    db: Session = Depends(get_read_db),
+):
+    """
+    격자 밀도 히트맵 PNG
+
+    - layer: stations | registrations | pollution
+    - 필터 + 데이터 버전별로 캐시된 이미지를 그대로 내려준다.
+    """
+    result = _load(db, layer, year, car_type, usage, station_type, bins, sigma)
+    return _respond(request, result, result["png"], "image/png")
+
+
+@router.get("/heatmaps/{layer}.npy")
+def heatmap_grid(
+    request: Request,
+    layer: str,
+    year: Optional[int] = Query(default=None, description="조회 연도 (없으면 최신)"),
+    car_type: Optional[str] = Query(default=None, description="차종 (예: EV)"),
+    usage: Optional[str] = Query(default=None, description="용도 (예: PRIVATE)"),
+    station_type: Optional[str] = Query(default=None, description="충전소 타입 (stations 레이어)"),
+    bins: int = Query(default=160, ge=20, le=400, description="세로 격자 칸 수"),
+    sigma: Optional[float] = Query(default=None, gt=0, le=30, description="평활화 폭 (격자 칸 단위)"),
+    db: Session = Depends(get_read_db),
+):
+    """
+    히트맵의 원본 격자 값 (NumPy .npy, float32, 행 0 = 남쪽)
+    """
+    result = _load(db, layer, year, car_type, usage, station_type, bins, sigma)
+    return _respond(request, result, result["npy"], "application/octet-stream")
@@ -0,0 +1,41 @@
+from fastapi import APIRouter
+
+from app.core.admission import controller
+from app.core.singleflight import get_singleflight_metrics
+from app.services.availability_service import get_availability_status
+
+router = APIRouter()
+
+
+@router.get("/metrics/coalescing")
+def coalescing_metrics():
+    """
+    요청 병합(single-flight) 지표 - 워커(프로세스) 단위, 기동 후 누적
+
+    - calls: 리포지토리 호출 수 / executions: 실제로 DB에 나간 수
+    - coalesced: 다른 요청의 진행 중 쿼리 결과를 받아 간 수 (calls = executions + coalesced)
+    - max_waiters: 쿼리 하나에 동시에 붙은 최대 요청 수, in_flight: 지금 진행 중인 키 수
+    """
+    return {"groups": get_singleflight_metrics()}
+
+
+@router.get("/metrics/admission")
+def admission_metrics():
+    """
+    동시성 제한 지표 - 파티션별 (워커 단위, 최근 1024건 기준 분위수)
+
+    - queue_wait_ms: 차례를 기다린 시간 / exec_ms: 실제 처리 시간 (둘을 따로 봐야 어디가 막히는지 보임)
+    - rejected: 대기열이 꽉 차서 503, timed_out: 대기 시간 초과로 503
+    """
+    return controller.metrics()
+
+
+@router.get("/metrics/availability")
+def availability_metrics():
+    """
+    충전기 상태 폴러/저장소/구독자 지표 (워커 단위)
+
+    - poller: 소스, 폴링 횟수/실패, 마지막 변경분 개수 / chargers, stations: 저장소에 있는 충전기/충전소 수
+    - seq: 마지막 변경분 순번, subscribers: 열려 있는 SSE 연결 수
+    """
+    return get_availability_status()
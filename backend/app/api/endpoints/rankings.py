@@ -0,0 +1,35 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_read_db
+from app.services.ranking_service import get_rankings
+
+router = APIRouter()
+
+
+@router.get("/stats/rankings")
+def stats_rankings(
+    metric: Optional[str] = Query(default=None, description="yoy_growth,mom_growth,ev_share,h2_share 중 일부 (쉼표 구분, 없으면 전체)"),
+    year: Optional[int] = Query(default=None, description="기준 연도 (없으면 최신, 월 지표는 그 해 마지막 월)"),
+    car_type: Optional[str] = Query(default=None, description="성장률 계산 차종 (예: EV, 점유율에는 미적용)"),
+    usage: Optional[str] = Query(default=None, description="용도 (예: PRIVATE)"),
+    limit: int = Query(default=5, ge=1, le=50, description="지표별 상위 N개 (동순위 포함)"),
+    db: Session = Depends(get_read_db),
+):
+    """
+    지역 순위 (전년/전월 대비 성장률, EV/H2 점유율)
+
+    - 지표와 순위는 DB 윈도 함수(LAG / RANK)로 계산하고 데이터 버전별로 캐시한다.
+    - rankings: {metric: [{"rank", "region": {"code", "name"}, "value", ...}, ...]}
+      성장률은 current/previous, 점유율은 count/total 을 함께 내려준다.
+    - 연 지표(yoy_growth, 점유율)는 1월~기준 월 누계, 전년 대비도 전년 같은 기간과 비교한다.
+    """
+    metrics = [m.strip() for m in metric.split(",") if m.strip()] if metric else None
+    try:
+        return get_rankings(db, metrics, year, car_type, usage, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"/stats/rankings DB error: {e}")
@@ -0,0 +1,24 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from app.core.database import get_replica_pool
+from app.services.hot_datasets import get_shared_cache_status
+from app.services.warmup_service import get_readiness
+
+router = APIRouter()
+
+
+@router.get("/ready")
+def ready():
+    """
+    준비 상태 (로드밸런서/롤링 배포용)
+
+    - 200: 커넥션 풀과 캐시 워밍업 완료
+    - 503: 워밍업 중이거나 DB 연결 실패 (steps에 단계별 소요 시간/오류)
+    - shared_cache: 워커 간 공유 메모리 캐시 상태 (현재 붙어 있는 버전/세그먼트)
+    - replicas: 읽기 레플리카별 상태 (정상 레플리카가 없어도 조회는 primary로 가므로 ready 판단에는 넣지 않음)
+    """
+    state = get_readiness()
+    state["replicas"] = get_replica_pool().status()
+    state["shared_cache"] = get_shared_cache_status()
+    return JSONResponse(status_code=200 if state["status"] == "ready" else 503, content=state)
@@ -0,0 +1,37 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_read_db
+from app.core.serialization import negotiate
+from app.services.dashboard_service import get_region_summary
+
+router = APIRouter()
+
+
+@router.get("/stats/region-summary")
+def stats_region_summary(
+    request: Request,
+    year: Optional[int] = Query(default=None, description="조회 연도 (없으면 테이블별 최신)"),
+    car_type: Optional[str] = Query(default=None, description="차종 (예: EV, 등록대수에만 적용)"),
+    usage: Optional[str] = Query(default=None, description="용도 (예: PRIVATE, 등록대수에만 적용)"),
+    db: Session = Depends(get_read_db),
+):
+    """
+    시/도별 등록대수 합계 + 대기오염도 (지역마다 한 줄)
+
+    - 월별 원본 행을 내려받아 화면에서 합치지 않도록 집계/조인은 DB에서 한다.
+    - reg_year / pollution_year: 실제로 사용한 연도 (year가 없으면 각 테이블의 최신 연도)
+    - regions: [{"code", "name", "reg_total", "pollution_degree"}, ...] (데이터가 없으면 None)
+    """
+    try:
+        summary = get_region_summary(db, year, car_type, usage)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"/stats/region-summary DB error: {e}")
+
+    return negotiate(
+        request,
+        {"filters": {"year": year, "car_type": car_type, "usage": usage}, **summary},
+        headers={"Cache-Control": "public, max-age=60"},
+    )
@@ -0,0 +1,35 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_read_db
+from app.core.serialization import negotiate
+from app.services.station_cluster_service import get_station_clusters
+
+router = APIRouter()
+
+
+@router.get("/stations/clusters")
+def stations_clusters(
+    request: Request,
+    bbox: Optional[str] = Query(default=None, description="min_lng,min_lat,max_lng,max_lat (없으면 남한 전체)"),
+    zoom: int = Query(default=7, ge=0, le=22, description="지도 줌 레벨"),
+    station_type: Optional[str] = Query(default=None, description="충전소 종류 (예: EV, H2)"),
+    db: Session = Depends(get_read_db),
+):
+    """
+    지도용 충전소 클러스터
+
+    - 데이터 버전별로 미리 만든 계층 격자에서 bbox 안의 칸만 골라 개수/중심점을 내려준다.
+    - 한 개뿐인 칸과 충분히 확대한 줌에서는 개별 충전소(points, 이름/주소 포함)
+    - clusters + points 는 서버 설정(STATION_CLUSTER_MAX_FEATURES) 개수를 넘지 않는다.
+    """
+    try:
+        result = get_station_clusters(db, bbox, zoom, station_type)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"/stations/clusters DB error: {e}")
+
+    return negotiate(request, result)
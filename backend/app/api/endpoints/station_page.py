@@ -0,0 +1,38 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_read_db
+from app.core.serialization import negotiate
+from app.services.station_page_service import MAX_PAGE_SIZE, get_station_page
+
+router = APIRouter()
+
+
+@router.get("/stations/page")
+def stations_page(
+    request: Request,
+    station_type: Optional[str] = Query(default=None, description="충전소 종류 (예: EV, H2)"),
+    q: Optional[str] = Query(default=None, description="충전소 이름 검색어"),
+    lat: Optional[float] = Query(default=None, ge=-90, le=90, description="기준 위도 (lng와 함께, 있으면 가까운 순)"),
+    lng: Optional[float] = Query(default=None, ge=-180, le=180, description="기준 경도"),
+    cursor: Optional[str] = Query(default=None, description="이전 응답의 next_cursor"),
+    limit: int = Query(default=50, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_read_db),
+):
+    """
+    충전소 목록 커서 페이지 (화면 목록의 무한 스크롤용)
+
+    - 위치가 없으면 최근 등록 순, lat/lng가 있으면 가까운 순 (distance_m 포함)
+    - next_cursor를 그대로 다음 요청의 cursor로 넘기면 이어서 (null이면 끝)
+    - 목록 iframe(Streamlit 컴포넌트)에서 fetch로 직접 부르므로 CORS 허용
+    """
+    try:
+        result = get_station_page(db, station_type, q, lat, lng, cursor, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"/stations/page DB error: {e}")
+
+    return negotiate(request, result, headers={"Access-Control-Allow-Origin": "*"})
@@ -0,0 +1,66 @@
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+
+from app.services.subsidy_service import SubsidyNotFound, SubsidyRuleError, get_subsidy_table
+
+router = APIRouter()
+
+
+def _table():
+    try:
+        return get_subsidy_table()
+    except SubsidyRuleError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+
+@router.get("/subsidies/calc")
+def subsidies_calc(
+    year: int = Query(..., description="구매 연도"),
+    sido_code: str = Query(..., description="시/도 코드 (예: 11)"),
+    model_code: str = Query(..., description="모델 코드 (/subsidies/models)"),
+    car_type: Optional[str] = Query(default=None, description="차종 (EV/H2, 모델과 다르면 400)"),
+    sigungu_code: Optional[str] = Query(default=None, description="시/군/구 코드 (규칙이 없으면 시/도 기준)"),
+    buyer_type: str = Query(default="general", description="general | low_income | youth_first | business"),
+):
+    """
+    보조금 계산 (SubsidyCalcDTO, 만원 단위)
+
+    - rule_year: 실제로 적용한 규칙 연도 (해당 연도 규칙이 없으면 직전 연도 규칙)
+    """
+    table = _table()
+    try:
+        return table.calc(year, sido_code, model_code, car_type, sigungu_code, buyer_type)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except SubsidyNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.get("/subsidies/calc/batch")
+def subsidies_calc_batch(
+    year: int = Query(..., description="구매 연도"),
+    car_type: Optional[str] = Query(default=None, description="차종 (EV/H2)"),
+    buyer_type: str = Query(default="general", description="general | low_income | youth_first | business"),
+    sido_code: Optional[list[str]] = Query(default=None, description="시/도 코드 (여러 개, 없으면 전체)"),
+    model_code: Optional[list[str]] = Query(default=None, description="모델 코드 (여러 개, 없으면 차종 전체)"),
+):
+    """
+    모델 x 지역 보조금 비교표
+
+    - subsidy_national / subsidy_local / subsidy_total: [지역][모델] 행렬 (규칙이 없으면 null)
+    - 지역에는 시/도 기본값과, 규칙표에 따로 있는 시/군구가 함께 들어간다.
+    """
+    table = _table()
+    try:
+        return table.compare(year, car_type, buyer_type, sido_code, model_code)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except SubsidyNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.get("/subsidies/models")
+def subsidies_models(car_type: Optional[str] = Query(default=None, description="차종 (EV/H2)")):
+    table = _table()
+    return [m for m in table.models if not car_type or m["car_type"] == car_type]
@@ -0,0 +1,69 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_read_db
+from app.core.serialization import not_modified, quote_etag
+from app.services.tile_service import TileGeometryNotFound, get_tile, tile_version
+
+router = APIRouter()
+
+MVT_MEDIA_TYPE = "application/vnd.mapbox-vector-tile"
+
+
+@router.get("/tiles/status")
+def tiles_status(db: Session = Depends(get_read_db)):
+    """
+    시/군/구 벡터 타일을 쓸 수 있는지 (경계 GeoJSON이 준비됐는지) + 현재 타일 버전
+
+    - available=false 면 타일 요청은 503 -> 화면에서 시/군/구 토글을 숨긴다.
+    - version: 타일 URL에 ?v= 로 붙일 값 (통계/경계가 바뀌면 달라짐)
+    """
+    try:
+        version = tile_version(db)
+    except TileGeometryNotFound:
+        return {"available": False, "version": None}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"/tiles/status DB error: {e}")
+    return {"available": True, "version": version}
+
+
+@router.get("/tiles/{z}/{x}/{y}.mvt")
+def vector_tile(
+    request: Request,
+    z: int,
+    x: int,
+    y: int,
+    year: Optional[int] = Query(default=None, description="지표 기준 연도 (없으면 최신)"),
+    v: Optional[str] = Query(default=None, description="타일 버전 (/tiles/status 의 version)"),
+    db: Session = Depends(get_read_db),
+):
+    """
+    시/군/구 경계 벡터 타일 (MVT)
+
+    - 레이어명: sigungu
+    - 속성: code, name, sido_code, reg_total, pollution_degree
+    - 줌 레벨별로 단순화/클리핑되며, 메모리+디스크에 타일 단위로 캐시된다.
+    - v가 현재 버전이면 오래 캐시해도 됨 (버전이 바뀌면 URL이 바뀜),
+      없거나 옛 버전이면 no-cache + ETag로 매번 재검증
+    """
+    try:
+        data, version = get_tile(db, z, x, y, year)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except TileGeometryNotFound as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"/tiles DB error: {e}")
+
+    headers = {
+        "ETag": quote_etag(version),
+        "Cache-Control": "public, max-age=86400, immutable" if v == version else "no-cache",
+        # 지도 iframe(Streamlit)에서 직접 타일을 가져가므로 CORS 허용
+        "Access-Control-Allow-Origin": "*",
+    }
+    cached = not_modified(request, headers["ETag"], headers)
+    if cached is not None:
+        return cached
+    return Response(content=data, media_type=MVT_MEDIA_TYPE, headers=headers)
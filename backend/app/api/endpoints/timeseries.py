@@ -0,0 +1,34 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_read_db
+from app.services.timeseries_service import get_timeseries
+
+router = APIRouter()
+
+
+@router.get("/stats/timeseries")
+def stats_timeseries(
+    granularity: str = Query(default="month", description="month | quarter | year"),
+    sido_code: Optional[str] = Query(default=None, description="시/도 코드 (없으면 전체 지역)"),
+    car_type: Optional[str] = Query(default=None, description="차종 (예: EV)"),
+    usage: Optional[str] = Query(default=None, description="용도 (예: PRIVATE)"),
+    normalize: bool = Query(default=False, description="0~100 min-max 정규화 값 추가"),
+    max_points: int = Query(default=300, ge=3, le=5000, description="지역별 최대 점 개수 (LTTB)"),
+    db: Session = Depends(get_read_db),
+):
+    """
+    지역별 등록대수/대기오염도 시계열
+
+    - 기간 단위 집계는 DB에서 수행
+    - 점이 max_points보다 많으면 LTTB로 다운샘플링
+    - normalize=true면 registration_norm / pollution_norm (0~100) 필드를 함께 내려준다.
+    """
+    try:
+        return get_timeseries(db, granularity, sido_code, car_type, usage, normalize, max_points)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"/stats/timeseries DB error: {e}")
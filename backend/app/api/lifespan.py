@@ -0,0 +1,44 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+
+from app.core.config import WARMUP_ENABLED
+from app.core.database import dispose_engine, get_engine
+from app.services.availability_service import start_availability
+from app.services.hot_datasets import detach_shared_cache
+from app.services.warmup_service import mark_ready, warm_up
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    앱 기동/종료
+    - 기동: 엔진 생성 후 워밍업(커넥션 풀 채우기 + 캐시 미리 로드)을 백그라운드로 실행
+      서버는 바로 요청을 받고 /health는 200, /ready는 워밍업이 끝나야 200
+    - 기동: 충전기 상태 폴러 시작 (AVAILABILITY_SOURCE가 off가 아닐 때)
+    - 종료: 폴러 중지, 커넥션 풀 정리, 공유 메모리 캐시 분리 (세그먼트는 다른 워커가 쓰고 있을 수 있어 지우지 않음)
+    """
+    get_engine()
+    task = None
+    if WARMUP_ENABLED:
+        task = asyncio.create_task(asyncio.to_thread(warm_up))
+    else:
+        mark_ready()
+    poller = start_availability()
+
+    yield
+
+    if poller is not None:
+        poller.cancel()
+        await asyncio.gather(poller, return_exceptions=True)
+
+    if task is not None and not task.done():
+        # 워밍업 스레드는 중간에 멈출 수 없으므로 끝날 때까지 기다린 뒤 풀을 닫는다
+        logger.info("waiting for warmup to finish before shutdown")
+        await asyncio.gather(task, return_exceptions=True)
+    dispose_engine()
+    detach_shared_cache()
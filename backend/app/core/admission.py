@@ -0,0 +1,276 @@
+import asyncio
+import json
+import logging
+import math
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from app.core.config import ADMISSION_ENABLED, ADMISSION_LIMITS, ADMISSION_QUEUE_TIMEOUT_SEC, DB_POOL_CAPACITY
+
+# -------------------------
+# 동시성 제한 (admission control) - ASGI 미들웨어
+# - 경로를 파티션(heavy/tiles/default)에 매핑하고, 파티션마다 동시 실행 수 + 대기열 길이를 따로 둔다.
+#   -> 무거운 집계가 몰려도 자기 파티션 안에서만 기다리고 /regions 같은 가벼운 요청은 영향 없음
+# - 대기열이 꽉 찼거나 ADMISSION_QUEUE_TIMEOUT_SEC 안에 차례가 안 오면 503 + Retry-After
+# - 대기 시간(queue)과 실행 시간(app)을 따로 기록 (Server-Timing 헤더, /metrics/admission)
+# - 헬스 체크/지표 경로와 오래 열려 있는 스트림(SSE)은 제한하지 않음
+#   (스트림이 슬롯을 계속 차지하거나 실행 시간 분위수를 왜곡하지 않도록)
+# - 파티션 동시 실행 합은 커넥션 풀 크기(DB_POOL_CAPACITY) 이하로 맞춤 -> 슬롯을 받은 요청은 풀에서 다시 기다리지 않음
+# -------------------------
+logger = logging.getLogger(__name__)
+
+STREAM_PATHS = ("/stations/availability/stream",)
+EXEMPT_PATHS = ("/health", "/ready", "/metrics/", "/docs", "/openapi.json") + STREAM_PATHS
+
+# (경로 접두어, 파티션) - 위에서부터 먼저 맞는 것
+ROUTE_PARTITIONS = (
+    ("/stats/registrations", "heavy"),
+    ("/stats/timeseries", "heavy"),
+    ("/stats/rankings", "heavy"),
+    ("/analysis/", "heavy"),
+    ("/heatmaps/", "heavy"),
+    ("/stations/clusters", "tiles"),  # 메모리 인덱스 조회, 지도 이동마다 들어옴
+    ("/stations/availability", "default"),  # 메모리 상태 스냅샷
+    ("/stations/page", "default"),  # 목록 스크롤마다 들어오는 작은 커서 페이지 (LIMIT 200 이하)
+    ("/stations", "heavy"),
+    ("/tiles/", "tiles"),
+)
+DEFAULT_PARTITION = "default"
+
+_SAMPLES = 1024
+_RETRY_AFTER_MAX_SEC = 30
+
+
+class AdmissionRejected(Exception):
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+def _percentile(values: list[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    values = sorted(values)
+    return round(values[min(len(values) - 1, int(q * len(values)))], 1)
+
+
+def _summary(values: list[float]) -> dict:
+    return {"p50": _percentile(values, 0.5), "p95": _percentile(values, 0.95), "max": _percentile(values, 1.0)}
+
+
+class _Waiter:
+    __slots__ = ("fut", "granted")
+
+    def __init__(self, fut: asyncio.Future):
+        self.fut = fut
+        self.granted = False
+
+
+def _wake(fut: asyncio.Future) -> None:
+    if not fut.done():
+        fut.set_result(None)
+
+
+class Partition:
+    """
+    동시 실행 limit개 + 대기 queue개
+    - 카운터/대기열은 잠금으로 보호 (워커가 이벤트 루프를 여러 개 쓰는 경우까지 대비해 깨우기는 call_soon_threadsafe)
+    - 실행이 끝나면 슬롯을 대기열 맨 앞 요청에 바로 넘김 (FIFO)
+    """
+
+    def __init__(self, name: str, limit: int, queue: int):
+        self.name = name
+        self.limit = limit
+        self.queue = queue
+        self.active = 0
+        self._waiters: deque[_Waiter] = deque()
+        self._lock = threading.Lock()
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self._wait_ms: deque[float] = deque(maxlen=_SAMPLES)
+        self._exec_ms: deque[float] = deque(maxlen=_SAMPLES)
+
+    def retry_after(self) -> int:
+        """최근 실행 시간 중앙값 x 앞에 선 요청 수 / 동시 실행 수 (초, 1~30)"""
+        median = _percentile(list(self._exec_ms), 0.5) or 1000.0
+        est = median / 1000.0 * (len(self._waiters) + 1) / self.limit
+        return max(1, min(_RETRY_AFTER_MAX_SEC, math.ceil(est)))
+
+    async def acquire(self, timeout: float) -> None:
+        with self._lock:
+            if self.active < self.limit and not self._waiters:
+                self.active += 1
+                self.admitted += 1
+                return
+            if len(self._waiters) >= self.queue:
+                self.rejected += 1
+                full = True
+            else:
+                full = False
+                waiter = _Waiter(asyncio.get_running_loop().create_future())
+                self._waiters.append(waiter)
+        if full:
+            raise AdmissionRejected("queue full", self.retry_after())
+
+        try:
+            await asyncio.wait_for(waiter.fut, timeout)
+        except BaseException as e:
+            with self._lock:
+                granted = waiter.granted
+                if not granted:
+                    self._waiters.remove(waiter)
+                elif isinstance(e, asyncio.TimeoutError):
+                    # 슬롯을 넘겨받은 순간 타임아웃이 겹침 -> 그냥 실행
+                    self.admitted += 1
+                    return
+            if granted:
+                # 슬롯을 넘겨받은 뒤 취소(클라이언트 끊김 등) -> 다음 요청에 돌려줌
+                self.release()
+            if isinstance(e, asyncio.TimeoutError):
+                with self._lock:
+                    self.timed_out += 1
+                raise AdmissionRejected("queue timeout", self.retry_after()) from None
+            raise
+        with self._lock:
+            self.admitted += 1
+
+    def release(self) -> None:
+        with self._lock:
+            if not self._waiters:
+                self.active -= 1
+                return
+            # active 수는 그대로 두고 슬롯을 맨 앞 대기 요청에 넘김
+            waiter = self._waiters.popleft()
+            waiter.granted = True
+        waiter.fut.get_loop().call_soon_threadsafe(_wake, waiter.fut)
+
+    def record(self, wait_ms: float, exec_ms: float) -> None:
+        self._wait_ms.append(wait_ms)
+        self._exec_ms.append(exec_ms)
+
+    def metrics(self) -> dict:
+        wait, execution = list(self._wait_ms), list(self._exec_ms)
+        with self._lock:
+            active, queued = self.active, len(self._waiters)
+        return {
+            "limit": self.limit,
+            "queue": self.queue,
+            "active": active,
+            "queued": queued,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "queue_wait_ms": _summary(wait),
+            "exec_ms": _summary(execution),
+            "samples": len(execution),
+        }
+
+
+def parse_limits(spec: str, capacity: Optional[int] = None) -> dict[str, Partition]:
+    """
+    "heavy=4:32,default=32:128" -> {이름: Partition(limit, queue)}
+    - capacity(커넥션 풀 크기)가 있으면 동시 실행 합이 그 이하가 되도록 비율대로 줄임 (파티션마다 최소 1)
+    """
+    limits: dict[str, tuple[int, int]] = {}
+    for part in spec.split(","):
+        if not part.strip():
+            continue
+        name, _, value = part.partition("=")
+        limit, _, queue = value.partition(":")
+        limits[name.strip()] = (max(1, int(limit)), max(0, int(queue or 0)))
+    limits.setdefault(DEFAULT_PARTITION, (32, 128))
+
+    total = sum(limit for limit, _ in limits.values())
+    if capacity is not None and total > capacity:
+        scaled = {name: (max(1, limit * capacity // total), queue) for name, (limit, queue) in limits.items()}
+        logger.warning(
+            "admission limits %s exceed DB pool capacity %d, scaled to %s",
+            {name: limit for name, (limit, _) in limits.items()},
+            capacity,
+            {name: limit for name, (limit, _) in scaled.items()},
+        )
+        limits = scaled
+    return {name: Partition(name, limit, queue) for name, (limit, queue) in limits.items()}
+
+
+class AdmissionController:
+    def __init__(self, partitions: dict[str, Partition], queue_timeout: float):
+        self.partitions = partitions
+        self.queue_timeout = queue_timeout
+
+    def partition_for(self, path: str) -> Optional[Partition]:
+        if path.startswith(EXEMPT_PATHS):
+            return None
+        for prefix, name in ROUTE_PARTITIONS:
+            if path.startswith(prefix) and name in self.partitions:
+                return self.partitions[name]
+        return self.partitions[DEFAULT_PARTITION]
+
+    def metrics(self) -> dict:
+        return {
+            "enabled": ADMISSION_ENABLED,
+            "queue_timeout_sec": self.queue_timeout,
+            "partitions": {name: p.metrics() for name, p in self.partitions.items()},
+        }
+
+
+controller = AdmissionController(parse_limits(ADMISSION_LIMITS, DB_POOL_CAPACITY), ADMISSION_QUEUE_TIMEOUT_SEC)
+
+
+class AdmissionControlMiddleware:
+    def __init__(self, app, controller: AdmissionController = controller):
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not ADMISSION_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        partition = self.controller.partition_for(scope["path"])
+        if partition is None:
+            await self.app(scope, receive, send)
+            return
+
+        queued_at = time.perf_counter()
+        try:
+            await partition.acquire(self.controller.queue_timeout)
+        except AdmissionRejected as e:
+            await self._reject(send, partition, e)
+            return
+
+        started = time.perf_counter()
+        wait_ms = (started - queued_at) * 1000
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                timing = f"queue;dur={wait_ms:.1f}, app;dur={(time.perf_counter() - started) * 1000:.1f}"
+                message = {**message, "headers": [*message.get("headers", []), (b"server-timing", timing.encode())]}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            partition.release()
+            partition.record(wait_ms, (time.perf_counter() - started) * 1000)
+
+    @staticmethod
+    async def _reject(send, partition: Partition, error: AdmissionRejected) -> None:
+        body = json.dumps({
+            "detail": f"server busy ({partition.name}: {error.reason})",
+            "retry_after": error.retry_after,
+        }).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(error.retry_after).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,148 @@
+import os
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+# backend/.env 로드 (database.py와 같은 파일)
+BASE_DIR = Path(__file__).resolve().parents[2]
+load_dotenv(BASE_DIR / ".env", override=True)
+
+# -------------------------
+# 캐시
+# - CACHE_DIR: 디스크 캐시 루트 (타일/래스터 등)
+# - DATA_VERSION_TTL_SEC: 데이터 버전(원천 테이블 변경 감지) 재확인 주기
+# -------------------------
+CACHE_DIR = Path(os.getenv("CACHE_DIR", str(BASE_DIR / ".cache")))
+DATA_VERSION_TTL_SEC = int(os.getenv("DATA_VERSION_TTL_SEC", "60"))
+
+# -------------------------
+# 시/군/구 벡터 타일
+# -------------------------
+SIGUNGU_GEOJSON_PATH = Path(
+    os.getenv("SIGUNGU_GEOJSON_PATH", str(BASE_DIR / "data" / "korea_sigungu.geojson"))
+)
+TILE_MAX_ZOOM = int(os.getenv("TILE_MAX_ZOOM", "14"))
+TILE_MEMORY_CACHE_SIZE = int(os.getenv("TILE_MEMORY_CACHE_SIZE", "2048"))
+
+# -------------------------
+# 충전소 지도 클러스터 (/stations/clusters)
+# - STATION_CLUSTER_MAX_ZOOM: 이 줌까지는 격자 클러스터, 더 확대하면 개별 충전소
+# - STATION_CLUSTER_CELL_PX: 클러스터 격자 한 칸 크기(256px 타일 기준, 2의 거듭제곱)
+# - STATION_CLUSTER_MAX_FEATURES: 응답 하나에 담는 최대 클러스터+점 개수 (넘으면 한 단계 낮은 줌 격자로)
+# -------------------------
+STATION_CLUSTER_MAX_ZOOM = int(os.getenv("STATION_CLUSTER_MAX_ZOOM", "16"))
+STATION_CLUSTER_CELL_PX = int(os.getenv("STATION_CLUSTER_CELL_PX", "64"))
+STATION_CLUSTER_MAX_FEATURES = int(os.getenv("STATION_CLUSTER_MAX_FEATURES", "300"))
+
+# -------------------------
+# FAQ 검색 인덱스
+# - FAQ_INDEX_CHECK_SEC: 이 주기마다 faq_table 변경 여부(행 수/최대 id/내용 체크섬)를 확인해서 필요할 때만 재색인
+# -------------------------
+FAQ_INDEX_CHECK_SEC = int(os.getenv("FAQ_INDEX_CHECK_SEC", "300"))
+
+# -------------------------
+# 보조금 규칙표 (환경부 무공해차 통합누리집 기준)
+# - models.csv: 차종(모델) 목록, rules.csv: 국비/지방비 규칙 ("*"는 전체)
+# -------------------------
+SUBSIDY_RULES_DIR = Path(os.getenv("SUBSIDY_RULES_DIR", str(BASE_DIR / "data" / "subsidy")))
+
+# -------------------------
+# DB 접속 / 커넥션 풀
+# - DB_POOL_PREFILL: 기동 시 미리 열어 둘 커넥션 수 (DB_POOL_SIZE 이하)
+# -------------------------
+DB_HOST = os.getenv("DB_HOST")
+DB_PORT = os.getenv("DB_PORT", "3306")
+DB_NAME = os.getenv("DB_NAME")
+DB_USER = os.getenv("DB_USER")
+DB_PASSWORD = os.getenv("DB_PASSWORD")
+
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_RECYCLE_SEC = int(os.getenv("DB_POOL_RECYCLE_SEC", "3600"))
+DB_POOL_PREFILL = int(os.getenv("DB_POOL_PREFILL", "5"))
+
+# -------------------------
+# 기동 워밍업 (커넥션 풀 채우기 + 차원/집계 캐시 미리 로드, 끝나면 /ready 200)
+# -------------------------
+WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "1") == "1"
+
+# -------------------------
+# 응답 직렬화 / 압축
+# - COMPRESS_MIN_BYTES 보다 작은 응답은 압축하지 않음 (압축 비용 > 절약되는 전송량)
+# -------------------------
+COMPRESS_MIN_BYTES = int(os.getenv("COMPRESS_MIN_BYTES", "1024"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "5"))
+
+# -------------------------
+# 읽기 전용 레플리카 (없으면 모든 조회가 primary로)
+# - DB_REPLICA_URLS: SQLAlchemy URL을 콤마로 구분 (예: mysql+pymysql://ro:pw@replica1:3306/db,...)
+# - DB_REPLICA_MAX_LAG_SEC: 복제 지연이 이보다 크면 해당 레플리카는 제외
+# - DB_REPLICA_LAG_SQL: 지연(초)을 돌려주는 쿼리 (heartbeat 테이블 등, 비우면 SHOW REPLICA STATUS)
+# - DB_REPLICA_CHECK_INTERVAL_SEC: 헬스 체크(연결 + 지연) 결과를 재사용하는 시간
+# -------------------------
+DB_REPLICA_URLS = [u.strip() for u in os.getenv("DB_REPLICA_URLS", "").split(",") if u.strip()]
+DB_REPLICA_MAX_LAG_SEC = float(os.getenv("DB_REPLICA_MAX_LAG_SEC", "5"))
+DB_REPLICA_LAG_SQL = os.getenv("DB_REPLICA_LAG_SQL", "")
+DB_REPLICA_CHECK_INTERVAL_SEC = float(os.getenv("DB_REPLICA_CHECK_INTERVAL_SEC", "10"))
+DB_REPLICA_POOL_SIZE = int(os.getenv("DB_REPLICA_POOL_SIZE", str(DB_POOL_SIZE)))
+
+# -------------------------
+# 워커 간 공유 메모리 캐시 (multiprocessing.shared_memory)
+# - 여러 워커로 띄울 때 지역 차원/연도별 집계/충전소 좌표 배열을 한 번만 만들어 공유
+# - SHARED_CACHE_DIR: 매니페스트(현재 세그먼트 이름/배열 배치)와 잠금 파일 위치 (워커들이 같은 경로를 봐야 함)
+# -------------------------
+SHARED_CACHE_ENABLED = os.getenv("SHARED_CACHE_ENABLED", "0") == "1"
+SHARED_CACHE_DIR = Path(os.getenv("SHARED_CACHE_DIR", str(CACHE_DIR / "shm")))
+SHARED_CACHE_PREFIX = os.getenv("SHARED_CACHE_PREFIX", "vai")
+
+# -------------------------
+# 동시성 제한 (admission control)
+# - 파티션별 "동시 실행 수:대기열 길이". 대기열까지 차면 바로 503 + Retry-After
+# - heavy: 무거운 집계/대량 조회, tiles: 지도 타일, default: 나머지 (라우트 매핑은 app.core.admission)
+# - 기본값은 커넥션 풀(DB_POOL_SIZE + DB_MAX_OVERFLOW)에서 나눠 잡음: heavy 풀의 절반, tiles 1/4, default 나머지
+#   (동시 실행 합이 풀보다 크면 슬롯을 받은 요청이 풀에서 다시 기다리게 되므로, 직접 지정한 값도 기동 시 풀 크기에 맞게 줄임)
+# -------------------------
+DB_POOL_CAPACITY = DB_POOL_SIZE + DB_MAX_OVERFLOW
+_ADMISSION_HEAVY = max(1, DB_POOL_SIZE // 2)
+_ADMISSION_TILES = max(1, DB_POOL_CAPACITY // 4)
+_ADMISSION_DEFAULT = max(1, DB_POOL_CAPACITY - _ADMISSION_HEAVY - _ADMISSION_TILES)
+
+ADMISSION_ENABLED = os.getenv("ADMISSION_ENABLED", "1") == "1"
+ADMISSION_LIMITS = os.getenv(
+    "ADMISSION_LIMITS",
+    f"heavy={_ADMISSION_HEAVY}:32,tiles={_ADMISSION_TILES}:128,default={_ADMISSION_DEFAULT}:128",
+)
+ADMISSION_QUEUE_TIMEOUT_SEC = float(os.getenv("ADMISSION_QUEUE_TIMEOUT_SEC", "10"))
+
+# -------------------------
+# 쿼리 실행 시간 제한 / 끊긴 요청의 쿼리 취소
+# - 파티션(app.core.admission의 heavy/tiles/default)별 SELECT 실행 예산(ms), MySQL MAX_EXECUTION_TIME 힌트로 적용
+# - QUERY_CANCEL_ON_DISCONNECT=1 이면 클라이언트가 끊겼을 때 진행 중인 쿼리를 KILL QUERY
+# -------------------------
+QUERY_BUDGETS_MS = os.getenv("QUERY_BUDGETS_MS", "heavy=30000,tiles=5000,default=5000")
+QUERY_CANCEL_ON_DISCONNECT = os.getenv("QUERY_CANCEL_ON_DISCONNECT", "1") == "1"
+
+# -------------------------
+# 충전기 실시간 상태 (/stations/availability, SSE)
+# - AVAILABILITY_SOURCE: off | keco (한국환경공단 충전기 상태 API) | mock (로컬 개발용 가짜 상태)
+# - 워커마다 폴러가 하나씩 돌고, 바뀐 상태만 SSE로 구독자에게 보냄
+# - AVAILABILITY_SHARED_POLLER=1: 잠금(flock)을 잡은 워커 하나만 소스(KECO)를 읽고 전체 상태를
+#   AVAILABILITY_SHARED_DIR 파일로 내려 두면, 나머지 워커는 AVAILABILITY_FOLLOW_SEC마다 그 파일만 읽음
+#   (워커 수만큼 API 호출이 늘지 않음, 리더 워커가 죽으면 다른 워커가 잠금을 넘겨받음)
+# - KECO_PERIOD_MIN: 한 번 조회할 때 받아 오는 상태 변경 기간(분) - 폴링 주기보다 넉넉하게
+# - KECO_INFO_URL: 처음(또는 변경분을 놓쳤을 때) 전체 충전기 상태를 받아 오는 충전기 정보 API
+# -------------------------
+AVAILABILITY_SOURCE = os.getenv("AVAILABILITY_SOURCE", "off")
+AVAILABILITY_POLL_SEC = float(os.getenv("AVAILABILITY_POLL_SEC", "60"))
+AVAILABILITY_HISTORY = int(os.getenv("AVAILABILITY_HISTORY", "256"))
+AVAILABILITY_HEARTBEAT_SEC = float(os.getenv("AVAILABILITY_HEARTBEAT_SEC", "15"))
+AVAILABILITY_SHARED_POLLER = os.getenv("AVAILABILITY_SHARED_POLLER", "1") == "1"
+AVAILABILITY_SHARED_DIR = Path(os.getenv("AVAILABILITY_SHARED_DIR", str(CACHE_DIR / "availability")))
+AVAILABILITY_FOLLOW_SEC = float(os.getenv("AVAILABILITY_FOLLOW_SEC", "5"))
+KECO_STATUS_URL = os.getenv("KECO_STATUS_URL", "https://apis.data.go.kr/B552584/EvCharger/getChargerStatus")
+KECO_INFO_URL = os.getenv("KECO_INFO_URL", "https://apis.data.go.kr/B552584/EvCharger/getChargerInfo")
+KECO_SERVICE_KEY = os.getenv("KECO_SERVICE_KEY", "")
+KECO_PERIOD_MIN = int(os.getenv("KECO_PERIOD_MIN", "10"))
+KECO_PAGE_SIZE = int(os.getenv("KECO_PAGE_SIZE", "9999"))
+KECO_TIMEOUT_SEC = float(os.getenv("KECO_TIMEOUT_SEC", "10"))
@@ -0,0 +1,84 @@
+import hashlib
+import json
+import threading
+import time
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import DATA_VERSION_TTL_SEC
+
+# -------------------------
+# 데이터 버전
+# - 원천 테이블(등록/대기질/충전소)의 행 수 + 최신 키로 만든 짧은 해시
+# - 캐시 키에 넣어서, 파이프라인이 데이터를 갈아끼우면 캐시가 자동으로 무효화되게 함
+# - 매 요청마다 COUNT(*)를 돌리지 않도록 TTL 동안은 마지막 값을 재사용
+# - 통계 버전(get_stats_version): 같은 조회에서 등록/대기질 항목만으로 만든 해시 (충전소 적재로 무효화되면 안 되는 캐시용)
+# -------------------------
+_lock = threading.Lock()
+_state = {"value": None, "stats": None, "checked_at": 0.0}
+
+# 통계 버전에 들어가는 항목 (충전소 변경과 무관한 캐시용: 벡터 타일 등)
+_STATS_KEYS = ("reg_rows", "reg_max", "air_rows", "air_max")
+
+
+def _hash(row: dict, keys) -> str:
+    raw = json.dumps({k: row[k] for k in keys}, sort_keys=True, default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:12]
+
+
+def _compute(db: Session) -> tuple[str, str]:
+    row = db.execute(text("""
+        SELECT
+            (SELECT COUNT(*) FROM car_registration_stats) AS reg_rows,
+            (SELECT DATE_FORMAT(MAX(base_month), '%Y-%m-%d') FROM car_registration_stats) AS reg_max,
+            (SELECT COUNT(*) FROM air_pollution) AS air_rows,
+            (SELECT MAX(year) FROM air_pollution) AS air_max,
+            (SELECT COUNT(*) FROM station) AS station_rows,
+            (SELECT MAX(id) FROM station) AS station_max
+    """)).mappings().one()
+    return _hash(row, row.keys()), _hash(row, _STATS_KEYS)
+
+
+def _store(value: str, stats: str, now: float) -> None:
+    with _lock:
+        _state["value"] = value
+        _state["stats"] = stats
+        _state["checked_at"] = now
+
+
+def get_data_version(db: Session) -> str:
+    now = time.monotonic()
+    with _lock:
+        if _state["value"] is not None and now - _state["checked_at"] < DATA_VERSION_TTL_SEC:
+            return _state["value"]
+
+    value, stats = _compute(db)
+    _store(value, stats, now)
+    return value
+
+
+def get_stats_version(db: Session) -> str:
+    """등록 통계 + 대기오염 데이터만의 버전 (충전소가 바뀌어도 그대로)"""
+    get_data_version(db)
+    with _lock:
+        stats = _state["stats"]
+    if stats is None:  # 그 사이 invalidate됨
+        value, stats = _compute(db)
+        _store(value, stats, time.monotonic())
+    return stats
+
+
+def refresh_data_version(db: Session) -> str:
+    """TTL과 무관하게 지금 값을 다시 계산해서 저장 (다른 워커가 더 새 버전을 봤을 때 확인용)"""
+    value, stats = _compute(db)
+    _store(value, stats, time.monotonic())
+    return value
+
+
+def invalidate_data_version() -> None:
+    """적재 직후 등에서 호출하면 다음 요청에서 버전을 다시 계산한다."""
+    with _lock:
+        _state["value"] = None
+        _state["stats"] = None
+        _state["checked_at"] = 0.0
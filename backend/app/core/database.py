@@ -1,21 +1,243 @@
-import os
-from pathlib import Path
+import itertools
+import logging
+import threading
+import time
+from typing import Optional
 
-from dotenv import load_dotenv
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import declarative_base, sessionmaker
 
-# backend/.env 로드
-ENV_PATH = Path(__file__).resolve().parents[2] / ".env"
-load_dotenv(ENV_PATH, override=True)
-
-DB_HOST = os.getenv("DB_HOST")
-DB_PORT = os.getenv("DB_PORT", "3306")
-DB_NAME = os.getenv("DB_NAME")
-DB_USER = os.getenv("DB_USER")
-DB_PASSWORD = os.getenv("DB_PASSWORD")
+from app.core.config import (
+    DB_HOST, DB_MAX_OVERFLOW, DB_NAME, DB_PASSWORD, DB_POOL_RECYCLE_SEC, DB_POOL_SIZE, DB_PORT,
+    DB_REPLICA_CHECK_INTERVAL_SEC, DB_REPLICA_LAG_SQL, DB_REPLICA_MAX_LAG_SEC, DB_REPLICA_POOL_SIZE,
+    DB_REPLICA_URLS, DB_USER,
+)
 
+# -------------------------
+# DB 엔진 / 세션
+# - 엔진은 import 시점이 아니라 처음 필요할 때(또는 앱 lifespan에서) 만든다.
+# - SessionLocal()은 엔진이 없으면 먼저 만들고 세션을 돌려준다.
+# - SessionLocal     : primary (쓰기, 적재)
+# - ReadSessionLocal : 조회 전용, 정상 레플리카 중 라운드로빈 (없으면 primary)
+#   요청 단위 세션 의존성(get_db / get_read_db)은 app.api.deps
+# -------------------------
 DATABASE_URL = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
\ No newline at end of file
+logger = logging.getLogger(__name__)
+
+_engine = None
+_lock = threading.Lock()
+
+# 죽은 레플리카에 붙느라 요청이 오래 멈추지 않도록 짧게
+_REPLICA_CONNECT_TIMEOUT_SEC = 3
+
+
+class _LazySessionmaker(sessionmaker):
+    def __call__(self, **local_kw):
+        get_engine()
+        return super().__call__(**local_kw)
+
+
+SessionLocal = _LazySessionmaker(autocommit=False, autoflush=False)
+
+# ORM 베이스 클래스 (app.models)
+Base = declarative_base()
+
+
+def get_engine() -> Engine:
+    global _engine
+    if _engine is None:
+        with _lock:
+            if _engine is None:
+                _engine = create_engine(
+                    DATABASE_URL,
+                    pool_pre_ping=True,
+                    pool_size=DB_POOL_SIZE,
+                    max_overflow=DB_MAX_OVERFLOW,
+                    pool_recycle=DB_POOL_RECYCLE_SEC,
+                )
+                SessionLocal.configure(bind=_engine)
+    return _engine
+
+
+# -------------------------
+# 읽기 레플리카
+# - 헬스 체크: SELECT 1 + 복제 지연 측정, 결과는 DB_REPLICA_CHECK_INTERVAL_SEC 동안 재사용
+#   (오래된 레플리카는 그걸 뽑은 요청 하나만 다시 체크하고, 나머지 요청은 직전 결과로 진행)
+# - 연결 실패 / 복제 중단(지연 NULL) / 지연 > DB_REPLICA_MAX_LAG_SEC 이면 제외
+# - 지연 측정: DB_REPLICA_LAG_SQL(초 단위 스칼라, 예: heartbeat 테이블)이 있으면 그걸,
+#   MySQL이면 SHOW REPLICA STATUS(구버전은 SHOW SLAVE STATUS), 그 외 DB는 0으로 본다.
+#   SHOW ... STATUS가 둘 다 실패하면(REPLICATION CLIENT 권한 없음 등) 지연을 모르는 것으로 보고 제외
+# -------------------------
+def _replica_engine(url: str) -> Engine:
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        return create_engine(url)
+    connect_args = {"connect_timeout": _REPLICA_CONNECT_TIMEOUT_SEC} if parsed.get_backend_name() == "mysql" else {}
+    return create_engine(
+        url,
+        pool_pre_ping=True,
+        pool_size=DB_REPLICA_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_recycle=DB_POOL_RECYCLE_SEC,
+        connect_args=connect_args,
+    )
+
+
+def _replication_lag(conn) -> Optional[float]:
+    """복제 지연(초). 복제가 멈춰서 알 수 없으면 None"""
+    if DB_REPLICA_LAG_SQL:
+        lag = conn.execute(text(DB_REPLICA_LAG_SQL)).scalar()
+        return None if lag is None else float(lag)
+    if conn.dialect.name != "mysql":
+        return 0.0
+
+    errors = []
+    for stmt, col in (("SHOW REPLICA STATUS", "Seconds_Behind_Source"), ("SHOW SLAVE STATUS", "Seconds_Behind_Master")):
+        try:
+            row = conn.exec_driver_sql(stmt).mappings().first()
+        except Exception as e:
+            errors.append(f"{stmt}: {type(e).__name__}: {e}")
+            continue
+        if row is None:
+            # 복제 설정이 없는 서버 (로컬 대역 등)
+            return 0.0
+        lag = row.get(col)
+        return None if lag is None else float(lag)
+
+    # 지연을 모르는 레플리카를 "따라잡음"으로 볼 수는 없음 -> 제외 (primary로)
+    logger.warning(
+        "replication lag unavailable (%s); grant REPLICATION CLIENT or set DB_REPLICA_LAG_SQL",
+        "; ".join(errors),
+    )
+    return None
+
+
+class _Replica:
+    def __init__(self, url: str):
+        self.url = url
+        self.name = make_url(url).render_as_string(hide_password=True)
+        self.engine: Optional[Engine] = None
+        self.healthy = False
+        self.lag: Optional[float] = None
+        self.error: Optional[str] = None
+        self.checked_at = 0.0
+        self.check_lock = threading.Lock()
+
+
+class ReplicaPool:
+    """읽기 레플리카 목록 + 헬스 상태 + 라운드로빈 선택"""
+
+    def __init__(self, urls: list[str], max_lag_sec: float, check_interval_sec: float):
+        self.max_lag_sec = max_lag_sec
+        self.check_interval_sec = check_interval_sec
+        self._replicas = [_Replica(u) for u in urls]
+        self._rr = itertools.count()
+        self._rr_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._replicas)
+
+    def check(self, replica: _Replica) -> None:
+        try:
+            if replica.engine is None:
+                replica.engine = _replica_engine(replica.url)
+            with replica.engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                lag = _replication_lag(conn)
+            if lag is None:
+                healthy, error = False, "replication stopped or lag unknown"
+            elif lag > self.max_lag_sec:
+                healthy, error = False, f"lag {lag:.1f}s > {self.max_lag_sec:.1f}s"
+            else:
+                healthy, error = True, None
+        except Exception as e:
+            lag, healthy, error = None, False, f"{type(e).__name__}: {e}"
+
+        if replica.healthy and not healthy:
+            logger.warning("replica %s excluded: %s", replica.name, error)
+        elif not replica.healthy and healthy and replica.checked_at:
+            logger.info("replica %s back in rotation", replica.name)
+        replica.lag, replica.healthy, replica.error = lag, healthy, error
+        replica.checked_at = time.monotonic()
+
+    def _refresh_if_stale(self, replica: _Replica) -> None:
+        if time.monotonic() - replica.checked_at < self.check_interval_sec:
+            return
+        if replica.check_lock.acquire(blocking=False):
+            try:
+                self.check(replica)
+            finally:
+                replica.check_lock.release()
+
+    def check_all(self) -> int:
+        """모든 레플리카를 지금 체크하고 정상 개수를 돌려준다 (워밍업에서 사용)"""
+        for replica in self._replicas:
+            with replica.check_lock:
+                self.check(replica)
+        return sum(r.healthy for r in self._replicas)
+
+    def pick(self) -> Optional[Engine]:
+        """정상 레플리카 엔진을 라운드로빈으로. 하나도 없으면 None (호출 측에서 primary 사용)"""
+        n = len(self._replicas)
+        if n == 0:
+            return None
+        with self._rr_lock:
+            start = next(self._rr)
+        for i in range(n):
+            replica = self._replicas[(start + i) % n]
+            self._refresh_if_stale(replica)
+            if replica.healthy:
+                return replica.engine
+        return None
+
+    def status(self) -> list[dict]:
+        now = time.monotonic()
+        return [
+            {
+                "name": r.name,
+                "healthy": r.healthy,
+                "lag_sec": r.lag,
+                "error": r.error,
+                "checked_sec_ago": round(now - r.checked_at, 1) if r.checked_at else None,
+            }
+            for r in self._replicas
+        ]
+
+    def dispose(self) -> None:
+        for r in self._replicas:
+            if r.engine is not None:
+                r.engine.dispose()
+                r.engine = None
+            r.healthy, r.checked_at = False, 0.0
+
+
+_replica_pool = ReplicaPool(DB_REPLICA_URLS, DB_REPLICA_MAX_LAG_SEC, DB_REPLICA_CHECK_INTERVAL_SEC)
+
+
+def get_replica_pool() -> ReplicaPool:
+    return _replica_pool
+
+
+def get_read_engine() -> Engine:
+    return _replica_pool.pick() or get_engine()
+
+
+class _ReadSessionmaker(sessionmaker):
+    def __call__(self, **local_kw):
+        local_kw.setdefault("bind", get_read_engine())
+        return super().__call__(**local_kw)
+
+
+ReadSessionLocal = _ReadSessionmaker(autocommit=False, autoflush=False)
+
+
+def dispose_engine() -> None:
+    global _engine
+    with _lock:
+        if _engine is not None:
+            _engine.dispose()
+            _engine = None
+    _replica_pool.dispose()
+
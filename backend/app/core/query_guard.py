@@ -0,0 +1,225 @@
+import asyncio
+import contextvars
+import logging
+import re
+import threading
+from typing import Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import NullPool
+
+from app.core.admission import STREAM_PATHS, controller as admission_controller
+from app.core.config import QUERY_BUDGETS_MS, QUERY_CANCEL_ON_DISCONNECT
+
+# -------------------------
+# 쿼리 실행 예산 + 끊긴 요청의 쿼리 취소
+# - 요청마다 QueryScope(예산 ms, 진행 중인 쿼리)를 contextvar에 두고
+#   (동기 엔드포인트/의존성은 스레드풀에서 돌지만 contextvar는 그대로 전달됨)
+# - 예산: MySQL SELECT 앞에 /*+ MAX_EXECUTION_TIME(n) */ 힌트를 붙여 서버가 직접 중단
+#   (WITH로 시작하는 쿼리는 힌트 위치가 애매해서 제외, 요청 밖(워밍업/파이프라인) 쿼리도 제외)
+# - 취소: 클라이언트 연결이 끊기면 그 요청에서 진행 중인 쿼리에 KILL QUERY <thread_id>,
+#   이후 같은 요청에서 새로 나가는 쿼리는 보내지 않고 QueryCancelled
+#   (single-flight로 다른 요청이 결과를 기다리는 쿼리는 취소하지 않음)
+#   · KILL은 풀을 거치지 않는 전용 커넥션(NullPool)으로 보냄 - 이 기능이 필요한 부하에서는 풀이 이미 바닥이라
+#   · KILL은 scope 잠금을 잡은 채로 보내고 finished()도 같은 잠금을 잡음 -> 쿼리가 끝나 커넥션이 풀로 돌아가
+#     다른 요청의 쿼리를 실행하는 중에 그 쿼리를 죽이는 일이 없음 (끝난 직후면 KILL은 유휴 커넥션에 no-op)
+# -------------------------
+logger = logging.getLogger(__name__)
+
+_KILL_CONNECT_TIMEOUT_SEC = 3
+_kill_engines: dict[str, Engine] = {}
+_kill_engines_lock = threading.Lock()
+
+
+def _kill_engine(engine: Engine) -> Engine:
+    """대상 엔진과 같은 DB로 가는 풀 없는 엔진 (KILL 전용, 엔진별로 하나)"""
+    key = engine.url.render_as_string(hide_password=False)
+    with _kill_engines_lock:
+        kill = _kill_engines.get(key)
+        if kill is None:
+            connect_args = {"connect_timeout": _KILL_CONNECT_TIMEOUT_SEC} if engine.dialect.name == "mysql" else {}
+            kill = create_engine(engine.url, poolclass=NullPool, connect_args=connect_args)
+            _kill_engines[key] = kill
+        return kill
+
+_SELECT_RE = re.compile(r"^(\s*)SELECT\b", re.IGNORECASE)
+
+
+class QueryCancelled(Exception):
+    pass
+
+
+class QueryScope:
+    def __init__(self, budget_ms: Optional[int]):
+        self.budget_ms = budget_ms
+        self.cancelled = False
+        self.shared = False
+        self.killed = 0
+        self._running: Optional[tuple[Engine, int]] = None
+        self._lock = threading.Lock()
+
+    def mark_shared(self) -> None:
+        """다른 요청이 이 요청의 쿼리 결과를 기다리는 중 (single-flight) -> 끊겨도 취소하지 않음"""
+        self.shared = True
+
+    def started(self, engine: Engine, thread_id: Optional[int]) -> None:
+        if self.cancelled and not self.shared:
+            raise QueryCancelled("client disconnected")
+        if thread_id is not None:
+            with self._lock:
+                self._running = (engine, thread_id)
+
+    def finished(self) -> None:
+        with self._lock:
+            self._running = None
+
+    def cancel(self) -> None:
+        """클라이언트가 끊겼을 때 (스레드에서 호출, KILL은 블로킹)"""
+        with self._lock:
+            self.cancelled = True
+            running = self._running
+        if running is None or self.shared:
+            return
+        engine, thread_id = running
+        try:
+            # 접속은 잠금 밖에서 (느릴 수 있음), KILL은 쿼리가 아직 진행 중인지 잠금 안에서 다시 확인하고
+            with _kill_engine(engine).connect() as conn:
+                with self._lock:
+                    current = self._running
+                    if current is None or current[1] != thread_id:
+                        return
+                    # 같은 계정의 커넥션은 추가 권한 없이 KILL 가능
+                    conn.exec_driver_sql(f"KILL QUERY {int(thread_id)}")
+            self.killed += 1
+            logger.info("client disconnected, killed query on thread %s", thread_id)
+        except Exception:
+            logger.exception("KILL QUERY %s failed", thread_id)
+
+
+_scope: contextvars.ContextVar[Optional[QueryScope]] = contextvars.ContextVar("query_scope", default=None)
+
+
+def current_scope() -> Optional[QueryScope]:
+    return _scope.get()
+
+
+def parse_budgets(spec: str) -> dict[str, int]:
+    budgets = {}
+    for part in spec.split(","):
+        name, _, ms = part.partition("=")
+        if name.strip() and ms.strip():
+            budgets[name.strip()] = int(ms)
+    return budgets
+
+
+_budgets = parse_budgets(QUERY_BUDGETS_MS)
+
+
+def budget_for(path: str) -> Optional[int]:
+    partition = admission_controller.partition_for(path)
+    name = partition.name if partition is not None else "default"
+    return _budgets.get(name, _budgets.get("default"))
+
+
+def add_execution_hint(statement: str, budget_ms: int) -> str:
+    return _SELECT_RE.sub(rf"\1SELECT /*+ MAX_EXECUTION_TIME({int(budget_ms)}) */", statement, count=1)
+
+
+def _thread_id(cursor) -> Optional[int]:
+    conn = getattr(cursor, "connection", None)
+    get_id = getattr(conn, "thread_id", None)  # pymysql
+    try:
+        return int(get_id()) if callable(get_id) else None
+    except Exception:
+        return None
+
+
+@event.listens_for(Engine, "before_cursor_execute", retval=True)
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    scope = _scope.get()
+    if scope is None or conn.dialect.name != "mysql":
+        return statement, parameters
+    scope.started(conn.engine, _thread_id(cursor))
+    if scope.budget_ms:
+        statement = add_execution_hint(statement, scope.budget_ms)
+    return statement, parameters
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    scope = _scope.get()
+    if scope is not None:
+        scope.finished()
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(context):
+    scope = _scope.get()
+    if scope is not None:
+        scope.finished()
+
+
+class QueryGuardMiddleware:
+    """
+    요청마다 QueryScope를 열고, 응답이 끝나기 전에 http.disconnect가 오면 scope.cancel()
+    - 요청 본문은 먼저 다 받아 두고 앱에는 그대로 다시 넘김 (이 API는 GET 위주라 본문이 작음)
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        # 스트림(SSE)은 쿼리를 실행하지 않고 연결 끊김도 스스로 확인함
+        if scope["type"] != "http" or scope["path"].startswith(STREAM_PATHS):
+            await self.app(scope, receive, send)
+            return
+
+        query_scope = QueryScope(budget_for(scope["path"]))
+        token = _scope.set(query_scope)
+        try:
+            if not QUERY_CANCEL_ON_DISCONNECT:
+                await self.app(scope, receive, send)
+                return
+
+            body_messages = []
+            while True:
+                message = await receive()
+                body_messages.append(message)
+                if message["type"] != "http.request" or not message.get("more_body"):
+                    break
+
+            disconnected = asyncio.Event()
+            if body_messages[-1]["type"] == "http.disconnect":
+                disconnected.set()
+
+            async def replay():
+                if body_messages:
+                    return body_messages.pop(0)
+                await disconnected.wait()
+                return {"type": "http.disconnect"}
+
+            # 응답 본문을 다 보낸 뒤의 http.disconnect는 정상 종료 (uvicorn은 응답이 끝나면 바로 disconnect를 돌려줌)
+            response_done = False
+
+            async def send_tracking(message):
+                nonlocal response_done
+                if message["type"] == "http.response.body" and not message.get("more_body"):
+                    response_done = True
+                await send(message)
+
+            async def watch():
+                while not disconnected.is_set():
+                    message = await receive()
+                    if message["type"] == "http.disconnect":
+                        disconnected.set()
+                if not response_done:
+                    await asyncio.to_thread(query_scope.cancel)
+
+            watcher = asyncio.create_task(watch())
+            try:
+                await self.app(scope, replay, send_tracking)
+            finally:
+                watcher.cancel()
+        finally:
+            _scope.reset(token)
@@ -0,0 +1,64 @@
+from typing import Optional, Union
+
+# -------------------------
+# 지역 코드/이름 매핑
+# - DB의 기준은 region_dim 테이블 (migrations/0001_region_dim.py가 이 매핑으로 시/도 행을 채움)
+# - 여기 dict는 시드 값 + DB 없이 동작하는 곳(보조금 규칙, 좌표)에서만 사용
+# - region_code는 SMALLINT UNSIGNED: 시/도 2자리(11~50), 시/군/구 5자리(SIG_CD, 11110~50130)
+# -------------------------
+REGION_CODE_TO_NAME = {
+    "11": "서울특별시",
+    "41": "경기도",
+    "28": "인천광역시",
+    "42": "강원도",
+    "43": "충청북도",
+    "44": "충청남도",
+    "30": "대전광역시",
+    "36": "세종특별자치시",
+    "47": "경상북도",
+    "48": "경상남도",
+    "27": "대구광역시",
+    "31": "울산광역시",
+    "26": "부산광역시",
+    "45": "전라북도",
+    "46": "전라남도",
+    "29": "광주광역시",
+    "50": "제주특별자치도",
+}
+REGION_NAME_TO_CODE = {v: k for k, v in REGION_CODE_TO_NAME.items()}
+
+# 시/도 대표 좌표 (lat, lng) - 지역 단위 지표를 격자/지도에 올릴 때 사용
+REGION_CENTROIDS = {
+    "11": (37.5665, 126.9780), "41": (37.4138, 127.5183), "28": (37.4563, 126.7052),
+    "42": (37.8228, 128.1555), "43": (36.6357, 127.4912), "44": (36.6588, 126.6728),
+    "30": (36.3504, 127.3845), "36": (36.4800, 127.2890), "47": (36.4919, 128.8889),
+    "48": (35.4606, 128.2132), "27": (35.8714, 128.6014), "31": (35.5389, 129.3114),
+    "26": (35.1796, 129.0756), "45": (35.7175, 127.1530), "46": (34.8679, 126.9910),
+    "29": (35.1595, 126.8526), "50": (33.4996, 126.5312),
+}
+
+
+SIDO_LEVEL = 1
+SIGUNGU_LEVEL = 2
+
+
+def to_region_code(value: Union[str, int, None]) -> Optional[int]:
+    """
+    쿼리 파라미터 -> region_dim.region_code
+    - "11", 11 그대로, 시/도 이름("서울특별시")이 들어와도 코드로 바꿔 줌 (프론트가 이름을 넣는 경우 방어)
+    - 모르는 값이면 ValueError
+    """
+    if value is None or value == "":
+        return None
+    text = str(value).strip()
+    if text.isdigit():
+        return int(text)
+    code = REGION_NAME_TO_CODE.get(text)
+    if code is None:
+        raise ValueError(f"unknown region: {value}")
+    return int(code)
+
+
+def format_region_code(code: int) -> str:
+    """region_code -> API 응답용 문자열 ("11", "41110")"""
+    return str(code).zfill(2)
@@ -0,0 +1,199 @@
+import gzip
+import hashlib
+import json
+import threading
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+from app.core.config import BROTLI_QUALITY, COMPRESS_MIN_BYTES, GZIP_LEVEL
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson이 없으면 표준 json으로
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+# -------------------------
+# 응답 직렬화 계층
+# - 포맷: Accept에 msgpack이 있으면 MessagePack, 아니면 JSON (orjson)
+# - 압축: Accept-Encoding에 따라 br > gzip, COMPRESS_MIN_BYTES 미만이면 압축 생략
+# - EncodedPayload: (포맷, 압축)별 바이트를 한 번만 만들어 두고 재사용 -> 서비스 캐시에 그대로 저장
+# -------------------------
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+_MSGPACK_ACCEPT = ("application/msgpack", "application/x-msgpack", "application/vnd.msgpack")
+
+
+def _default(obj: Any):
+    # numpy 스칼라/배열, date 등
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    raise TypeError(f"not serializable: {type(obj).__name__}")
+
+
+def dumps_json(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+
+def loads_json(body: bytes) -> Any:
+    return orjson.loads(body) if orjson is not None else json.loads(body)
+
+
+def dumps_msgpack(payload: Any) -> bytes:
+    return msgpack.packb(payload, default=_default, use_bin_type=True)
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=GZIP_LEVEL)
+    return body
+
+
+def _accepts(header: str, token: str) -> bool:
+    """'gzip;q=0' 처럼 명시적으로 거부한 경우는 제외"""
+    for part in header.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        if name.strip() == token:
+            return params.replace(" ", "") not in ("q=0", "q=0.0")
+    return False
+
+
+def choose_format(request: Request) -> str:
+    accept = request.headers.get("accept", "")
+    if msgpack is not None and any(_accepts(accept, t) for t in _MSGPACK_ACCEPT):
+        return "msgpack"
+    return "json"
+
+
+def choose_encoding(request: Request) -> str:
+    accept = request.headers.get("accept-encoding", "")
+    if brotli is not None and _accepts(accept, "br"):
+        return "br"
+    if _accepts(accept, "gzip"):
+        return "gzip"
+    return "identity"
+
+
+class EncodedPayload:
+    """
+    응답 본문 캐시 단위
+    - payload(dict/list) 또는 이미 만든 JSON 바이트로 생성
+    - body(fmt, encoding)는 처음 요청될 때 한 번만 인코딩/압축하고 이후 같은 바이트를 돌려준다.
+    """
+
+    def __init__(self, payload: Any = None, *, json_bytes: Optional[bytes] = None):
+        self._payload = payload
+        self._bodies: dict[tuple[str, str], bytes] = {}
+        self._lock = threading.RLock()
+        if json_bytes is None:
+            json_bytes = dumps_json(payload)
+        self._bodies[("json", "identity")] = json_bytes
+        self.etag = hashlib.sha1(json_bytes).hexdigest()[:16]
+
+    @property
+    def size(self) -> int:
+        return len(self._bodies[("json", "identity")])
+
+    def body(self, fmt: str = "json", encoding: str = "identity") -> bytes:
+        key = (fmt, encoding)
+        cached = self._bodies.get(key)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            if key in self._bodies:
+                return self._bodies[key]
+            if encoding == "identity":
+                if self._payload is None:
+                    self._payload = loads_json(self._bodies[("json", "identity")])
+                data = dumps_msgpack(self._payload)
+            else:
+                data = compress(self.body(fmt, "identity"), encoding)
+            self._bodies[key] = data
+            return data
+
+
+def quote_etag(tag: str) -> str:
+    """ETag 헤더 값은 따옴표로 감싼 opaque-tag (RFC 9110 8.8.3)"""
+    return f'"{tag}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match 비교 (RFC 9110 13.1.2)
+    - 쉼표로 나뉜 목록 중 하나라도 맞으면 True, "*"는 항상 True
+    - 약한 비교: W/ 접두어는 무시하고 따옴표 안의 값만 비교
+    """
+    if not if_none_match:
+        return False
+    target = etag.removeprefix("W/").strip('"')
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/").strip('"') == target:
+            return True
+    return False
+
+
+def not_modified(request: Request, etag: str, headers: Optional[dict] = None) -> Optional[Response]:
+    """If-None-Match가 etag와 맞으면 304 Response, 아니면 None"""
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag, **(headers or {})})
+    return None
+
+
+def negotiate(
+    request: Request,
+    content: Any,
+    status_code: int = 200,
+    headers: Optional[dict] = None,
+) -> Response:
+    """
+    payload(dict/list) 또는 EncodedPayload를 요청 헤더에 맞는 Response로
+    - ETag는 표현(포맷, 압축)마다 다름: 압축된 바이트는 원본과 다르므로 강한 검증자를 공유하지 않음
+    - If-None-Match가 맞으면 304
+    """
+    encoded = content if isinstance(content, EncodedPayload) else EncodedPayload(content)
+    fmt = choose_format(request)
+    encoding = choose_encoding(request) if encoded.size >= COMPRESS_MIN_BYTES else "identity"
+    tag = encoded.etag if fmt == "json" else f"{encoded.etag}-{fmt}"
+    if encoding != "identity":
+        tag = f"{tag}-{encoding}"
+    out_headers = {"ETag": quote_etag(tag), "Vary": "Accept, Accept-Encoding", **(headers or {})}
+    cached = not_modified(request, out_headers["ETag"], out_headers)
+    if cached is not None:
+        return cached
+
+    if encoding != "identity":
+        out_headers["Content-Encoding"] = encoding
+
+    return Response(
+        content=encoded.body(fmt, encoding),
+        status_code=status_code,
+        media_type=MSGPACK_MEDIA_TYPE if fmt == "msgpack" else JSON_MEDIA_TYPE,
+        headers=out_headers,
+    )
+
+
+class FastJSONResponse(Response):
+    """기본 응답 클래스 (표준 json 대신 orjson)"""
+
+    media_type = JSON_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
@@ -0,0 +1,224 @@
+import json
+import os
+import secrets
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+
+from app.core.cache import read_bytes, write_bytes_atomic
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: 워커 간 잠금 없이 (프로세스 내 잠금만)
+    fcntl = None
+
+# -------------------------
+# 공유 메모리 배열 저장소
+# - 배열 묶음을 세그먼트 하나에 64바이트 정렬로 이어 붙이고, 배치(dtype/shape/offset)는 매니페스트(JSON)에 기록
+# - 다른 워커는 매니페스트를 읽고 같은 세그먼트에 붙어서 np.ndarray view로 사용 (복사 없음, 읽기 전용)
+# - 새 버전 게시: 새 세그먼트 작성 -> 매니페스트 원자적 교체 -> 이전 세그먼트 unlink
+#   (unlink는 이름만 지우고, 이미 붙어 있는 워커의 매핑은 마지막 참조가 사라질 때까지 유효)
+# - 빌드/게시는 잠금 파일(flock)로 워커 간 한 번에 하나만
+# -------------------------
+_ALIGN = 64
+
+
+def _open_segment(name: str, create: bool = False, size: int = 0) -> shared_memory.SharedMemory:
+    """
+    세그먼트 열기 (resource_tracker 추적 없이)
+    - 추적되면 처음 만든/붙은 프로세스가 종료될 때 세그먼트를 지워서 다른 워커가 쓰던 중에 사라짐
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, create=create, size=size, track=False)
+    shm = shared_memory.SharedMemory(name=name, create=create, size=size)
+    if os.name == "posix":
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+def _unlink_segment(name: str) -> None:
+    try:
+        shm = _open_segment(name)
+    except FileNotFoundError:
+        return
+    try:
+        if sys.version_info < (3, 13) and os.name == "posix":
+            # unlink()가 추적 해제까지 하므로 짝을 맞춰 다시 등록
+            resource_tracker.register(shm._name, "shared_memory")
+        shm.unlink()
+    finally:
+        shm.close()
+
+
+class SharedArrays:
+    """
+    버전 하나의 배열 묶음
+    - shm이 있으면 공유 메모리 view, 없으면 일반 배열 (공유 캐시를 끈 경우)
+    - 마지막 참조가 사라지면 세그먼트 매핑을 닫는다.
+    """
+
+    def __init__(self, version: str, arrays: dict[str, np.ndarray], shm: Optional[shared_memory.SharedMemory] = None):
+        self.version = version
+        self.arrays = arrays
+        self._shm = shm
+
+    @property
+    def shared(self) -> bool:
+        return self._shm is not None
+
+    @property
+    def segment(self) -> Optional[str]:
+        return self._shm.name if self._shm is not None else None
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in self.arrays.values())
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.arrays[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.arrays
+
+    def __del__(self):
+        shm, self._shm = self._shm, None
+        if shm is not None:
+            self.arrays = {}
+            try:
+                shm.close()
+            except BufferError:
+                # 밖에서 아직 view를 들고 있으면 매핑은 그 view가 사라질 때 같이 정리됨
+                pass
+
+
+class SharedArrayStore:
+    def __init__(self, directory: Path, prefix: str):
+        self.directory = directory
+        self.prefix = prefix
+        self.manifest_path = directory / "manifest.json"
+        self.lock_path = directory / "manifest.lock"
+        self.current: Optional[SharedArrays] = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def exclusive(self):
+        """프로세스 안에서는 스레드 잠금, 워커 사이에서는 flock"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with self._lock, open(self.lock_path, "a+b") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def read_manifest(self) -> Optional[dict]:
+        raw = read_bytes(self.manifest_path)
+        return json.loads(raw) if raw else None
+
+    def _attach(self, manifest: dict) -> SharedArrays:
+        shm = _open_segment(manifest["segment"])
+        arrays = {}
+        for name, spec in manifest["arrays"].items():
+            view = np.ndarray(tuple(spec["shape"]), dtype=np.dtype(spec["dtype"]), buffer=shm.buf, offset=spec["offset"])
+            view.flags.writeable = False
+            arrays[name] = view
+        return SharedArrays(manifest["version"], arrays, shm)
+
+    def _publish(self, version: str, arrays: dict[str, np.ndarray]) -> dict:
+        layout, size = {}, 0
+        arrays = {name: np.ascontiguousarray(a) for name, a in arrays.items()}
+        for name, a in arrays.items():
+            if a.dtype.hasobject:
+                raise TypeError(f"object array cannot be shared: {name}")
+            size = -(-size // _ALIGN) * _ALIGN
+            layout[name] = {"dtype": a.dtype.str, "shape": list(a.shape), "offset": size}
+            size += a.nbytes
+
+        shm = _open_segment(f"{self.prefix}_{version}_{secrets.token_hex(4)}", create=True, size=max(size, 1))
+        segment = shm.name
+        try:
+            for name, a in arrays.items():
+                np.ndarray(a.shape, dtype=a.dtype, buffer=shm.buf, offset=layout[name]["offset"])[...] = a
+        except BaseException:
+            shm.close()
+            _unlink_segment(segment)
+            raise
+        shm.close()
+
+        previous = self.read_manifest()
+        manifest = {
+            "version": version,
+            "segment": segment,
+            "size": size,
+            "arrays": layout,
+            "published_at": time.time(),
+            "pid": os.getpid(),
+        }
+        write_bytes_atomic(self.manifest_path, json.dumps(manifest).encode("utf-8"))
+        if previous is not None and previous["segment"] != segment:
+            _unlink_segment(previous["segment"])
+        return manifest
+
+    def get_or_build(
+        self,
+        version: str,
+        build: Callable[[], dict[str, np.ndarray]],
+        refresh_version: Optional[Callable[[], str]] = None,
+    ) -> SharedArrays:
+        """
+        version에 맞는 배열 묶음
+        - 이미 붙어 있으면 그대로
+        - 다른 워커가 게시해 둔 게 있으면 붙기만 (빌드 없음)
+        - 없으면 잠금을 잡은 워커 하나만 build() 후 게시
+        - 매니페스트와 버전이 다르면 refresh_version()으로 지금 버전을 다시 확인해서
+          매니페스트가 지금 버전이면 붙기만 하고, 매니페스트가 정말 오래됐을 때만 게시
+          (워커마다 버전 캐시(TTL) 시점이 달라서, 오래된 버전을 본 워커가 새 세그먼트를 덮어쓰지 않도록)
+        """
+        current = self.current
+        if current is not None and current.version == version:
+            return current
+
+        with self.exclusive():
+            current = self.current
+            if current is not None and current.version == version:
+                return current
+
+            manifest = self.read_manifest()
+            if manifest is not None and manifest["version"] != version and refresh_version is not None:
+                version = refresh_version()
+                if current is not None and current.version == version:
+                    return current
+
+            attached = None
+            if manifest is not None and manifest["version"] == version:
+                try:
+                    attached = self._attach(manifest)
+                except FileNotFoundError:
+                    # 매니페스트만 남고 세그먼트가 없어짐 (재부팅 등) -> 다시 빌드
+                    attached = None
+            if attached is None:
+                attached = self._attach(self._publish(version, build()))
+
+            # 교체는 참조 하나만 바꿈 -> 이전 버전을 쓰던 요청은 끝날 때까지 이전 view를 계속 씀
+            self.current = attached
+            return attached
+
+    def status(self) -> dict:
+        current = self.current
+        return {
+            "manifest": self.read_manifest(),
+            "attached_version": current.version if current is not None else None,
+            "attached_segment": current.segment if current is not None else None,
+            "attached_bytes": current.nbytes if current is not None else 0,
+        }
+
+    def detach(self) -> None:
+        self.current = None
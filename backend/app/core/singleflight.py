@@ -0,0 +1,134 @@
+import functools
+import inspect
+import threading
+import time
+from typing import Any, Callable, Hashable
+
+from app.core.query_guard import current_scope
+
+# -------------------------
+# 단일 실행(single-flight) 요청 병합
+# - 같은 키의 호출이 동시에 들어오면 먼저 온 호출(leader)만 실제로 실행하고,
+#   나머지(follower)는 그 결과(또는 예외)를 같이 받는다.
+# - 캐시가 아님: 실행이 끝나면 키를 바로 지우므로, 끝난 뒤에 온 호출은 새로 실행
+# - 결과 객체는 호출자끼리 공유되므로 받은 쪽에서 수정하지 않는다.
+# -------------------------
+
+
+class _Call:
+    __slots__ = ("event", "result", "error", "waiters", "scope")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+        self.scope = None
+
+
+class SingleFlight:
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "executions": 0, "coalesced": 0, "errors": 0, "max_waiters": 0, "exec_ms": 0.0}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            self._stats["calls"] += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                call.scope = current_scope()
+            else:
+                call.waiters += 1
+                self._stats["coalesced"] += 1
+                self._stats["max_waiters"] = max(self._stats["max_waiters"], call.waiters)
+
+        if not leader:
+            # leader 요청의 클라이언트가 끊겨도 이 쿼리는 취소되지 않게
+            if call.scope is not None:
+                call.scope.mark_shared()
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        started = time.perf_counter()
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                self._stats["executions"] += 1
+                self._stats["exec_ms"] += (time.perf_counter() - started) * 1000
+                if call.error is not None:
+                    self._stats["errors"] += 1
+            call.event.set()
+        return call.result
+
+    def metrics(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            in_flight = len(self._calls)
+        stats["exec_ms"] = round(stats["exec_ms"], 1)
+        stats["in_flight"] = in_flight
+        stats["coalesced_ratio"] = round(stats["coalesced"] / stats["calls"], 4) if stats["calls"] else 0.0
+        return stats
+
+
+_groups: dict[str, SingleFlight] = {}
+_groups_lock = threading.Lock()
+
+
+def get_group(name: str) -> SingleFlight:
+    with _groups_lock:
+        group = _groups.get(name)
+        if group is None:
+            group = _groups[name] = SingleFlight(name)
+        return group
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = sorted(value, key=repr) if isinstance(value, (set, frozenset)) else value
+        return tuple(_freeze(v) for v in items)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def coalesce(group_name: str):
+    """
+    리포지토리 함수용 데코레이터 (첫 번째 인자 db 세션은 키에서 제외)
+    - 키: (함수 이름, 기본값까지 채운 나머지 인자) -> 위치/키워드 인자 차이는 같은 키로 정규화
+    """
+    group = get_group(group_name)
+
+    def decorator(fn: Callable) -> Callable:
+        sig = inspect.signature(fn)
+        first = next(iter(sig.parameters))
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (fn.__name__,) + tuple(
+                (k, _freeze(v)) for k, v in bound.arguments.items() if k != first
+            )
+            return group.do(key, lambda: fn(*args, **kwargs))
+
+        wrapper.singleflight = group
+        return wrapper
+
+    return decorator
+
+
+def get_singleflight_metrics() -> dict[str, dict]:
+    with _groups_lock:
+        groups = dict(_groups)
+    return {name: g.metrics() for name, g in sorted(groups.items())}
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Float, ForeignKey, Index, String
+from sqlalchemy.dialects.mysql import SMALLINT, TINYINT
+
+from app.core.database import Base
+
+
+class Region(Base):
+    """
+    지역 차원 테이블 (region_dim)
+    - level 1: 시/도 (region_code 11~50), level 2: 시/군/구 (SIG_CD 5자리, parent_code = 시/도 코드)
+    - car_registration_stats.region_code / air_pollution.region_code 가 이 코드를 가리킴
+    """
+
+    __tablename__ = "region_dim"
+
+    region_code = Column(SMALLINT(unsigned=True), primary_key=True, autoincrement=False)
+    level = Column(TINYINT(unsigned=True), nullable=False)
+    parent_code = Column(SMALLINT(unsigned=True), ForeignKey("region_dim.region_code"), nullable=True)
+    name = Column(String(50), nullable=False)
+    lat = Column(Float, nullable=True)
+    lng = Column(Float, nullable=True)
+
+    __table_args__ = (
+        Index("idx_region_dim_level_name", "level", "name"),
+        Index("idx_region_dim_parent", "parent_code"),
+    )
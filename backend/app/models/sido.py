@@ -1,8 +1,7 @@
-from sqlalchemy import Column, String
-from app.core.database import Base
+from app.core.regions import SIDO_LEVEL
+from app.models.region import Region
 
-class Sido(Base):
-    __tablename__ = "regions"  # <-- 실제 테이블명으로 수정
+# 시/도는 region_dim의 level = 1 행 (Sido.level == SIDO_LEVEL 로 걸러서 조회)
+Sido = Region
 
-    code = Column(String(10), primary_key=True, index=True)
-    name = Column(String(50), nullable=False)
\ No newline at end of file
+__all__ = ["Sido", "SIDO_LEVEL"]
@@ -0,0 +1,37 @@
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+
+def find_all_faqs(db: Session) -> list[dict]:
+    """faq_table 전체 (company -> source로 내려줌)"""
+    rows = db.execute(text("""
+        SELECT id, question, answer, company, category
+        FROM faq_table
+        ORDER BY category, id
+    """)).mappings().all()
+    return [
+        {
+            "id": r["id"],
+            "question": r["question"] or "",
+            "answer": r["answer"] or "",
+            "source": r["company"],
+            "category": r["category"],
+        }
+        for r in rows
+    ]
+
+
+def find_faq_signature(db: Session) -> tuple:
+    """
+    FAQ 변경 감지용 (행 수, 최대 id, 내용 체크섬)
+    - 기존 행의 질문/답변/분류만 고쳐도 체크섬이 바뀜 (faq_table에는 수정 시각 컬럼이 없음)
+    - FAQ는 수백 건 수준이라 주기적인 전체 CRC 계산도 가벼움
+    """
+    row = db.execute(text("""
+        SELECT
+            COUNT(*) AS cnt,
+            MAX(id) AS max_id,
+            SUM(CRC32(CONCAT_WS(CHAR(31), id, question, answer, company, category))) AS checksum
+        FROM faq_table
+    """)).mappings().one()
+    return int(row["cnt"] or 0), row["max_id"], int(row["checksum"] or 0)
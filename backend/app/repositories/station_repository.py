@@ -0,0 +1,178 @@
+import math
+from typing import Optional
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from app.core.singleflight import coalesce
+
+# 같은 조건의 동시 조회는 DB 쿼리 하나로 합침 (반환값은 호출자끼리 공유, 수정 금지)
+
+
+@coalesce("stations")
+def find_station_coords(db: Session, station_type: Optional[str] = None) -> list[tuple[float, float]]:
+    """
+    좌표가 있는 충전소의 (위도, 경도) 목록
+    station 테이블 경도 컬럼은 longtitude(오타)
+    """
+    sql = text("""
+        SELECT latitude, longtitude
+        FROM station
+        WHERE latitude IS NOT NULL AND longtitude IS NOT NULL
+          AND (:station_type IS NULL OR type = :station_type)
+    """)
+    rows = db.execute(sql, {"station_type": station_type}).all()
+    return [(float(r[0]), float(r[1])) for r in rows]
+
+
+@coalesce("stations")
+def find_station_points(db: Session) -> list[tuple[int, float, float, Optional[str]]]:
+    """좌표가 있는 충전소 전체의 (id, 위도, 경도, 종류) - 공유 캐시용 (종류 필터는 배열에서)"""
+    sql = text("""
+        SELECT id, latitude, longtitude, type
+        FROM station
+        WHERE latitude IS NOT NULL AND longtitude IS NOT NULL
+    """)
+    rows = db.execute(sql).all()
+    return [(int(r[0]), float(r[1]), float(r[2]), r[3]) for r in rows]
+
+
+@coalesce("stations")
+def find_stations_by_ids(db: Session, ids: tuple[int, ...]) -> dict[int, dict]:
+    """
+    id로 충전소 상세 (지도에 개별 점으로 보일 때 이름/주소용)
+    반환: {id: {"name", "address"}, ...}
+    """
+    if not ids:
+        return {}
+    sql = text("SELECT id, name, address FROM station WHERE id IN :ids").bindparams(
+        bindparam("ids", expanding=True)
+    )
+    rows = db.execute(sql, {"ids": list(ids)}).mappings().all()
+    return {int(r["id"]): {"name": r["name"], "address": r["address"]} for r in rows}
+
+
+@coalesce("stations")
+def find_stations(
+    db: Session,
+    station_type: Optional[str] = None,
+    q: Optional[str] = None,
+    has_coord: bool = True,
+    limit: int = 500,
+) -> list[dict]:
+    """
+    충전소 목록 (최근 등록 순)
+    반환: [{"id", "name", "address", "latitude", "longitude", "type"}, ...] (longtitude 오타 보정)
+    """
+    sql = text("""
+        SELECT id, name, address, latitude, longtitude, type
+        FROM station
+        WHERE (:station_type IS NULL OR type = :station_type)
+          AND (:q IS NULL OR name LIKE :q)
+          AND (:has_coord = 0 OR (latitude IS NOT NULL AND longtitude IS NOT NULL))
+        ORDER BY id DESC
+        LIMIT :limit
+    """)
+    params = {
+        "station_type": station_type or None,
+        "q": f"%{q}%" if q else None,
+        "has_coord": int(has_coord),
+        "limit": limit,
+    }
+    return [_station_row(r) for r in db.execute(sql, params).mappings().all()]
+
+
+@coalesce("stations")
+def find_station_page(
+    db: Session,
+    station_type: Optional[str] = None,
+    q: Optional[str] = None,
+    after_id: Optional[int] = None,
+    limit: int = 50,
+) -> list[dict]:
+    """
+    충전소 목록 한 페이지 (최근 등록 순, keyset: id < after_id)
+    OFFSET 없이 PK 범위로 이어 읽으므로 뒤 페이지도 앞 페이지와 비용이 같음
+    반환: find_stations 와 같은 모양, limit개까지
+    """
+    sql = text("""
+        SELECT id, name, address, latitude, longtitude, type
+        FROM station
+        WHERE (:station_type IS NULL OR type = :station_type)
+          AND (:q IS NULL OR name LIKE :q)
+          AND (:after_id IS NULL OR id < :after_id)
+        ORDER BY id DESC
+        LIMIT :limit
+    """)
+    params = {
+        "station_type": station_type or None,
+        "q": f"%{q}%" if q else None,
+        "after_id": after_id,
+        "limit": limit,
+    }
+    return [_station_row(r) for r in db.execute(sql, params).mappings().all()]
+
+
+@coalesce("stations")
+def find_station_page_near(
+    db: Session,
+    lat: float,
+    lng: float,
+    station_type: Optional[str] = None,
+    q: Optional[str] = None,
+    after: Optional[tuple[float, int]] = None,
+    limit: int = 50,
+) -> list[dict]:
+    """
+    (lat, lng)에서 가까운 순 충전소 한 페이지 (좌표 있는 것만, keyset: (거리, id) > after)
+    거리는 등장방형 근사(m) - 목록 정렬/표시용. 같은 식을 매 페이지 DB에서 계산하므로 커서 값과 정확히 비교됨
+    반환: find_stations 모양 + "distance_m"(float)
+    """
+    sql = text("""
+        SELECT id, name, address, latitude, longtitude, type, distance_m
+        FROM (
+            SELECT id, name, address, latitude, longtitude, type,
+                   6371000 * SQRT(
+                       POW(RADIANS(longtitude - :lng) * :cos_lat, 2) + POW(RADIANS(latitude - :lat), 2)
+                   ) AS distance_m
+            FROM station
+            WHERE latitude IS NOT NULL AND longtitude IS NOT NULL
+              AND (:station_type IS NULL OR type = :station_type)
+              AND (:q IS NULL OR name LIKE :q)
+        ) s
+        WHERE (:after_d IS NULL OR distance_m > :after_d OR (distance_m = :after_d AND id > :after_id))
+        ORDER BY distance_m, id
+        LIMIT :limit
+    """)
+    params = {
+        "lat": lat,
+        "lng": lng,
+        "cos_lat": math.cos(math.radians(lat)),
+        "station_type": station_type or None,
+        "q": f"%{q}%" if q else None,
+        "after_d": after[0] if after else None,
+        "after_id": after[1] if after else None,
+        "limit": limit,
+    }
+    return [
+        {**_station_row(r), "distance_m": float(r["distance_m"])}
+        for r in db.execute(sql, params).mappings().all()
+    ]
+
+
+def _station_row(r) -> dict:
+    return {
+        "id": r["id"],
+        "name": r["name"],
+        "address": r["address"],
+        "latitude": r["latitude"],
+        "longitude": r["longtitude"],
+        "type": r["type"],
+    }
+
+
+@coalesce("stations")
+def find_station_stat_ids(db: Session) -> dict[str, int]:
+    """한국환경공단 충전소 ID(statId) -> station.id (station.stat_id, migrations/0002)"""
+    rows = db.execute(text("SELECT id, stat_id FROM station WHERE stat_id IS NOT NULL")).all()
+    return {str(r[1]): int(r[0]) for r in rows}
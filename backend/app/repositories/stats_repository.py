@@ -0,0 +1,501 @@
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.regions import SIDO_LEVEL, format_region_code
+from app.core.singleflight import coalesce
+
+# 같은 조건의 동시 조회는 DB 쿼리 하나로 합쳐서 결과를 나눠 가짐 (app.core.singleflight)
+# 반환값은 호출자끼리 공유되므로 수정하지 말고 새로 만들어서 쓸 것
+# 지역은 정수 키 region_code (region_dim), 이름이 필요하면 SQL에서 region_dim과 조인
+
+
+@coalesce("stats")
+def find_region_metrics(
+    db: Session,
+    year: Optional[int] = None,
+    car_type: Optional[str] = None,
+    usage: Optional[str] = None,
+) -> dict[str, dict]:
+    """
+    시/도 코드별 지표 (등록대수 합계, 대기오염도)
+
+    - year가 없으면 각 테이블의 최신 연도를 사용한다.
+    - car_type/usage는 등록대수에만 적용된다.
+    - 반환: {"11": {"reg_total": 123, "pollution_degree": 20}, ...}
+    """
+    # 연도 조건은 base_month 범위로 (YEAR(base_month) = ? 는 인덱스를 못 씀)
+    reg_sql = text("""
+        SELECT region_code, SUM(registration_count) AS reg_total
+        FROM car_registration_stats
+        WHERE base_month >= :start AND base_month < :end
+          AND (:vehicle_type IS NULL OR vehicle_type = :vehicle_type)
+          AND (:usage_type IS NULL OR usage_type = :usage_type)
+        GROUP BY region_code
+    """)
+    air_sql = text("""
+        SELECT region_code, pollution_degree
+        FROM air_pollution
+        WHERE year = COALESCE(:year, (SELECT MAX(year) FROM air_pollution))
+    """)
+
+    metrics: dict[str, dict] = {}
+    reg_year = year
+    if reg_year is None:
+        reg_year = db.execute(text("SELECT YEAR(MAX(base_month)) FROM car_registration_stats")).scalar()
+    if reg_year is not None:
+        reg_params = {
+            "start": date(int(reg_year), 1, 1),
+            "end": date(int(reg_year) + 1, 1, 1),
+            "vehicle_type": car_type,
+            "usage_type": usage,
+        }
+        for r in db.execute(reg_sql, reg_params).mappings().all():
+            code = format_region_code(r["region_code"])
+            metrics.setdefault(code, {})["reg_total"] = int(r["reg_total"] or 0)
+
+    for r in db.execute(air_sql, {"year": year}).mappings().all():
+        code = format_region_code(r["region_code"])
+        metrics.setdefault(code, {})["pollution_degree"] = int(r["pollution_degree"] or 0)
+
+    return metrics
+
+
+@coalesce("stats")
+def find_region_summary(
+    db: Session,
+    year: Optional[int] = None,
+    car_type: Optional[str] = None,
+    usage: Optional[str] = None,
+) -> dict:
+    """
+    시/도별 등록대수 합계 + 대기오염도를 DB에서 한 번에 조인 (region_dim 기준, 지역마다 한 줄)
+
+    - year가 없으면 각 테이블의 최신 연도를 사용한다. (실제로 쓴 연도는 reg_year / pollution_year)
+    - car_type/usage는 등록대수에만 적용된다.
+    - 데이터가 없는 지역도 한 줄 (값은 None)
+    - 반환: {"reg_year", "pollution_year", "regions": [{"code", "name", "reg_total", "pollution_degree"}, ...]} (코드 순)
+    """
+    # 연도 조건은 base_month 범위로 (YEAR(base_month) = ? 는 인덱스를 못 씀)
+    sql = text("""
+        SELECT
+            d.region_code,
+            d.name,
+            p.reg_year,
+            r.reg_total,
+            p.pollution_year,
+            a.pollution_degree
+        FROM region_dim d
+        CROSS JOIN (
+            SELECT
+                COALESCE(:year, (SELECT YEAR(MAX(base_month)) FROM car_registration_stats)) AS reg_year,
+                COALESCE(:year, (SELECT MAX(year) FROM air_pollution)) AS pollution_year
+        ) p
+        LEFT JOIN (
+            SELECT s.region_code, SUM(s.registration_count) AS reg_total
+            FROM car_registration_stats s
+            JOIN (
+                SELECT COALESCE(:year, (SELECT YEAR(MAX(base_month)) FROM car_registration_stats)) AS y
+            ) ry ON s.base_month >= MAKEDATE(ry.y, 1) AND s.base_month < MAKEDATE(ry.y + 1, 1)
+            WHERE (:vehicle_type IS NULL OR s.vehicle_type = :vehicle_type)
+              AND (:usage_type IS NULL OR s.usage_type = :usage_type)
+            GROUP BY s.region_code
+        ) r ON r.region_code = d.region_code
+        LEFT JOIN air_pollution a ON a.region_code = d.region_code AND a.year = p.pollution_year
+        WHERE d.level = :level
+        ORDER BY d.region_code
+    """)
+    params = {"year": year, "vehicle_type": car_type, "usage_type": usage, "level": SIDO_LEVEL}
+    rows = db.execute(sql, params).mappings().all()
+    return {
+        "reg_year": int(rows[0]["reg_year"]) if rows and rows[0]["reg_year"] is not None else None,
+        "pollution_year": int(rows[0]["pollution_year"]) if rows and rows[0]["pollution_year"] is not None else None,
+        "regions": [
+            {
+                "code": format_region_code(r["region_code"]),
+                "name": r["name"],
+                "reg_total": int(r["reg_total"]) if r["reg_total"] is not None else None,
+                "pollution_degree": int(r["pollution_degree"]) if r["pollution_degree"] is not None else None,
+            }
+            for r in rows
+        ],
+    }
+
+
+@coalesce("stats")
+def find_yearly_registrations(
+    db: Session,
+    car_type: Optional[str] = None,
+    usage: Optional[str] = None,
+) -> list[dict]:
+    """
+    지역 x 연도 등록대수 합계
+    반환: [{"code": "11", "year": 2024, "reg_total": 123}, ...]
+    """
+    sql = text("""
+        SELECT region_code, YEAR(base_month) AS y, SUM(registration_count) AS reg_total
+        FROM car_registration_stats
+        WHERE (:vehicle_type IS NULL OR vehicle_type = :vehicle_type)
+          AND (:usage_type IS NULL OR usage_type = :usage_type)
+        GROUP BY region_code, YEAR(base_month)
+    """)
+    rows = db.execute(sql, {"vehicle_type": car_type, "usage_type": usage}).mappings().all()
+    return [
+        {
+            "code": format_region_code(r["region_code"]),
+            "year": int(r["y"]),
+            "reg_total": int(r["reg_total"] or 0),
+        }
+        for r in rows
+        if r["y"] is not None
+    ]
+
+
+@coalesce("stats")
+def find_yearly_pollution(db: Session) -> list[dict]:
+    """
+    지역 x 연도 대기오염도
+    반환: [{"code": "11", "year": 2024, "pollution_degree": 20}, ...]
+    """
+    rows = db.execute(
+        text("SELECT year, region_code, pollution_degree FROM air_pollution")
+    ).mappings().all()
+    return [
+        {
+            "code": format_region_code(r["region_code"]),
+            "year": int(r["year"]),
+            "pollution_degree": r["pollution_degree"],
+        }
+        for r in rows
+    ]
+
+
+# -------------------------
+# 기간 단위 집계식 (base_month: 매월 1일 DATE)
+# period: 화면 표시용 라벨, period_start: 기간 시작일
+# -------------------------
+PERIOD_SQL = {
+    "month": (
+        "DATE_FORMAT(base_month, '%Y-%m')",
+        "DATE_FORMAT(base_month, '%Y-%m-01')",
+    ),
+    "quarter": (
+        "CONCAT(YEAR(base_month), '-Q', QUARTER(base_month))",
+        "DATE_FORMAT(MAKEDATE(YEAR(base_month), 1) + INTERVAL (QUARTER(base_month) - 1) QUARTER, '%Y-%m-%d')",
+    ),
+    "year": (
+        "CAST(YEAR(base_month) AS CHAR)",
+        "DATE_FORMAT(MAKEDATE(YEAR(base_month), 1), '%Y-%m-%d')",
+    ),
+}
+
+
+@coalesce("stats")
+def find_registration_series(
+    db: Session,
+    granularity: str = "month",
+    region_code: Optional[int] = None,
+    car_type: Optional[str] = None,
+    usage: Optional[str] = None,
+) -> list[dict]:
+    """
+    지역별 기간 단위 등록대수 합계 (DB에서 집계)
+    반환: [{"code", "name", "period", "period_start", "registration_count"}, ...] (지역, 기간 순)
+    """
+    period_expr, start_expr = PERIOD_SQL[granularity]
+    sql = text(f"""
+        SELECT s.region_code, d.name, s.period, s.period_start, s.registration_count
+        FROM (
+            SELECT
+                region_code,
+                {period_expr} AS period,
+                {start_expr} AS period_start,
+                SUM(registration_count) AS registration_count
+            FROM car_registration_stats
+            WHERE (:region_code IS NULL OR region_code = :region_code)
+              AND (:vehicle_type IS NULL OR vehicle_type = :vehicle_type)
+              AND (:usage_type IS NULL OR usage_type = :usage_type)
+            GROUP BY region_code, period, period_start
+        ) s
+        JOIN region_dim d ON d.region_code = s.region_code
+        ORDER BY d.name, s.period_start
+    """)
+    params = {"region_code": region_code, "vehicle_type": car_type, "usage_type": usage}
+    rows = db.execute(sql, params).mappings().all()
+    return [
+        {
+            "code": format_region_code(r["region_code"]),
+            "name": r["name"],
+            "period": r["period"],
+            "period_start": r["period_start"],
+            "registration_count": int(r["registration_count"] or 0),
+        }
+        for r in rows
+    ]
+
+
+@coalesce("stats")
+def find_regions(db: Session) -> list[dict]:
+    """등록 통계에 나오는 지역 [{"code": "11", "name": "서울특별시"}, ...] (이름 순)"""
+    rows = db.execute(text("""
+        SELECT d.region_code, d.name
+        FROM region_dim d
+        WHERE EXISTS (SELECT 1 FROM car_registration_stats r WHERE r.region_code = d.region_code)
+        ORDER BY d.name
+    """)).mappings().all()
+    return [{"code": format_region_code(r["region_code"]), "name": r["name"]} for r in rows]
+
+
+@coalesce("stats")
+def find_filter_values(db: Session) -> dict:
+    """등록 통계의 연도/차종/용도 목록 (NULL 제외)"""
+    years = db.execute(
+        text("SELECT DISTINCT YEAR(base_month) AS y FROM car_registration_stats ORDER BY y")
+    ).mappings().all()
+    car_types = db.execute(
+        text("SELECT DISTINCT vehicle_type AS v FROM car_registration_stats ORDER BY v")
+    ).mappings().all()
+    usages = db.execute(
+        text("SELECT DISTINCT usage_type AS u FROM car_registration_stats ORDER BY u")
+    ).mappings().all()
+    return {
+        "years": [row["y"] for row in years if row["y"] is not None],
+        "car_types": [row["v"] for row in car_types if row["v"] is not None],
+        "usages": [row["u"] for row in usages if row["u"] is not None],
+    }
+
+
+# 등록 통계를 나눌 수 있는 차원 (region: region_code + region_dim 이름)
+REGISTRATION_DIMENSIONS = ("region", "vehicle_type", "usage_type")
+
+
+@coalesce("stats")
+def find_registration_totals(
+    db: Session,
+    granularity: str = "month",
+    group_by: tuple[str, ...] = REGISTRATION_DIMENSIONS,
+    year: Optional[int] = None,
+    from_month: Optional[date] = None,
+    to_month: Optional[date] = None,
+    region_code: Optional[int] = None,
+    car_type: Optional[str] = None,
+    usage: Optional[str] = None,
+) -> list[dict]:
+    """
+    기간 단위(month | quarter | year | total) x group_by 차원별 등록대수 합계 (DB에서 집계)
+
+    - from_month/to_month: 해당 월 1일 (양끝 포함)
+    - total이면 기간 없이 전체 범위를 한 줄로
+    - 반환: [{"period"?, "period_start"?, "region_code"?, "region_name"?, "vehicle_type"?, "usage_type"?,
+             "registration_count"}, ...] (group_by에 없는 차원/기간은 키 없음, 기간 -> 지역 이름 -> 차종 -> 용도 순)
+    """
+    if granularity != "total" and granularity not in PERIOD_SQL:
+        raise ValueError(f"unknown granularity: {granularity}")
+    unknown = set(group_by) - set(REGISTRATION_DIMENSIONS)
+    if unknown:
+        raise ValueError(f"unknown group_by: {', '.join(sorted(unknown))}")
+
+    inner, outer, order = [], [], []
+    if granularity != "total":
+        period_expr, start_expr = PERIOD_SQL[granularity]
+        inner += [f"{period_expr} AS period", f"{start_expr} AS period_start"]
+        outer += ["s.period", "s.period_start"]
+        order.append("s.period_start")
+    if "region" in group_by:
+        inner.append("region_code")
+        outer += ["s.region_code", "d.name AS region_name"]
+        order.append("d.name")
+    for dim in ("vehicle_type", "usage_type"):
+        if dim in group_by:
+            inner.append(dim)
+            outer.append(f"s.{dim}")
+            order.append(f"s.{dim}")
+
+    keys = [c.rsplit(" AS ", 1)[-1] for c in inner]
+    sql = text(f"""
+        SELECT {", ".join(outer + ["s.registration_count"])}
+        FROM (
+            SELECT {", ".join(inner + ["SUM(registration_count) AS registration_count"])}
+            FROM car_registration_stats
+            WHERE (:year IS NULL OR (base_month >= MAKEDATE(:year, 1) AND base_month < MAKEDATE(:year + 1, 1)))
+              AND (:from_month IS NULL OR base_month >= :from_month)
+              AND (:to_month IS NULL OR base_month <= :to_month)
+              AND (:region_code IS NULL OR region_code = :region_code)
+              AND (:vehicle_type IS NULL OR vehicle_type = :vehicle_type)
+              AND (:usage_type IS NULL OR usage_type = :usage_type)
+            {"GROUP BY " + ", ".join(keys) if keys else ""}
+        ) s
+        {"JOIN region_dim d ON d.region_code = s.region_code" if "region" in group_by else ""}
+        {"ORDER BY " + ", ".join(order) if order else ""}
+    """)
+    params = {
+        "year": year,
+        "from_month": from_month,
+        "to_month": to_month,
+        "region_code": region_code,
+        "vehicle_type": car_type,
+        "usage_type": usage,
+    }
+    return [dict(r) for r in db.execute(sql, params).mappings().all()]
+
+
+# 점유율 순위에 쓰는 무공해 차종 (vehicle_type 값)
+SHARE_VEHICLE_TYPES = ("EV", "H2")
+
+
+@coalesce("stats")
+def find_latest_month(db: Session, year: Optional[int] = None) -> Optional[date]:
+    """등록 통계의 마지막 월 (year가 있으면 그 해 안에서, 없으면 전체)"""
+    row = db.execute(text("""
+        SELECT MAX(base_month) AS m
+        FROM car_registration_stats
+        WHERE (:year IS NULL OR (base_month >= MAKEDATE(:year, 1) AND base_month < MAKEDATE(:year + 1, 1)))
+    """), {"year": year}).mappings().first()
+    return row["m"] if row else None
+
+
+@coalesce("stats")
+def find_region_rankings(
+    db: Session,
+    month: date,
+    car_type: Optional[str] = None,
+    usage: Optional[str] = None,
+) -> list[dict]:
+    """
+    시/도별 성장률/점유율과 지표별 순위 (윈도 함수로 DB에서 계산)
+
+    - month: 기준 월(1일). 연 지표는 그 해 1월~기준 월(연초 누계), 월 지표는 그 달 기준
+    - yoy_growth: 기준 연도 1월~기준 월 합계 / 전년 같은 기간(1월~같은 월) 합계 - 1
+      (LAG, 전년 데이터가 없으면 None. 최신 월이 연중이어도 12개월 전체와 비교하지 않음)
+    - mom_growth: 기준 월 / 전월 - 1
+    - ev_share / h2_share: 기준 연도 1월~기준 월 등록 중 EV / H2 비율 (car_type 무시, usage는 적용)
+    - *_rank: 값이 큰 순 RANK() (None은 맨 뒤)
+    - 반환: [{"code", "name", "year_total", "prev_year_total", "yoy_growth", "yoy_rank",
+             "month_total", "prev_month_total", "mom_growth", "mom_rank",
+             "all_total", "ev_total", "h2_total", "ev_share", "ev_share_rank", "h2_share", "h2_share_rank"}, ...]
+    """
+    # WITH 대신 파생 테이블로 작성 (맨 앞 SELECT에 실행 시간 힌트가 붙도록, app.core.query_guard)
+    sql = text("""
+        SELECT
+            r.*,
+            RANK() OVER (ORDER BY r.yoy_growth IS NULL, r.yoy_growth DESC) AS yoy_rank,
+            RANK() OVER (ORDER BY r.mom_growth IS NULL, r.mom_growth DESC) AS mom_rank,
+            RANK() OVER (ORDER BY r.ev_share IS NULL, r.ev_share DESC) AS ev_share_rank,
+            RANK() OVER (ORDER BY r.h2_share IS NULL, r.h2_share DESC) AS h2_share_rank
+        FROM (
+            SELECT
+                d.region_code,
+                d.name,
+                yr.total AS year_total,
+                yr.prev_total AS prev_year_total,
+                (yr.total - yr.prev_total) / NULLIF(yr.prev_total, 0) AS yoy_growth,
+                mo.total AS month_total,
+                mo.prev_total AS prev_month_total,
+                (mo.total - mo.prev_total) / NULLIF(mo.prev_total, 0) AS mom_growth,
+                sh.all_total,
+                sh.ev_total,
+                sh.h2_total,
+                sh.ev_total / NULLIF(sh.all_total, 0) AS ev_share,
+                sh.h2_total / NULLIF(sh.all_total, 0) AS h2_share
+            FROM region_dim d
+            LEFT JOIN (
+                SELECT
+                    region_code, y, total,
+                    CASE WHEN LAG(y) OVER w = y - 1 THEN LAG(total) OVER w END AS prev_total
+                FROM (
+                    SELECT region_code, YEAR(base_month) AS y, SUM(registration_count) AS total
+                    FROM car_registration_stats
+                    WHERE ((base_month >= :prev_year_start AND base_month <= :prev_year_month)
+                           OR (base_month >= :year_start AND base_month <= :month))
+                      AND (:vehicle_type IS NULL OR vehicle_type = :vehicle_type)
+                      AND (:usage_type IS NULL OR usage_type = :usage_type)
+                    GROUP BY region_code, YEAR(base_month)
+                ) t
+                WINDOW w AS (PARTITION BY region_code ORDER BY y)
+            ) yr ON yr.region_code = d.region_code AND yr.y = :year
+            LEFT JOIN (
+                SELECT
+                    region_code, base_month, total,
+                    CASE WHEN LAG(base_month) OVER w = :prev_month THEN LAG(total) OVER w END AS prev_total
+                FROM (
+                    SELECT region_code, base_month, SUM(registration_count) AS total
+                    FROM car_registration_stats
+                    WHERE base_month >= :prev_month AND base_month <= :month
+                      AND (:vehicle_type IS NULL OR vehicle_type = :vehicle_type)
+                      AND (:usage_type IS NULL OR usage_type = :usage_type)
+                    GROUP BY region_code, base_month
+                ) t
+                WINDOW w AS (PARTITION BY region_code ORDER BY base_month)
+            ) mo ON mo.region_code = d.region_code AND mo.base_month = :month
+            LEFT JOIN (
+                SELECT
+                    region_code,
+                    SUM(registration_count) AS all_total,
+                    SUM(CASE WHEN vehicle_type = :ev_type THEN registration_count ELSE 0 END) AS ev_total,
+                    SUM(CASE WHEN vehicle_type = :h2_type THEN registration_count ELSE 0 END) AS h2_total
+                FROM car_registration_stats
+                WHERE base_month >= :year_start AND base_month <= :month
+                  AND (:usage_type IS NULL OR usage_type = :usage_type)
+                GROUP BY region_code
+            ) sh ON sh.region_code = d.region_code
+            WHERE d.level = :level
+        ) r
+        ORDER BY r.region_code
+    """)
+    prev_month = date(month.year - 1, 12, 1) if month.month == 1 else date(month.year, month.month - 1, 1)
+    ev_type, h2_type = SHARE_VEHICLE_TYPES
+    params = {
+        "year": month.year,
+        "month": month,
+        "prev_month": prev_month,
+        "year_start": date(month.year, 1, 1),
+        "prev_year_start": date(month.year - 1, 1, 1),
+        "prev_year_month": date(month.year - 1, month.month, 1),
+        "vehicle_type": car_type,
+        "usage_type": usage,
+        "ev_type": ev_type,
+        "h2_type": h2_type,
+        "level": SIDO_LEVEL,
+    }
+
+    def num(v, cast=float):
+        return cast(v) if v is not None else None
+
+    rows = db.execute(sql, params).mappings().all()
+    return [
+        {
+            "code": format_region_code(r["region_code"]),
+            "name": r["name"],
+            "year_total": num(r["year_total"], int),
+            "prev_year_total": num(r["prev_year_total"], int),
+            "yoy_growth": num(r["yoy_growth"]),
+            "yoy_rank": int(r["yoy_rank"]),
+            "month_total": num(r["month_total"], int),
+            "prev_month_total": num(r["prev_month_total"], int),
+            "mom_growth": num(r["mom_growth"]),
+            "mom_rank": int(r["mom_rank"]),
+            "all_total": num(r["all_total"], int),
+            "ev_total": num(r["ev_total"], int),
+            "h2_total": num(r["h2_total"], int),
+            "ev_share": num(r["ev_share"]),
+            "ev_share_rank": int(r["ev_share_rank"]),
+            "h2_share": num(r["h2_share"]),
+            "h2_share_rank": int(r["h2_share_rank"]),
+        }
+        for r in rows
+    ]
+
+
+@coalesce("stats")
+def find_air_pollution(db: Session, year: Optional[int] = None) -> list[dict]:
+    """반환: [{"year", "region_code", "region_name", "pollution_degree"}, ...] (연도, 지역 순)"""
+    sql = text("""
+        SELECT a.year, a.region_code, d.name AS region_name, a.pollution_degree
+        FROM air_pollution a
+        LEFT JOIN region_dim d ON d.region_code = a.region_code
+        WHERE (:year IS NULL OR a.year = :year)
+        ORDER BY a.year, a.region_code
+    """)
+    return [dict(r) for r in db.execute(sql, {"year": year}).mappings().all()]
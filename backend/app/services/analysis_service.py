@@ -0,0 +1,144 @@
+from typing import Optional
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache
+from app.core.data_version import get_data_version
+from app.core.regions import REGION_CODE_TO_NAME
+from app.repositories.stats_repository import find_yearly_pollution, find_yearly_registrations
+
+# -------------------------
+# 등록대수 <-> 대기오염도 상관 분석
+# - 지역 x 연도 행렬 두 개(등록대수 R, 오염도 P)를 만들고
+#   시차(lag) 0..N 을 한 축으로 쌓아서 Pearson/Spearman을 한 번에 계산
+# - lag k: k년 전 등록대수와 올해 오염도의 상관
+# - 결과는 데이터 버전별로 캐시
+# -------------------------
+MIN_PAIRS = 3
+
+_cache = LRUCache(64)
+
+
+def _pearson(x: np.ndarray, y: np.ndarray, mask: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """마지막 축 기준 Pearson r (mask=False인 칸은 제외). 반환: (r, 표본 수)"""
+    n = mask.sum(axis=-1)
+    safe_n = np.maximum(n, 1)
+    xm = np.where(mask, x, 0.0).sum(axis=-1) / safe_n
+    ym = np.where(mask, y, 0.0).sum(axis=-1) / safe_n
+    dx = np.where(mask, x - xm[..., None], 0.0)
+    dy = np.where(mask, y - ym[..., None], 0.0)
+
+    cov = (dx * dy).sum(axis=-1)
+    denom = np.sqrt((dx ** 2).sum(axis=-1) * (dy ** 2).sum(axis=-1))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        r = np.where((n >= MIN_PAIRS) & (denom > 0), cov / denom, np.nan)
+    return r, n
+
+
+def _rank(x: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """
+    마지막 축 기준 평균 순위 (동점은 평균 순위, mask=False인 값은 비교에서 제외)
+    연도 축이 짧아서 (T x T) 비교 텐서를 만들어도 부담이 없다.
+    """
+    xi = x[..., :, None]
+    xj = x[..., None, :]
+    valid_j = mask[..., None, :]
+    less = ((xj < xi) & valid_j).sum(axis=-1)
+    equal = ((xj == xi) & valid_j).sum(axis=-1)
+    return np.where(mask, less + (equal + 1) / 2.0, np.nan)
+
+
+def build_yearly_matrices(reg_rows: list[dict], air_rows: list[dict]):
+    """
+    연도 축은 최소~최대 연도를 빠짐없이 (없는 연도는 NaN 열)
+    -> 열 간격 = 연도 간격이라 시차 k칸 이동이 곧 k년 (중간 연도가 빠져도 다른 해와 짝지어지지 않음)
+    """
+    codes = sorted({r["code"] for r in reg_rows} | {r["code"] for r in air_rows})
+    present = {r["year"] for r in reg_rows} | {r["year"] for r in air_rows}
+    years = list(range(min(present), max(present) + 1)) if present else []
+    code_idx = {c: i for i, c in enumerate(codes)}
+    year_idx = {y: i for i, y in enumerate(years)}
+
+    R = np.full((len(codes), len(years)), np.nan)
+    P = np.full((len(codes), len(years)), np.nan)
+    for r in reg_rows:
+        R[code_idx[r["code"]], year_idx[r["year"]]] = r["reg_total"]
+    for r in air_rows:
+        if r["pollution_degree"] is not None:
+            P[code_idx[r["code"]], year_idx[r["year"]]] = r["pollution_degree"]
+    return codes, years, R, P
+
+
+def compute_correlations(R: np.ndarray, P: np.ndarray, max_lag: int) -> dict:
+    """
+    R, P: (지역, 연도) 행렬 (결측 NaN)
+    마지막 행에 전국(등록 합계 / 오염도 평균)을 붙이고, 시차별로 정렬한 뒤 한 번에 계산한다.
+    반환: {"pearson": (L+1, 지역+1), "spearman": ..., "n": ...}
+    """
+    reg_cnt = (~np.isnan(R)).sum(axis=0)
+    air_cnt = (~np.isnan(P)).sum(axis=0)
+    nat_R = np.where(reg_cnt > 0, np.nansum(R, axis=0), np.nan)
+    nat_P = np.where(air_cnt > 0, np.nansum(P, axis=0) / np.maximum(air_cnt, 1), np.nan)
+    X = np.vstack([R, nat_R])
+    Y = np.vstack([P, nat_P])
+
+    rows, T = X.shape
+    lags = max_lag + 1
+    XL = np.full((lags, rows, T), np.nan)
+    YL = np.full((lags, rows, T), np.nan)
+    for lag in range(min(lags, T)):
+        XL[lag, :, : T - lag] = X[:, : T - lag]
+        YL[lag, :, : T - lag] = Y[:, lag:]
+
+    mask = ~np.isnan(XL) & ~np.isnan(YL)
+    pearson, n = _pearson(XL, YL, mask)
+    spearman, _ = _pearson(_rank(XL, mask), _rank(YL, mask), mask)
+    return {"pearson": pearson, "spearman": spearman, "n": n}
+
+
+def _num(v) -> Optional[float]:
+    return None if np.isnan(v) else round(float(v), 4)
+
+
+def get_correlation(
+    db: Session,
+    car_type: Optional[str] = None,
+    usage: Optional[str] = None,
+    max_lag: int = 3,
+) -> dict:
+    version = get_data_version(db)
+    key = (version, car_type, usage, max_lag)
+    cached = _cache.get(key)
+    if cached is not None:
+        return cached
+
+    codes, years, R, P = build_yearly_matrices(
+        find_yearly_registrations(db, car_type, usage),
+        find_yearly_pollution(db),
+    )
+    result = compute_correlations(R, P, max_lag)
+
+    def series(row: int) -> list[dict]:
+        return [
+            {
+                "lag": lag,
+                "pearson": _num(result["pearson"][lag, row]),
+                "spearman": _num(result["spearman"][lag, row]),
+                "n": int(result["n"][lag, row]),
+            }
+            for lag in range(max_lag + 1)
+        ]
+
+    payload = {
+        "filters": {"car_type": car_type, "usage": usage, "max_lag": max_lag},
+        "data_version": version,
+        "years": years,
+        "national": series(len(codes)),
+        "regions": [
+            {"region": {"code": c, "name": REGION_CODE_TO_NAME.get(c, c)}, "correlations": series(i)}
+            for i, c in enumerate(codes)
+        ],
+    }
+    _cache.set(key, payload)
+    return payload
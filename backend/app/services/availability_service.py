@@ -0,0 +1,448 @@
+import asyncio
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from array import array
+from collections import deque
+from pathlib import Path
+from typing import Optional
+
+from app.core.cache import read_bytes, write_bytes_atomic
+from app.core.config import (
+    AVAILABILITY_FOLLOW_SEC,
+    AVAILABILITY_HISTORY,
+    AVAILABILITY_POLL_SEC,
+    AVAILABILITY_SHARED_DIR,
+    AVAILABILITY_SHARED_POLLER,
+    AVAILABILITY_SOURCE,
+)
+from app.core.data_version import get_data_version
+from app.core.database import ReadSessionLocal
+from app.core.serialization import dumps_json
+from app.repositories.station_repository import find_station_stat_ids, find_stations
+from app.services.charger_status_source import (
+    AVAILABLE,
+    CHARGING,
+    ChargerStatus,
+    KecoStatusSource,
+    MockStatusSource,
+)
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: 공유 폴러 없이 워커마다 폴링
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# -------------------------
+# 충전기 실시간 상태
+# - 폴러(워커당 하나, asyncio 태스크)가 상태 소스(KECO / mock)를 주기적으로 읽어 상태 저장소에 반영
+# - 저장소는 충전기 한 대당 상태 1바이트 + 갱신 시각 4바이트 배열, 충전소별 요약(가능/충전 중/불가/전체)은
+#   바뀐 충전기만큼만 증감 -> 요약이 실제로 바뀐 충전소만 변경분(delta)으로 모음
+# - 변경분은 순번(seq)을 붙여 최근 AVAILABILITY_HISTORY개를 보관하고, SSE 구독자 큐로 바로 보냄
+#   (재접속 시 Last-Event-ID 이후를 다시 보내고, 너무 오래됐으면 전체 스냅샷)
+# - 충전소 ID(KECO statId) -> station.id 매핑은 station.stat_id 컬럼 (migrations/0002), 데이터 버전이 바뀌면 다시 읽음
+# - 순번은 워커(프로세스)마다 따로 세므로 이벤트 id는 "EPOCH-seq" (EPOCH: pid + 시작 시 난수)
+#   재접속이 다른 워커로 가서 EPOCH가 다르면 이어 보내지 않고 스냅샷부터
+# - 공유 폴러(AVAILABILITY_SHARED_POLLER): 잠금을 잡은 워커 하나만 소스를 읽고 전체 충전기 상태를 파일로 내려 두면
+#   나머지 워커는 그 파일을 자기 저장소에 반영 (변경분/순번은 워커별로 같은 방식으로 계산)
+# -------------------------
+_NO_STATION = 0xFFFFFFFF
+
+EPOCH = f"{os.getpid():x}{secrets.token_hex(3)}"
+
+
+def event_id(seq: int) -> str:
+    return f"{EPOCH}-{seq}"
+
+
+def parse_event_id(value: Optional[str]) -> Optional[int]:
+    """Last-Event-ID -> 이 워커의 순번 (다른 워커/이전 프로세스가 준 id거나 이상하면 None -> 스냅샷)"""
+    epoch, _, seq = (value or "").rpartition("-")
+    if epoch != EPOCH or not seq.isdigit():
+        return None
+    return int(seq)
+
+
+class AvailabilityStore:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._charger_index: dict[tuple[str, str], int] = {}
+        self._charger_station = array("I")   # 충전기 -> 충전소 번호
+        self._status = bytearray()           # 충전기 상태 코드
+        self._updated = array("I")           # 충전기 상태 갱신 시각 (epoch 초)
+
+        self._station_index: dict[str, int] = {}
+        self._stat_ids: list[str] = []
+        self._available = array("H")
+        self._charging = array("H")
+        self._total = array("H")
+        self._station_updated = array("I")
+        self._station_ids = array("I")        # 충전소 번호 -> station.id (_NO_STATION이면 매핑 없음)
+        self._mapping: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._status)
+
+    @property
+    def station_count(self) -> int:
+        return len(self._stat_ids)
+
+    def _station_slot(self, stat_id: str) -> int:
+        slot = self._station_index.get(stat_id)
+        if slot is None:
+            slot = len(self._stat_ids)
+            self._station_index[stat_id] = slot
+            self._stat_ids.append(stat_id)
+            for arr in (self._available, self._charging, self._total):
+                arr.append(0)
+            self._station_updated.append(0)
+            self._station_ids.append(self._mapping.get(stat_id, _NO_STATION))
+        return slot
+
+    def _count(self, slot: int, status: int, delta: int) -> None:
+        if status == AVAILABLE:
+            self._available[slot] += delta
+        elif status == CHARGING:
+            self._charging[slot] += delta
+
+    def set_mapping(self, mapping: dict[str, int]) -> None:
+        """statId -> station.id (이미 있는 충전소에도 다시 적용)"""
+        with self._lock:
+            self._mapping = dict(mapping)
+            for stat_id, slot in self._station_index.items():
+                self._station_ids[slot] = self._mapping.get(stat_id, _NO_STATION)
+
+    def apply(self, statuses: list[ChargerStatus]) -> list[dict]:
+        """상태 반영 -> 요약이 바뀐 충전소의 현재 요약 목록 (변경분)"""
+        touched: dict[int, tuple[int, int, int]] = {}
+        with self._lock:
+            for s in statuses:
+                slot = self._station_slot(s.stat_id)
+                if slot not in touched:
+                    touched[slot] = (self._available[slot], self._charging[slot], self._total[slot])
+
+                row = self._charger_index.get((s.stat_id, s.charger_id))
+                if row is None:
+                    self._charger_index[(s.stat_id, s.charger_id)] = len(self._status)
+                    self._charger_station.append(slot)
+                    self._status.append(s.status)
+                    self._updated.append(s.updated_at)
+                    self._total[slot] += 1
+                    self._count(slot, s.status, 1)
+                else:
+                    # 같은 충전기의 더 오래된 상태가 늦게 와도 덮어쓰지 않음
+                    if s.updated_at < self._updated[row]:
+                        continue
+                    self._count(slot, self._status[row], -1)
+                    self._count(slot, s.status, 1)
+                    self._status[row] = s.status
+                    self._updated[row] = s.updated_at
+                self._station_updated[slot] = max(self._station_updated[slot], s.updated_at)
+
+            return [
+                self._summary(slot)
+                for slot, before in touched.items()
+                if before != (self._available[slot], self._charging[slot], self._total[slot])
+            ]
+
+    def _summary(self, slot: int) -> dict:
+        station_id = self._station_ids[slot]
+        total, available, charging = self._total[slot], self._available[slot], self._charging[slot]
+        return {
+            "stat_id": self._stat_ids[slot],
+            "station_id": None if station_id == _NO_STATION else station_id,
+            "available": available,
+            "charging": charging,
+            "unavailable": total - available - charging,
+            "total": total,
+            "updated_at": self._station_updated[slot],
+        }
+
+    def snapshot(self, station_ids: Optional[set[int]] = None) -> list[dict]:
+        with self._lock:
+            if station_ids is None:
+                return [self._summary(slot) for slot in range(len(self._stat_ids))]
+            return [
+                self._summary(slot)
+                for slot in range(len(self._stat_ids))
+                if self._station_ids[slot] in station_ids
+            ]
+
+    def charger_statuses(self) -> list[ChargerStatus]:
+        """저장소의 충전기 전체 현재 상태 (공유 폴러가 파일로 내려 둘 때)"""
+        with self._lock:
+            return [
+                ChargerStatus(stat_id, charger_id, self._status[row], self._updated[row])
+                for (stat_id, charger_id), row in self._charger_index.items()
+            ]
+
+    def nbytes(self) -> int:
+        arrays = (self._charger_station, self._updated, self._available, self._charging, self._total,
+                  self._station_updated, self._station_ids)
+        return len(self._status) + sum(a.itemsize * len(a) for a in arrays)
+
+
+class Subscriber:
+    """SSE 연결 하나. 큐가 넘치면(느린 클라이언트) resync만 표시하고 다음에 스냅샷을 보냄"""
+
+    def __init__(self, station_ids: Optional[set[int]], maxsize: int = 64):
+        self.station_ids = station_ids
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.resync = False
+
+    def wants(self, change: dict) -> bool:
+        return self.station_ids is None or change["station_id"] in self.station_ids
+
+    def offer(self, seq: int, changes: list[dict]) -> None:
+        if self.resync:
+            return
+        picked = [c for c in changes if self.wants(c)]
+        if not picked:
+            return
+        try:
+            self.queue.put_nowait((seq, picked))
+        except asyncio.QueueFull:
+            # 쌓인 변경분은 버리고 스냅샷 표시 하나만 남김
+            self.resync = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait((seq, None))
+
+
+class AvailabilityHub:
+    """변경분 순번 + 최근 이력 + 구독자 (이벤트 루프 안에서만 사용)"""
+
+    def __init__(self, history: int = AVAILABILITY_HISTORY):
+        self.seq = 0
+        self.history: deque = deque(maxlen=history)
+        self.subscribers: set[Subscriber] = set()
+
+    def publish(self, changes: list[dict]) -> int:
+        if not changes:
+            return self.seq
+        self.seq += 1
+        self.history.append((self.seq, changes))
+        for sub in list(self.subscribers):
+            sub.offer(self.seq, changes)
+        return self.seq
+
+    def since(self, seq: int) -> Optional[list[tuple[int, list[dict]]]]:
+        """seq 이후 변경분. 이력에서 이미 밀려났거나 seq가 이상하면 None (스냅샷을 보내야 함)"""
+        if seq == self.seq:
+            return []
+        if seq > self.seq or not self.history or self.history[0][0] > seq + 1:
+            return None
+        return [(s, changes) for s, changes in self.history if s > seq]
+
+    def subscribe(self, station_ids: Optional[set[int]] = None) -> Subscriber:
+        sub = Subscriber(station_ids)
+        self.subscribers.add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscriber) -> None:
+        self.subscribers.discard(sub)
+
+
+class SharedFeed:
+    """
+    워커 사이 폴러 하나
+    - is_leader(): 잠금 파일을 flock(LOCK_NB)으로 잡은 워커가 리더 (잡으면 프로세스가 끝날 때까지 유지)
+    - 리더는 write()로 전체 상태를 원자적으로 교체, 나머지는 read_new()로 바뀐 파일만 읽음
+    """
+
+    def __init__(self, directory: Path):
+        self.path = directory / "availability.json"
+        self.lock_path = directory / "availability.lock"
+        self._lock_file = None
+        self._read_mtime: Optional[int] = None
+
+    def is_leader(self) -> bool:
+        if fcntl is None or self._lock_file is not None:
+            return True
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        f = open(self.lock_path, "a+b")
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            f.close()
+            return False
+        self._lock_file = f
+        return True
+
+    def write(self, statuses: list[ChargerStatus]) -> None:
+        write_bytes_atomic(self.path, dumps_json({"written_at": time.time(), "statuses": [tuple(x) for x in statuses]}))
+
+    def read_new(self) -> Optional[list[ChargerStatus]]:
+        try:
+            mtime = self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        if mtime == self._read_mtime:
+            return None
+        raw = read_bytes(self.path)
+        if not raw:
+            return None
+        self._read_mtime = mtime
+        return [ChargerStatus(*row) for row in json.loads(raw)["statuses"]]
+
+    def close(self) -> None:
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+
+class AvailabilityPoller:
+    def __init__(
+        self,
+        store: AvailabilityStore,
+        hub: AvailabilityHub,
+        source_name: str,
+        interval: float,
+        feed: Optional[SharedFeed] = None,
+        follow_interval: float = AVAILABILITY_FOLLOW_SEC,
+    ):
+        self.store = store
+        self.hub = hub
+        self.source_name = source_name
+        self.interval = interval
+        self.feed = feed
+        self.follow_interval = follow_interval
+        self.leader = feed is None
+        self.source = None
+        self._data_version: Optional[str] = None
+        self.polls = 0
+        self.errors = 0
+        self.last_poll_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.last_changes = 0
+
+    def _refresh_mapping(self) -> None:
+        """데이터 버전이 바뀌었으면 statId -> station.id 매핑을 다시 읽음"""
+        db = ReadSessionLocal()
+        try:
+            version = get_data_version(db)
+            if version == self._data_version and (self.source is not None or not self.leader):
+                return
+            try:
+                mapping = find_station_stat_ids(db)
+            except Exception as e:
+                # stat_id 컬럼이 아직 없으면 (0002 미적용) 매핑 없이 statId로만
+                logger.warning("station stat_id mapping unavailable: %s", e)
+                db.rollback()
+                mapping = {}
+
+            if self.source_name == "mock" and not mapping:
+                # 로컬 개발: 최근 충전소에 가짜 statId를 붙여서 화면 배지까지 확인 가능하게 (리더/팔로워 같은 매핑)
+                mapping = {f"MOCK{s['id']:08d}": s["id"] for s in find_stations(db, limit=5000)}
+            if self.source is None and self.leader:
+                # 팔로워는 소스를 읽지 않음 (리더가 되면 그때 만듦)
+                self.source = MockStatusSource(sorted(mapping)) if self.source_name == "mock" else KecoStatusSource()
+
+            self.store.set_mapping(mapping)
+            self._data_version = version
+        finally:
+            db.close()
+
+    def poll_once(self) -> list[dict]:
+        """한 번 읽고 반영 (스레드에서 호출) -> 변경분"""
+        if not self.leader and self.feed.is_leader():
+            logger.info("availability poller: became leader (pid %s)", os.getpid())
+            self.leader = True
+            self._data_version = None  # 소스를 만들도록 매핑부터 다시
+        self._refresh_mapping()
+
+        if not self.leader:
+            statuses = self.feed.read_new()
+            return self.store.apply(statuses) if statuses else []
+
+        changes = self.store.apply(self.source.fetch())
+        if self.feed is not None and (changes or not self.feed.path.exists()):
+            self.feed.write(self.store.charger_statuses())
+        return changes
+
+    async def run(self) -> None:
+        while True:
+            started = time.monotonic()
+            try:
+                changes = await asyncio.to_thread(self.poll_once)
+                self.hub.publish(changes)
+                self.last_changes = len(changes)
+                self.last_error = None
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                self.last_error = str(e)
+                logger.warning("availability poll failed: %s", e)
+            self.polls += 1
+            self.last_poll_at = time.time()
+            interval = self.interval if self.leader else min(self.interval, self.follow_interval)
+            await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+    def status(self) -> dict:
+        return {
+            "source": self.source_name,
+            "role": "leader" if self.leader else "follower",
+            "epoch": EPOCH,
+            "interval_sec": self.interval,
+            "polls": self.polls,
+            "errors": self.errors,
+            "last_poll_at": self.last_poll_at,
+            "last_changes": self.last_changes,
+            "last_error": self.last_error,
+        }
+
+
+store = AvailabilityStore()
+hub = AvailabilityHub()
+_poller: Optional[AvailabilityPoller] = None
+
+
+def availability_enabled() -> bool:
+    return AVAILABILITY_SOURCE in ("keco", "mock")
+
+
+def start_availability() -> Optional[asyncio.Task]:
+    """lifespan에서 호출 - 소스가 꺼져 있으면 None"""
+    global _poller
+    if not availability_enabled():
+        return None
+    feed = SharedFeed(AVAILABILITY_SHARED_DIR) if AVAILABILITY_SHARED_POLLER else None
+    _poller = AvailabilityPoller(store, hub, AVAILABILITY_SOURCE, AVAILABILITY_POLL_SEC, feed)
+    return asyncio.create_task(_poller.run())
+
+
+def parse_station_ids(value: Optional[str]) -> Optional[set[int]]:
+    """'1,2,3' -> {1, 2, 3} (없으면 전체)"""
+    if not value:
+        return None
+    try:
+        return {int(v) for v in value.split(",") if v.strip()}
+    except ValueError:
+        raise ValueError(f"invalid ids (comma separated station ids): {value}")
+
+
+def get_availability(station_ids: Optional[set[int]] = None) -> dict:
+    return {
+        "enabled": availability_enabled(),
+        "seq": event_id(hub.seq),
+        "stations": store.snapshot(station_ids),
+    }
+
+
+def get_availability_status() -> dict:
+    return {
+        "enabled": availability_enabled(),
+        "poller": _poller.status() if _poller is not None else None,
+        "chargers": len(store),
+        "stations": store.station_count,
+        "store_bytes": store.nbytes(),
+        "seq": hub.seq,
+        "history": len(hub.history),
+        "subscribers": len(hub.subscribers),
+    }
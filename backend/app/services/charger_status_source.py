@@ -0,0 +1,169 @@
+import json
+import random
+import time
+import urllib.parse
+import urllib.request
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple, Optional
+
+from app.core.config import (
+    KECO_INFO_URL,
+    KECO_PAGE_SIZE,
+    KECO_PERIOD_MIN,
+    KECO_SERVICE_KEY,
+    KECO_STATUS_URL,
+    KECO_TIMEOUT_SEC,
+)
+
+# -------------------------
+# 충전기 상태 소스
+# - KecoStatusSource: 한국환경공단 전기자동차 충전기 API
+#   처음에는 충전기 정보 API(getChargerInfo, 기간 없이)로 전체 충전기의 현재 상태를 받고,
+#   이후에는 상태 API(getChargerStatus)가 최근 KECO_PERIOD_MIN분 안에 바뀐 충전기만 내려주므로 매 폴링이 곧 변경분
+#   (변경분만으로 시작하면 최근에 바뀐 충전기만 세어져서 충전기 8대인 충전소가 "1/1"로 보임)
+#   마지막 성공 후 KECO_PERIOD_MIN분이 지나면(폴링 실패 등) 놓친 변경분이 있으니 다시 전체부터
+# - MockStatusSource: 로컬 개발/점검용. 처음엔 전체, 이후엔 일부 충전기만 상태를 바꿔서 내려줌
+# 둘 다 fetch() -> [ChargerStatus, ...] (동기, 폴러가 스레드에서 호출)
+# -------------------------
+KST = timezone(timedelta(hours=9))
+
+# KECO 충전기 상태 코드
+COMM_ERROR = 1
+AVAILABLE = 2
+CHARGING = 3
+SUSPENDED = 4
+MAINTENANCE = 5
+UNKNOWN = 9
+
+
+class ChargerStatus(NamedTuple):
+    stat_id: str      # 충전소 ID (statId)
+    charger_id: str   # 충전기 ID (chgerId, 충전소 안에서만 유일)
+    status: int       # 상태 코드 (위 상수)
+    updated_at: int   # 상태 갱신 시각 (epoch 초)
+
+
+def _parse_time(value: Optional[str]) -> int:
+    """'YYYYMMDDHHMMSS' (KST) -> epoch 초, 없거나 이상하면 지금"""
+    try:
+        return int(datetime.strptime(value or "", "%Y%m%d%H%M%S").replace(tzinfo=KST).timestamp())
+    except ValueError:
+        return int(time.time())
+
+
+def parse_keco_items(payload: dict) -> tuple[list[ChargerStatus], int]:
+    """KECO JSON 응답 한 페이지 -> (상태 목록, totalCount)"""
+    code = str(payload.get("resultCode", "00"))
+    if code not in ("00", "0"):
+        raise RuntimeError(f"KECO status API error {code}: {payload.get('resultMsg')}")
+
+    items = payload.get("items") or []
+    if isinstance(items, dict):
+        items = items.get("item") or []
+    if isinstance(items, dict):
+        items = [items]
+
+    result = []
+    for it in items:
+        try:
+            status = int(it.get("stat"))
+        except (TypeError, ValueError):
+            status = UNKNOWN
+        if not it.get("statId") or not it.get("chgerId"):
+            continue
+        result.append(ChargerStatus(str(it["statId"]), str(it["chgerId"]), status, _parse_time(it.get("statUpdDt"))))
+    return result, int(payload.get("totalCount") or len(result))
+
+
+class KecoStatusSource:
+    name = "keco"
+
+    def __init__(
+        self,
+        url: str = KECO_STATUS_URL,
+        service_key: str = KECO_SERVICE_KEY,
+        period_min: int = KECO_PERIOD_MIN,
+        page_size: int = KECO_PAGE_SIZE,
+        timeout: float = KECO_TIMEOUT_SEC,
+        info_url: str = KECO_INFO_URL,
+    ):
+        if not service_key:
+            raise ValueError("KECO_SERVICE_KEY is required for AVAILABILITY_SOURCE=keco")
+        self.url = url
+        self.info_url = info_url
+        self.service_key = service_key
+        self.period_min = period_min
+        self.page_size = page_size
+        self.timeout = timeout
+        self._last_ok: Optional[float] = None  # 마지막으로 받아 온 시각 (monotonic)
+
+    def _page(self, url: str, page_no: int, period: Optional[int]) -> dict:
+        # serviceKey는 포털에서 이미 인코딩된 값으로 주는 경우가 있어서 그대로 붙임
+        params = {"pageNo": page_no, "numOfRows": self.page_size, "dataType": "JSON"}
+        if period is not None:
+            params["period"] = period
+        query = urllib.parse.urlencode(params)
+        with urllib.request.urlopen(f"{url}?serviceKey={self.service_key}&{query}", timeout=self.timeout) as resp:
+            return json.loads(resp.read().decode("utf-8"))
+
+    def _fetch_all(self, url: str, period: Optional[int]) -> list[ChargerStatus]:
+        result, page_no = [], 1
+        while True:
+            items, total = parse_keco_items(self._page(url, page_no, period))
+            result.extend(items)
+            if not items or page_no * self.page_size >= total:
+                return result
+            page_no += 1
+
+    def needs_full(self) -> bool:
+        return self._last_ok is None or time.monotonic() - self._last_ok > self.period_min * 60
+
+    def fetch(self) -> list[ChargerStatus]:
+        started = time.monotonic()
+        if self.needs_full():
+            result = self._fetch_all(self.info_url, None)
+        else:
+            result = self._fetch_all(self.url, self.period_min)
+        # 받기 시작한 시각 기준 (받는 동안 바뀐 것은 다음 변경분 기간에 들어감)
+        self._last_ok = started
+        return result
+
+
+class MockStatusSource:
+    """
+    stat_ids마다 충전기 1~4대, 처음 fetch는 전체 상태
+    이후엔 매번 change_rate 비율의 충전기만 다른 상태로 바꿔서 그것만 돌려줌 (KECO 변경분 응답과 같은 모양)
+    """
+    name = "mock"
+
+    _WEIGHTS = ((AVAILABLE, 0.55), (CHARGING, 0.35), (COMM_ERROR, 0.04), (MAINTENANCE, 0.04), (SUSPENDED, 0.02))
+
+    def __init__(self, stat_ids: list[str], change_rate: float = 0.02, seed: Optional[int] = None):
+        self._rng = random.Random(seed)
+        self.change_rate = change_rate
+        self._state: dict[tuple[str, str], int] = {}
+        for stat_id in stat_ids:
+            for n in range(self._rng.randint(1, 4)):
+                self._state[(stat_id, f"{n + 1:02d}")] = self._pick()
+        self._started = False
+
+    def _pick(self) -> int:
+        codes, weights = zip(*self._WEIGHTS)
+        return self._rng.choices(codes, weights)[0]
+
+    def fetch(self) -> list[ChargerStatus]:
+        now = int(time.time())
+        if not self._started:
+            self._started = True
+            return [ChargerStatus(s, c, v, now) for (s, c), v in self._state.items()]
+
+        keys = list(self._state)
+        changed = self._rng.sample(keys, min(len(keys), max(1, int(len(keys) * self.change_rate)))) if keys else []
+        result = []
+        for key in changed:
+            status = self._pick()
+            if status == self._state[key]:
+                continue
+            self._state[key] = status
+            result.append(ChargerStatus(key[0], key[1], status, now))
+        return result
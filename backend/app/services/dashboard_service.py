@@ -0,0 +1,81 @@
+from typing import Optional
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache
+from app.core.data_version import get_data_version
+from app.core.serialization import EncodedPayload
+from app.repositories.stats_repository import find_region_summary
+from app.services.hot_datasets import get_hot_datasets
+
+# -------------------------
+# 메인 대시보드 번들
+# - 지역 목록 + 등록대수 합계 + 대기오염도를 지역별 한 줄로 (조인은 DB에서, region summary)
+# - sparklines=True면 연도별 등록대수/오염도 추이(spark_years 순서)를 함께 담는다.
+#   (지역 x 연도 행렬은 공유 데이터셋 hot_datasets에서)
+# - 직렬화/압축된 바이트(EncodedPayload)를 연도/옵션/데이터 버전별로 캐시
+# -------------------------
+_cache = LRUCache(32)
+_summary_cache = LRUCache(64)
+
+
+def get_region_summary(
+    db: Session,
+    year: Optional[int] = None,
+    car_type: Optional[str] = None,
+    usage: Optional[str] = None,
+) -> dict:
+    """
+    시/도별 등록대수 합계 + 대기오염도 (/stats/region-summary, 번들의 regions)
+    조건/데이터 버전별 캐시 - 반환값은 공유되므로 수정 금지
+    """
+    key = (year, car_type, usage, get_data_version(db))
+    cached = _summary_cache.get(key)
+    if cached is None:
+        cached = find_region_summary(db, year, car_type, usage)
+        _summary_cache.set(key, cached)
+    return cached
+
+
+def _sparklines(db: Session) -> tuple[list[int], dict[str, dict]]:
+    ds = get_hot_datasets(db)
+
+    def values(row: np.ndarray, cast) -> list:
+        return [None if np.isnan(v) else cast(v) for v in row]
+
+    series = {
+        str(code): {"reg": values(ds["reg_yearly"][i], int), "poll": values(ds["poll_yearly"][i], float)}
+        for i, code in enumerate(ds["rollup_codes"])
+    }
+    return ds["rollup_years"].tolist(), series
+
+
+def build_bundle(db: Session, year: Optional[int], sparklines: bool, version: str) -> dict:
+    summary = get_region_summary(db, year)
+    spark_years, spark = _sparklines(db) if sparklines else ([], {})
+
+    regions = []
+    for row in summary["regions"]:
+        item = dict(row)
+        if sparklines:
+            item["spark"] = spark.get(row["code"], {"reg": [None] * len(spark_years), "poll": [None] * len(spark_years)})
+        regions.append(item)
+
+    bundle = {"year": year, "data_version": version, "regions": regions}
+    if sparklines:
+        bundle["spark_years"] = spark_years
+    return bundle
+
+
+def get_dashboard_bundle(db: Session, year: Optional[int] = None, sparklines: bool = False) -> EncodedPayload:
+    """엔드포인트는 negotiate()로 포맷/압축에 맞는 바이트를 그대로 내려준다."""
+    version = get_data_version(db)
+    key = (year, sparklines, version)
+    cached = _cache.get(key)
+    if cached is not None:
+        return cached
+
+    result = EncodedPayload(build_bundle(db, year, sparklines, version))
+    _cache.set(key, result)
+    return result
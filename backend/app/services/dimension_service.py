@@ -0,0 +1,36 @@
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache
+from app.core.data_version import get_data_version
+from app.repositories.stats_repository import find_filter_values
+from app.services.hot_datasets import get_hot_datasets
+
+# -------------------------
+# 차원 데이터 (지역 목록, 필터 값)
+# - 원천 데이터가 바뀔 때만 달라지므로 데이터 버전별로 캐시
+# - 지역 목록은 공유 데이터셋(hot_datasets)의 region_codes/region_names 배열에서
+# -------------------------
+_cache = LRUCache(8)
+
+
+def get_regions(db: Session) -> list[dict]:
+    """[{"code": "11", "name": "서울특별시"}, ...]"""
+    key = ("regions", get_data_version(db))
+    cached = _cache.get(key)
+    if cached is None:
+        ds = get_hot_datasets(db)
+        cached = [
+            {"code": str(code), "name": str(name)}
+            for code, name in zip(ds["region_codes"], ds["region_names"])
+        ]
+        _cache.set(key, cached)
+    return cached
+
+
+def get_filters(db: Session) -> dict:
+    key = ("filters", get_data_version(db))
+    cached = _cache.get(key)
+    if cached is None:
+        cached = find_filter_values(db)
+        _cache.set(key, cached)
+    return cached
@@ -0,0 +1,52 @@
+import numpy as np
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets 다운샘플링
+    - 첫/마지막 점은 항상 유지
+    - 가운데를 n_out-2 개 구간으로 나누고, 구간마다 (직전 선택점, 다음 구간 평균점)과
+      만드는 삼각형 넓이가 가장 큰 점을 고른다 -> 피크/골이 잘 보존됨
+    반환: 선택된 인덱스 배열 (오름차순)
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    every = (n - 2) / (n_out - 2)
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    a = 0
+    for i in range(n_out - 2):
+        start = int(np.floor(i * every)) + 1
+        end = int(np.floor((i + 1) * every)) + 1
+        next_end = min(int(np.floor((i + 2) * every)) + 1, n)
+
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+
+    selected[-1] = n - 1
+    return selected
+
+
+def minmax_scale(values: np.ndarray, scale: float = 100.0) -> np.ndarray:
+    """0~scale 정규화 (값이 모두 같으면 가운데 scale/2, 결측(NaN)은 그대로 유지)
+    - 프론트 views.main._minmax_100 과 같은 규칙이어야 함 (번들/시계열 추이선이 같은 높이로 그려지도록)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.size == 0 or np.isnan(values).all():
+        return values.copy()
+    lo, hi = np.nanmin(values), np.nanmax(values)
+    if hi == lo:
+        return np.where(np.isnan(values), np.nan, scale / 2)
+    return (values - lo) / (hi - lo) * scale
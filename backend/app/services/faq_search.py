@@ -0,0 +1,307 @@
+import math
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import FAQ_INDEX_CHECK_SEC
+from app.repositories.faq_repository import find_all_faqs, find_faq_signature
+from app.services.hangul import chosung, decompose, is_chosung_only
+from app.services.symspell import SymSpell
+
+# -------------------------
+# FAQ 검색 (역색인 + BM25)
+# - 토큰: 공백 단위 단어 + 단어의 글자 bigram
+#   ("보조금은" -> 보조금은, 보조, 조금, 금은) 이라 조사가 붙어 있어도 "보조금"으로 검색됨
+# - 차종/용도는 FAQ 테이블에 컬럼이 없어서, 본문 키워드로 태그를 붙이고
+#   태그가 없는 FAQ는 모든 차종/용도에 해당하는 공통 FAQ로 본다.
+# - fuzzy 모드: 초성 검색("ㅂㅈㄱ" -> 보조금) + 자모 단위 오타 교정(SymSpell)
+#   후보 단어를 찾은 뒤 그 단어 토큰(단어 + bigram)으로 BM25 점수를 매긴다.
+#   사전에는 본문 단어와 함께 끝의 조사를 뗀 어간도 넣음 ("보조금은" -> 보조금)
+#   -> 본문에 조사 붙은 꼴만 있어도 "보조굼"이 "보조금"으로 교정되고 하이라이트됨
+# -------------------------
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+SEARCH_MODES = ("exact", "fuzzy")
+FUZZY_MAX_DISTANCE = 2
+FUZZY_MAX_EXPANSIONS = 10
+
+_WORD_RE = re.compile(r"[0-9A-Za-z가-힣]+")
+
+# 단어 끝에서 떼어 볼 조사 (긴 것부터)
+_JOSA = (
+    "에서는", "으로는", "에서도", "에게는",
+    "에서", "으로", "에게", "까지", "부터", "보다", "처럼", "만큼", "이나", "이랑", "하고", "에는", "에도",
+    "은", "는", "이", "가", "을", "를", "에", "의", "도", "만", "로", "와", "과",
+)
+
+VEHICLE_TYPE_KEYWORDS = {
+    "승용": ("승용",),
+    "승합": ("승합", "버스"),
+    "화물": ("화물", "트럭"),
+    "이륜": ("이륜", "오토바이"),
+}
+USAGE_KEYWORDS = {
+    "자가용": ("자가용", "개인"),
+    "영업용": ("영업용", "택시", "법인", "사업자"),
+}
+
+
+def split_words(text: str) -> list[str]:
+    return [w.lower() for w in _WORD_RE.findall(text or "")]
+
+
+def strip_josa(word: str) -> str:
+    """끝의 조사를 뗀 어간 (남는 부분이 2글자 미만이면 그대로)"""
+    for josa in _JOSA:
+        if word.endswith(josa) and len(word) - len(josa) >= 2:
+            return word[: -len(josa)]
+    return word
+
+
+def tokenize(text: str) -> list[str]:
+    words = split_words(text)
+    tokens = list(words)
+    for w in words:
+        if len(w) > 2:
+            tokens.extend(w[i:i + 2] for i in range(len(w) - 1))
+    return tokens
+
+
+def _tags(text: str, keywords: dict) -> list[str]:
+    return [tag for tag, words in keywords.items() if any(k in text for k in words)]
+
+
+def find_highlights(text: str, words: list[str]) -> list[list[int]]:
+    """검색어 단어가 나타나는 [start, end) 구간 (대소문자 무시, 겹치면 합침)"""
+    lowered = (text or "").lower()
+    spans = []
+    for w in set(words):
+        start = lowered.find(w)
+        while start != -1:
+            spans.append([start, start + len(w)])
+            start = lowered.find(w, start + len(w))
+    spans.sort()
+
+    merged: list[list[int]] = []
+    for s, e in spans:
+        if merged and s <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], e)
+        else:
+            merged.append([s, e])
+    return merged
+
+
+class FaqIndex:
+    def __init__(self, docs: list[dict]):
+        self.docs = docs
+        self.postings: dict[str, list[tuple[int, int]]] = defaultdict(list)
+        self.doc_len: list[int] = []
+
+        for doc_id, doc in enumerate(docs):
+            text = f"{doc['question']} {doc['answer']}"
+            doc["vehicle_types"] = _tags(text, VEHICLE_TYPE_KEYWORDS)
+            doc["usages"] = _tags(text, USAGE_KEYWORDS)
+
+            counts = Counter(tokenize(text))
+            self.doc_len.append(sum(counts.values()))
+            for token, tf in counts.items():
+                self.postings[token].append((doc_id, tf))
+
+        self.avg_len = (sum(self.doc_len) / len(self.doc_len)) if self.doc_len else 0.0
+        self._build_fuzzy_index()
+        n = len(docs)
+        self.idf = {
+            token: math.log((n - len(p) + 0.5) / (len(p) + 0.5) + 1.0)
+            for token, p in self.postings.items()
+        }
+
+    def _build_fuzzy_index(self) -> None:
+        """단어 사전 -> (자모 문자열 SymSpell 사전, 초성 bigram 색인)"""
+        # postings에는 bigram 토큰도 섞여 있으므로, 원래 단어(공백 단위)와 그 어간만 다시 모음
+        words: set[str] = set()
+        for doc in self.docs:
+            for w in split_words(f"{doc['question']} {doc['answer']}"):
+                if len(w) >= 2:
+                    words.add(w)
+                    words.add(strip_josa(w))
+        self.vocab = words
+
+        self._jamo_to_words: dict[str, set[str]] = defaultdict(set)
+        self.symspell = SymSpell(FUZZY_MAX_DISTANCE)
+        self._chosung_of: dict[str, str] = {}
+        self._chosung_bigrams: dict[str, set[str]] = defaultdict(set)
+
+        for w in words:
+            jamo = decompose(w)
+            self._jamo_to_words[jamo].add(w)
+            self.symspell.add(jamo)
+
+            cho = chosung(w)
+            self._chosung_of[w] = cho
+            for i in range(len(cho) - 1):
+                self._chosung_bigrams[cho[i:i + 2]].add(w)
+
+    def expand_chosung(self, part: str) -> list[str]:
+        """초성 문자열을 (부분 문자열로) 포함하는 단어들. 2글자 미만은 범위가 너무 넓어서 제외"""
+        if len(part) < 2:
+            return []
+        candidates = None
+        for i in range(len(part) - 1):
+            bucket = self._chosung_bigrams.get(part[i:i + 2], set())
+            candidates = bucket if candidates is None else candidates & bucket
+            if not candidates:
+                return []
+        return sorted(w for w in candidates if part in self._chosung_of[w])
+
+    def expand_typos(self, word: str) -> list[tuple[str, int]]:
+        """자모 단위 편집 거리 이내의 사전 단어 [(단어, 거리), ...] (짧은 단어는 거리 1까지만)"""
+        jamo = decompose(word)
+        max_distance = 1 if len(jamo) <= 6 else FUZZY_MAX_DISTANCE
+        found = []
+        for cand, dist in self.symspell.lookup(jamo, max_distance):
+            found.extend((w, dist) for w in sorted(self._jamo_to_words[cand]) if w != word)
+        return found
+
+    def _fuzzy_query(self, q: str):
+        """fuzzy 모드 질의 -> (토큰 가중치, 하이라이트할 단어, 확장 내역)"""
+        weights: dict[str, float] = defaultdict(float)
+        highlight: list[str] = []
+        expansions: dict[str, list[str]] = {}
+
+        for part in q.split():
+            if is_chosung_only(part):
+                matched = self.expand_chosung(part)[:FUZZY_MAX_EXPANSIONS]
+                expansions[part] = matched
+                for w in matched:
+                    for t in tokenize(w):
+                        weights[t] = max(weights[t], 1.0)
+                highlight.extend(matched)
+                continue
+
+            for w in split_words(part):
+                for t in tokenize(w):
+                    weights[t] += 1.0
+                highlight.append(w)
+                if w in self.vocab:
+                    continue
+                matched = self.expand_typos(w)[:FUZZY_MAX_EXPANSIONS]
+                if matched:
+                    expansions[w] = [c for c, _ in matched]
+                # 어간은 본문에 단어 토큰으로 없을 수 있어서 bigram까지 같이 (보조금 -> 보조, 조금)
+                for c, dist in matched:
+                    for t in tokenize(c):
+                        weights[t] = max(weights[t], 1.0 / (1 + dist))
+                highlight.extend(c for c, _ in matched)
+
+        return weights, highlight, expansions
+
+    def _matches_filters(self, doc: dict, category, vehicle_type, usage) -> bool:
+        if category and doc["category"] != category:
+            return False
+        if vehicle_type and doc["vehicle_types"] and vehicle_type not in doc["vehicle_types"]:
+            return False
+        if usage and doc["usages"] and usage not in doc["usages"]:
+            return False
+        return True
+
+    def score(self, query_weights: dict[str, float]) -> dict[int, float]:
+        """query_weights: 토큰 -> 가중치 (일반 검색은 질의 내 등장 횟수)"""
+        scores: dict[int, float] = defaultdict(float)
+        for token, qtf in query_weights.items():
+            postings = self.postings.get(token)
+            if not postings:
+                continue
+            idf = self.idf[token]
+            for doc_id, tf in postings:
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.doc_len[doc_id] / self.avg_len)
+                scores[doc_id] += qtf * idf * tf * (BM25_K1 + 1) / (tf + norm)
+        return scores
+
+    def search(
+        self,
+        q: str = "",
+        category: Optional[str] = None,
+        vehicle_type: Optional[str] = None,
+        usage: Optional[str] = None,
+        page: int = 1,
+        size: int = 10,
+        mode: str = "exact",
+    ) -> dict:
+        expansions: dict[str, list[str]] = {}
+        if mode == "fuzzy":
+            weights, words, expansions = self._fuzzy_query(q)
+        else:
+            words = split_words(q)
+            weights = Counter(tokenize(q))
+
+        if words:
+            ranked = sorted(self.score(weights).items(), key=lambda kv: (-kv[1], kv[0]))
+        else:
+            # 검색어가 없으면 필터만 적용 (기존 /faqs 순서 유지)
+            ranked = [(doc_id, None) for doc_id in range(len(self.docs))]
+
+        hits = [
+            (doc_id, score) for doc_id, score in ranked
+            if self._matches_filters(self.docs[doc_id], category, vehicle_type, usage)
+        ]
+
+        start = (page - 1) * size
+        items = []
+        for doc_id, score in hits[start:start + size]:
+            doc = self.docs[doc_id]
+            items.append({
+                **doc,
+                "score": None if score is None else round(score, 4),
+                "highlights": {
+                    "question": find_highlights(doc["question"], words),
+                    "answer": find_highlights(doc["answer"], words),
+                },
+            })
+
+        return {
+            "query": q,
+            "mode": mode,
+            "expansions": expansions,
+            "filters": {"category": category, "vehicle_type": vehicle_type, "usage": usage},
+            "total": len(hits),
+            "page": page,
+            "size": size,
+            "items": items,
+        }
+
+
+# -------------------------
+# 전역 인덱스 (앱 시작 시 생성, 이후 주기적으로 변경 여부만 확인)
+# -------------------------
+_lock = threading.Lock()
+_state = {"index": None, "signature": None, "checked_at": 0.0}
+
+
+def build_faq_index(db: Session) -> FaqIndex:
+    signature = find_faq_signature(db)
+    index = FaqIndex(find_all_faqs(db))
+    with _lock:
+        _state.update(index=index, signature=signature, checked_at=time.monotonic())
+    return index
+
+
+def get_faq_index(db: Session) -> FaqIndex:
+    with _lock:
+        index = _state["index"]
+        fresh = time.monotonic() - _state["checked_at"] < FAQ_INDEX_CHECK_SEC
+
+    if index is None:
+        return build_faq_index(db)
+    if fresh:
+        return index
+
+    if find_faq_signature(db) != _state["signature"]:
+        return build_faq_index(db)
+    with _lock:
+        _state["checked_at"] = time.monotonic()
+    return index
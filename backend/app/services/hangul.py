@@ -0,0 +1,45 @@
+# -------------------------
+# 한글 자모 분해 유틸
+# - 완성형 음절(가~힣)을 초성/중성/종성 호환 자모로 분해
+# - 초성만 입력한 검색어("ㅂㅈㄱ")와 오타 거리 계산(자모 단위)에 사용
+# -------------------------
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSUNG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSUNG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+            "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+
+_SYLLABLE_BASE = 0xAC00
+_SYLLABLE_LAST = 0xD7A3
+_CONSONANTS = set(CHOSUNG)
+
+
+def _is_syllable(ch: str) -> bool:
+    return _SYLLABLE_BASE <= ord(ch) <= _SYLLABLE_LAST
+
+
+def decompose(text: str) -> str:
+    """'보조금' -> 'ㅂㅗㅈㅗㄱㅡㅁ' (한글 음절이 아닌 글자는 그대로)"""
+    out = []
+    for ch in text:
+        if _is_syllable(ch):
+            code = ord(ch) - _SYLLABLE_BASE
+            out.append(CHOSUNG[code // 588])
+            out.append(JUNGSUNG[(code % 588) // 28])
+            out.append(JONGSUNG[code % 28])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def chosung(text: str) -> str:
+    """'보조금' -> 'ㅂㅈㄱ' (한글 음절이 아닌 글자는 그대로)"""
+    return "".join(
+        CHOSUNG[(ord(ch) - _SYLLABLE_BASE) // 588] if _is_syllable(ch) else ch
+        for ch in text
+    )
+
+
+def is_chosung_only(text: str) -> bool:
+    """공백을 뺀 모든 글자가 초성 자음인지 ('ㅂㅈㄱ', 'ㅈㄱ ㅊㅈ')"""
+    chars = [ch for ch in text if not ch.isspace()]
+    return bool(chars) and all(ch in _CONSONANTS for ch in chars)
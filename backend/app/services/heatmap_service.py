@@ -0,0 +1,207 @@
+import hashlib
+import io
+import json
+import logging
+import shutil
+import struct
+import threading
+import zlib
+from typing import Optional
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache, read_bytes, write_bytes_atomic
+from app.core.config import CACHE_DIR
+from app.core.data_version import get_data_version
+from app.core.regions import REGION_CENTROIDS
+from app.repositories.stats_repository import find_region_metrics
+from app.services.hot_datasets import get_hot_datasets, station_coords
+
+# -------------------------
+# 격자 밀도 히트맵
+# - 좌표를 위경도 격자에 np.histogram2d로 모으고, 분리형 가우시안으로 평활화
+# - 결과는 PNG(화면용) + 원본 배열(.npy, 분석용) 두 가지로 캐시
+# - 캐시 키: 레이어/필터/격자 설정 + 데이터 버전
+# - 디스크 캐시는 데이터 버전별 디렉터리 (.cache/heatmaps/{버전}/{키}.png|.npy), 새 버전을 처음 쓸 때 옛 버전 디렉터리 삭제
+# -------------------------
+logger = logging.getLogger(__name__)
+
+LAYERS = ("stations", "registrations", "pollution")
+
+# 남한 전체(제주 포함)를 덮는 범위
+LAT_RANGE = (33.0, 38.7)
+LNG_RANGE = (124.5, 131.0)
+
+# 지역 단위 지표는 점이 17개뿐이라 넓게 퍼뜨려야 면으로 보임 (격자 칸 단위)
+DEFAULT_SIGMA = {"stations": 2.0, "registrations": 8.0, "pollution": 8.0}
+
+HEATMAP_CACHE_DIR = CACHE_DIR / "heatmaps"
+
+# 색상표 기준점 (viridis 근사) -> 256단계 LUT
+_ANCHORS = np.array([
+    [68, 1, 84], [59, 82, 139], [33, 145, 140], [94, 201, 98], [253, 231, 37],
+], dtype=np.float64)
+_LUT = np.stack(
+    [np.interp(np.linspace(0, 1, 256), np.linspace(0, 1, len(_ANCHORS)), _ANCHORS[:, c]) for c in range(3)],
+    axis=1,
+).astype(np.uint8)
+
+_memory = LRUCache(64)
+_prune_lock = threading.Lock()
+_pruned_for: Optional[str] = None
+
+
+def _gaussian_matrix(n: int, sigma: float) -> np.ndarray:
+    """1차원 가우시안 합성곱을 행렬로 (4σ 밖은 0, 행 합 1로 정규화해서 가장자리 보정)"""
+    idx = np.arange(n)
+    d = idx[:, None] - idx[None, :]
+    k = np.exp(-(d ** 2) / (2.0 * sigma ** 2))
+    k[np.abs(d) > 4 * sigma] = 0.0
+    return k / k.sum(axis=1, keepdims=True)
+
+
+def smooth(grid: np.ndarray, sigma: float) -> np.ndarray:
+    """분리형 가우시안: 세로 방향 한 번, 가로 방향 한 번 (행렬곱 두 번)"""
+    rows, cols = grid.shape
+    return _gaussian_matrix(rows, sigma) @ grid @ _gaussian_matrix(cols, sigma).T
+
+
+def bin_points(lat: np.ndarray, lng: np.ndarray, weights: Optional[np.ndarray], bins: int) -> np.ndarray:
+    cols = int(round(bins * (LNG_RANGE[1] - LNG_RANGE[0]) / (LAT_RANGE[1] - LAT_RANGE[0])))
+    grid, _, _ = np.histogram2d(lat, lng, bins=(bins, cols), range=[LAT_RANGE, LNG_RANGE], weights=weights)
+    return grid
+
+
+def _encode_png(rgba: np.ndarray) -> bytes:
+    """RGBA uint8 배열 -> PNG 바이트 (matplotlib/Pillow 없이 zlib만 사용)"""
+    h, w, _ = rgba.shape
+    raw = np.concatenate([np.zeros((h, 1), dtype=np.uint8), rgba.reshape(h, w * 4)], axis=1)
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    header = struct.pack(">IIBBBBB", w, h, 8, 6, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(raw.tobytes(), 6))
+        + chunk(b"IEND", b"")
+    )
+
+
+def colorize(grid: np.ndarray) -> bytes:
+    """0~1로 정규화 후 색상표 적용. 값이 없는 칸은 투명, 북쪽이 위로 오도록 뒤집음"""
+    peak = float(grid.max()) if grid.size else 0.0
+    norm = grid / peak if peak > 0 else np.zeros_like(grid)
+    idx = (np.clip(norm, 0, 1) * 255).astype(np.uint8)
+
+    rgba = np.empty(grid.shape + (4,), dtype=np.uint8)
+    rgba[..., :3] = _LUT[idx]
+    rgba[..., 3] = np.where(norm > 0.02, 80 + (norm * 175).astype(np.uint8), 0)
+    return _encode_png(rgba[::-1])
+
+
+def grid_to_npy(grid: np.ndarray) -> bytes:
+    buf = io.BytesIO()
+    np.save(buf, grid.astype(np.float32))
+    return buf.getvalue()
+
+
+def _build_grid(db: Session, layer: str, year, car_type, usage, station_type, bins: int, sigma: float) -> np.ndarray:
+    if layer == "stations":
+        lat, lng = station_coords(get_hot_datasets(db), station_type)
+        return smooth(bin_points(lat, lng, None, bins), sigma)
+
+    metrics = find_region_metrics(db, year, car_type, usage)
+    key = "reg_total" if layer == "registrations" else "pollution_degree"
+    codes = [c for c in REGION_CENTROIDS if metrics.get(c, {}).get(key) is not None]
+    lat = np.array([REGION_CENTROIDS[c][0] for c in codes], dtype=np.float64)
+    lng = np.array([REGION_CENTROIDS[c][1] for c in codes], dtype=np.float64)
+    values = np.array([metrics[c][key] for c in codes], dtype=np.float64)
+
+    if layer == "registrations":
+        # 등록대수는 합산량 -> 밀도로 퍼뜨림
+        return smooth(bin_points(lat, lng, values, bins), sigma)
+
+    # 오염도는 농도(평균량) -> 정규화 합성곱으로 지점 사이를 보간
+    num = smooth(bin_points(lat, lng, values, bins), sigma)
+    den = smooth(bin_points(lat, lng, None, bins), sigma)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        field = np.where(den > 1e-6, num / den, 0.0)
+    # 지점에서 멀리 떨어진 바다/빈 곳은 비움
+    return np.where(den > den.max() * 0.05, field, 0.0)
+
+
+def _prune_disk_cache(version: str) -> None:
+    """
+    현재 버전 디렉터리보다 오래된(mtime) 버전 디렉터리와 버전 없이 쓰던 옛 파일 삭제 (버전마다 프로세스당 한 번)
+    - 더 새 디렉터리는 남김: 버전 캐시(TTL)가 늦은 워커가 다른 워커의 새 캐시를 지우지 않도록
+    """
+    global _pruned_for
+    with _prune_lock:
+        if _pruned_for == version:
+            return
+        _pruned_for = version
+        current = HEATMAP_CACHE_DIR / version
+        try:
+            current.mkdir(parents=True, exist_ok=True)
+            current_mtime = current.stat().st_mtime
+            stale = [p for p in HEATMAP_CACHE_DIR.iterdir() if p != current and p.stat().st_mtime < current_mtime]
+        except OSError as e:
+            logger.warning("heatmap cache prune skipped: %s", e)
+            return
+        for p in stale:
+            if p.is_dir():
+                shutil.rmtree(p, ignore_errors=True)
+            else:
+                p.unlink(missing_ok=True)
+
+
+def get_heatmap(
+    db: Session,
+    layer: str,
+    year: Optional[int] = None,
+    car_type: Optional[str] = None,
+    usage: Optional[str] = None,
+    station_type: Optional[str] = None,
+    bins: int = 160,
+    sigma: Optional[float] = None,
+) -> dict:
+    """
+    히트맵 래스터 조회 (캐시 우선)
+    반환: {"key": str, "png": bytes, "npy": bytes, "grid": np.ndarray}
+    """
+    if layer not in LAYERS:
+        raise ValueError(f"unknown layer: {layer} (allowed: {', '.join(LAYERS)})")
+    if sigma is None:
+        sigma = DEFAULT_SIGMA[layer]
+
+    version = get_data_version(db)
+    filters = {
+        "layer": layer, "year": year, "car_type": car_type, "usage": usage,
+        "station_type": station_type, "bins": bins, "sigma": sigma,
+        "data_version": version,
+    }
+    key = hashlib.sha1(json.dumps(filters, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+    cached = _memory.get(key)
+    if cached is not None:
+        return cached
+
+    _prune_disk_cache(version)
+    png_path = HEATMAP_CACHE_DIR / version / f"{key}.png"
+    npy_path = HEATMAP_CACHE_DIR / version / f"{key}.npy"
+    png, npy = read_bytes(png_path), read_bytes(npy_path)
+
+    if png is not None and npy is not None:
+        grid = np.load(io.BytesIO(npy))
+    else:
+        grid = _build_grid(db, layer, year, car_type, usage, station_type, bins, sigma)
+        png, npy = colorize(grid), grid_to_npy(grid)
+        write_bytes_atomic(png_path, png)
+        write_bytes_atomic(npy_path, npy)
+
+    result = {"key": key, "png": png, "npy": npy, "grid": grid}
+    _memory.set(key, result)
+    return result
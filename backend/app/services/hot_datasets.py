@@ -0,0 +1,97 @@
+import os
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache
+from app.core.config import SHARED_CACHE_DIR, SHARED_CACHE_ENABLED, SHARED_CACHE_PREFIX
+from app.core.data_version import get_data_version, refresh_data_version
+from app.core.shared_store import SharedArrays, SharedArrayStore
+from app.repositories.station_repository import find_station_points
+from app.repositories.stats_repository import find_regions, find_yearly_pollution, find_yearly_registrations
+from app.services.analysis_service import build_yearly_matrices
+
+# -------------------------
+# 자주 읽는 읽기 전용 데이터셋 (NumPy 배열 묶음)
+# - region_codes / region_names : 등록 통계에 있는 지역 (지역 목록 API)
+# - rollup_codes / rollup_years / reg_yearly / poll_yearly : 지역 x 연도 등록대수 합계, 대기오염도 (결측 NaN)
+# - station_ids / station_lat / station_lng / station_type_idx + station_types : 좌표 있는 충전소 전체
+#
+# SHARED_CACHE_ENABLED=1 이면 워커 하나만 만들어 공유 메모리에 게시하고 나머지는 붙기만 한다.
+# (워커를 늘려도 메모리는 한 벌, 데이터 버전이 바뀌면 새 세그먼트로 통째로 교체)
+# 끄면 워커별로 데이터 버전마다 한 번 만들어 둔다.
+# -------------------------
+_store = SharedArrayStore(SHARED_CACHE_DIR, SHARED_CACHE_PREFIX)
+_local = LRUCache(2)
+
+
+def build_arrays(db: Session) -> dict[str, np.ndarray]:
+    regions = find_regions(db)
+    codes, years, reg, poll = build_yearly_matrices(find_yearly_registrations(db), find_yearly_pollution(db))
+
+    points = find_station_points(db)
+    station_types = sorted({t or "" for _, _, _, t in points})
+    type_idx = {t: i for i, t in enumerate(station_types)}
+    coords = np.array([(lat, lng) for _, lat, lng, _ in points], dtype=np.float64).reshape(-1, 2)
+
+    return {
+        "region_codes": np.array([r["code"] for r in regions], dtype=str),
+        "region_names": np.array([r["name"] for r in regions], dtype=str),
+        "rollup_codes": np.array(codes, dtype=str),
+        "rollup_years": np.array(years, dtype=np.int16),
+        "reg_yearly": reg,
+        "poll_yearly": poll,
+        "station_ids": np.array([i for i, _, _, _ in points], dtype=np.int64),
+        "station_lat": coords[:, 0].copy(),
+        "station_lng": coords[:, 1].copy(),
+        "station_type_idx": np.array([type_idx[t or ""] for _, _, _, t in points], dtype=np.int16),
+        "station_types": np.array(station_types, dtype=str),
+    }
+
+
+def get_hot_datasets(db: Session) -> SharedArrays:
+    """현재 데이터 버전의 배열 묶음 (공유 모드면 읽기 전용 공유 메모리 view)"""
+    version = get_data_version(db)
+    if SHARED_CACHE_ENABLED:
+        return _store.get_or_build(version, lambda: build_arrays(db), lambda: refresh_data_version(db))
+
+    cached = _local.get(version)
+    if cached is None:
+        cached = SharedArrays(version, build_arrays(db))
+        _local.set(version, cached)
+    return cached
+
+
+def _station_mask(ds: SharedArrays, station_type) -> np.ndarray:
+    hit = np.flatnonzero(ds["station_types"] == station_type)
+    if len(hit) == 0:
+        return np.zeros(len(ds["station_type_idx"]), dtype=bool)
+    return ds["station_type_idx"] == hit[0]
+
+
+def station_coords(ds: SharedArrays, station_type=None) -> tuple[np.ndarray, np.ndarray]:
+    """(위도, 경도) 배열. 종류 필터가 없으면 복사 없이 그대로"""
+    lat, lng = ds["station_lat"], ds["station_lng"]
+    if station_type is None:
+        return lat, lng
+    mask = _station_mask(ds, station_type)
+    return lat[mask], lng[mask]
+
+
+def station_ids(ds: SharedArrays, station_type=None) -> np.ndarray:
+    """station_coords와 같은 순서의 충전소 id 배열"""
+    ids = ds["station_ids"]
+    if station_type is None:
+        return ids
+    return ids[_station_mask(ds, station_type)]
+
+
+def get_shared_cache_status() -> dict:
+    status = {"enabled": SHARED_CACHE_ENABLED, "pid": os.getpid()}
+    if SHARED_CACHE_ENABLED:
+        status.update(_store.status())
+    return status
+
+
+def detach_shared_cache() -> None:
+    _store.detach()
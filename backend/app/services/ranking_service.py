@@ -0,0 +1,81 @@
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache
+from app.core.data_version import get_data_version
+from app.repositories.stats_repository import find_latest_month, find_region_rankings
+
+# -------------------------
+# 지역 순위 (성장률 / 무공해차 점유율)
+# - 지표 계산과 순위(RANK)는 DB 윈도 함수로 (stats_repository.find_region_rankings)
+# - 지역별 전체 결과를 조건/데이터 버전별로 캐시하고, top-N은 캐시에서 잘라서 만든다.
+# -------------------------
+# 지표 -> (값 컬럼, 순위 컬럼, 함께 내려줄 컬럼 (응답 키, 원본 키))
+METRICS = {
+    "yoy_growth": ("yoy_growth", "yoy_rank", (("current", "year_total"), ("previous", "prev_year_total"))),
+    "mom_growth": ("mom_growth", "mom_rank", (("current", "month_total"), ("previous", "prev_month_total"))),
+    "ev_share": ("ev_share", "ev_share_rank", (("count", "ev_total"), ("total", "all_total"))),
+    "h2_share": ("h2_share", "h2_share_rank", (("count", "h2_total"), ("total", "all_total"))),
+}
+
+_cache = LRUCache(64)
+
+
+def _ranked_rows(db: Session, year: Optional[int], car_type: Optional[str], usage: Optional[str]) -> dict:
+    key = (year, car_type, usage, get_data_version(db))
+    cached = _cache.get(key)
+    if cached is None:
+        month = find_latest_month(db, year)
+        rows = find_region_rankings(db, month, car_type, usage) if month is not None else []
+        cached = {"month": month, "rows": rows}
+        _cache.set(key, cached)
+    return cached
+
+
+def _top(rows: list[dict], metric: str, limit: int) -> list[dict]:
+    value_key, rank_key, extras = METRICS[metric]
+    ranked = sorted((r for r in rows if r[value_key] is not None), key=lambda r: (r[rank_key], r["code"]))
+    result = []
+    for r in ranked:
+        # 동순위는 잘라내지 않음 (limit번째와 같은 순위까지 포함)
+        if r[rank_key] > limit:
+            break
+        item = {
+            "rank": r[rank_key],
+            "region": {"code": r["code"], "name": r["name"]},
+            "value": round(r[value_key], 6),
+        }
+        for out_key, src_key in extras:
+            item[out_key] = r[src_key]
+        result.append(item)
+    return result
+
+
+def get_rankings(
+    db: Session,
+    metrics: Optional[list[str]] = None,
+    year: Optional[int] = None,
+    car_type: Optional[str] = None,
+    usage: Optional[str] = None,
+    limit: int = 5,
+) -> dict:
+    """
+    지표별 상위 지역
+
+    - metrics: METRICS 중 일부 (없으면 전체), 모르는 지표면 ValueError
+    - year가 없으면 최신 연도, 월 지표는 그 해의 마지막 월 기준
+    - 반환: {"year", "month": "YYYY-MM", "rankings": {metric: [{"rank", "region", "value", ...}, ...]}}
+    """
+    metrics = metrics or list(METRICS)
+    unknown = [m for m in metrics if m not in METRICS]
+    if unknown:
+        raise ValueError(f"unknown metric: {', '.join(unknown)} (choose from {', '.join(METRICS)})")
+
+    ranked = _ranked_rows(db, year, car_type, usage)
+    month = ranked["month"]
+    return {
+        "year": month.year if month is not None else year,
+        "month": month.strftime("%Y-%m") if month is not None else None,
+        "rankings": {m: _top(ranked["rows"], m, limit) for m in metrics},
+    }
@@ -0,0 +1,220 @@
+import math
+import threading
+from typing import Optional
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache
+from app.core.config import STATION_CLUSTER_CELL_PX, STATION_CLUSTER_MAX_FEATURES, STATION_CLUSTER_MAX_ZOOM
+from app.repositories.station_repository import find_stations_by_ids
+from app.services.hot_datasets import get_hot_datasets, station_coords, station_ids
+
+# -------------------------
+# 충전소 지도 클러스터 (supercluster 방식의 계층 격자)
+# - 좌표를 Web Mercator 정규화 좌표(0~1)로 바꾸고, 가장 세밀한 줌의 격자 칸으로 묶은 뒤
+#   한 줌씩 올라가며 칸 번호를 >> 1 해서 4칸씩 합친다. (칸이 정확히 포개지므로 줌 사이 계층이 일관됨)
+# - 칸마다 개수 + 좌표 합(-> 중심점), 한 개뿐인 칸은 그 충전소 번호를 들고 있어서 점으로 내려준다.
+# - 데이터 버전 x 충전소 종류별로 한 번 만들어 두고, 요청은 bbox 안의 칸만 골라서 응답
+#   (좌표 배열은 공유 데이터셋 hot_datasets, 인덱스는 워커별)
+# - 응답 하나는 STATION_CLUSTER_MAX_FEATURES개를 넘지 않음 (넘으면 더 낮은 줌 격자로)
+# -------------------------
+TILE_PX = 256
+MAX_LAT = 85.05112878
+
+# 남한 전체(제주 포함) - bbox가 없을 때
+DEFAULT_BBOX = (124.5, 33.0, 131.0, 38.7)
+
+_CELL_BITS = max(0, int(round(math.log2(TILE_PX / STATION_CLUSTER_CELL_PX))))
+
+_indexes = LRUCache(8)
+_build_lock = threading.Lock()
+
+
+def _project(lng, lat) -> tuple[np.ndarray, np.ndarray]:
+    """경위도 -> Web Mercator 정규화 좌표 (x: 서->동 0~1, y: 북->남 0~1)"""
+    lng = np.asarray(lng, dtype=np.float64)
+    lat = np.clip(np.asarray(lat, dtype=np.float64), -MAX_LAT, MAX_LAT)
+    x = (lng + 180.0) / 360.0
+    s = np.sin(np.radians(lat))
+    y = 0.5 - np.log((1 + s) / (1 - s)) / (4 * np.pi)
+    return np.clip(x, 0.0, 1.0), np.clip(y, 0.0, 1.0)
+
+
+def parse_bbox(value: Optional[str]) -> tuple[float, float, float, float]:
+    """'min_lng,min_lat,max_lng,max_lat' (Leaflet toBBoxString 순서)"""
+    if not value:
+        return DEFAULT_BBOX
+    try:
+        west, south, east, north = (float(v) for v in value.split(","))
+    except ValueError:
+        raise ValueError(f"invalid bbox (min_lng,min_lat,max_lng,max_lat): {value}")
+    if not (west <= east and south <= north):
+        raise ValueError(f"invalid bbox (min > max): {value}")
+    return west, south, east, north
+
+
+class StationClusterIndex:
+    def __init__(self, lat: np.ndarray, lng: np.ndarray, ids: np.ndarray, max_zoom: int, cell_bits: int):
+        self.max_zoom = max_zoom
+        self.cell_bits = cell_bits
+        self.lat = lat
+        self.lng = lng
+        self.ids = ids
+        self.x, self.y = _project(lng, lat)
+        self.levels: dict[int, dict[str, np.ndarray]] = {}
+
+        # 가장 세밀한 줌: 점 -> 칸
+        n = 2 ** (max_zoom + cell_bits)
+        cx = np.minimum((self.x * n).astype(np.int64), n - 1)
+        cy = np.minimum((self.y * n).astype(np.int64), n - 1)
+        level = self._group(cx, cy, np.ones(len(ids), dtype=np.int64), lat, lng, np.arange(len(ids), dtype=np.int64))
+
+        # 한 줌씩 올라가며 4칸 -> 1칸
+        for z in range(max_zoom, -1, -1):
+            self.levels[z] = level
+            if z > 0:
+                level = self._group(
+                    level["cx"] >> 1, level["cy"] >> 1, level["count"], level["sum_lat"], level["sum_lng"], level["point"]
+                )
+
+    @staticmethod
+    def _group(cx, cy, count, sum_lat, sum_lng, point) -> dict[str, np.ndarray]:
+        if len(cx) == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return {"cx": empty, "cy": empty, "count": empty, "sum_lat": empty.astype(np.float64),
+                    "sum_lng": empty.astype(np.float64), "point": empty}
+        keys, inv = np.unique((cx << 32) | cy, return_inverse=True)
+        # 한 개뿐인 칸의 대표 점 (여러 개인 칸에서는 쓰지 않음)
+        rep = np.full(len(keys), np.iinfo(np.int64).max, dtype=np.int64)
+        np.minimum.at(rep, inv, point)
+        return {
+            "cx": keys >> 32,
+            "cy": keys & 0xFFFFFFFF,
+            "count": np.bincount(inv, weights=count).astype(np.int64),
+            "sum_lat": np.bincount(inv, weights=sum_lat),
+            "sum_lng": np.bincount(inv, weights=sum_lng),
+            "point": rep,
+        }
+
+    def _cells_in(self, z: int, x0: float, y0: float, x1: float, y1: float) -> np.ndarray:
+        level = self.levels[z]
+        n = 2 ** (z + self.cell_bits)
+        lo_x, hi_x = int(x0 * n), min(int(x1 * n), n - 1)
+        lo_y, hi_y = int(y0 * n), min(int(y1 * n), n - 1)
+        cx, cy = level["cx"], level["cy"]
+        return np.flatnonzero((cx >= lo_x) & (cx <= hi_x) & (cy >= lo_y) & (cy <= hi_y))
+
+    def query(self, bbox: tuple[float, float, float, float], zoom: int, max_features: int) -> dict:
+        """
+        bbox 안의 클러스터/점
+        - zoom > max_zoom 이면 개별 점 (max_features를 넘으면 max_zoom 격자로)
+        - 격자 칸이 max_features를 넘으면 넘지 않을 때까지 한 줌씩 낮춤
+        반환: {"cluster_zoom", "total", "clusters": [(z, cx, cy, count, lat, lng)], "points": [점 번호]}
+        """
+        west, south, east, north = bbox
+        (x0, x1), (y1, y0) = _project([west, east], [south, north])  # 북쪽이 y가 작음
+
+        if zoom > self.max_zoom:
+            hit = np.flatnonzero((self.x >= x0) & (self.x <= x1) & (self.y >= y0) & (self.y <= y1))
+            if len(hit) <= max_features:
+                return {"cluster_zoom": None, "total": len(hit), "clusters": [], "points": hit.tolist()}
+            zoom = self.max_zoom
+
+        z = max(0, min(zoom, self.max_zoom))
+        cells = self._cells_in(z, x0, y0, x1, y1)
+        while len(cells) > max_features and z > 0:
+            z -= 1
+            cells = self._cells_in(z, x0, y0, x1, y1)
+
+        level = self.levels[z]
+        count = level["count"][cells]
+        single = count == 1
+        multi = cells[~single]
+        clusters = [
+            (z, int(cx), int(cy), int(c), float(la), float(ln))
+            for cx, cy, c, la, ln in zip(
+                level["cx"][multi],
+                level["cy"][multi],
+                level["count"][multi],
+                level["sum_lat"][multi] / level["count"][multi],
+                level["sum_lng"][multi] / level["count"][multi],
+            )
+        ]
+        return {
+            "cluster_zoom": z,
+            "total": int(count.sum()),
+            "clusters": clusters,
+            "points": level["point"][cells[single]].tolist(),
+        }
+
+
+def _get_index(db: Session, station_type: Optional[str]) -> StationClusterIndex:
+    ds = get_hot_datasets(db)
+    key = (ds.version, station_type)
+    index = _indexes.get(key)
+    if index is not None:
+        return index
+
+    with _build_lock:
+        index = _indexes.get(key)
+        if index is None:
+            lat, lng = station_coords(ds, station_type)
+            # 인덱스가 공유 메모리 view를 붙잡고 있지 않도록 복사해서 보관
+            index = StationClusterIndex(
+                np.array(lat), np.array(lng), np.array(station_ids(ds, station_type)),
+                STATION_CLUSTER_MAX_ZOOM, _CELL_BITS,
+            )
+            _indexes.set(key, index)
+    return index
+
+
+def get_station_clusters(
+    db: Session,
+    bbox: Optional[str] = None,
+    zoom: int = 7,
+    station_type: Optional[str] = None,
+) -> dict:
+    """
+    /stations/clusters 응답
+    {
+      "zoom", "cluster_zoom"(개별 점이면 None), "bbox", "total"(응답에 담긴 칸/점의 충전소 수),
+      "clusters": [{"id": "z/cx/cy", "count", "latitude", "longitude", "expansion_zoom"}, ...],
+      "points": [{"id", "name", "address", "latitude", "longitude"}, ...]
+    }
+    """
+    box = parse_bbox(bbox)
+    index = _get_index(db, station_type)
+    result = index.query(box, zoom, STATION_CLUSTER_MAX_FEATURES)
+
+    point_ids = tuple(int(index.ids[i]) for i in result["points"])
+    details = find_stations_by_ids(db, point_ids)
+    points = []
+    for i, sid in zip(result["points"], point_ids):
+        d = details.get(sid, {})
+        points.append({
+            "id": sid,
+            "name": d.get("name"),
+            "address": d.get("address"),
+            "latitude": float(index.lat[i]),
+            "longitude": float(index.lng[i]),
+        })
+
+    return {
+        "zoom": zoom,
+        "cluster_zoom": result["cluster_zoom"],
+        "bbox": list(box),
+        "total": result["total"],
+        "clusters": [
+            {
+                "id": f"{z}/{cx}/{cy}",
+                "count": count,
+                "latitude": lat,
+                "longitude": lng,
+                # 클릭하면 이 줌으로 확대 (칸이 4칸으로 나뉨)
+                "expansion_zoom": z + 1,
+            }
+            for z, cx, cy, count, lat, lng in result["clusters"]
+        ],
+        "points": points,
+    }
@@ -0,0 +1,78 @@
+import base64
+import binascii
+import json
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.repositories.station_repository import find_station_page, find_station_page_near
+
+# -------------------------
+# 충전소 목록 페이지 (/stations/page, 화면 목록의 무한 스크롤용)
+# - 위치가 없으면 최근 등록 순(id 내림차순), 위치(lat, lng)가 있으면 가까운 순(거리, id)
+# - 다음 페이지는 마지막 줄의 정렬 키를 담은 불투명 커서로 이어 읽음 (OFFSET 없음 -> 중간에 충전소가 추가돼도 중복/누락 없음)
+# - 커서는 정렬 방식과 기준 위치를 함께 담아서, 다른 조건의 커서가 섞이면 400
+# -------------------------
+MAX_PAGE_SIZE = 200
+
+
+def _encode_cursor(payload: dict) -> str:
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> dict:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError(f"invalid cursor: {cursor}")
+    if not isinstance(payload, dict) or "id" not in payload:
+        raise ValueError(f"invalid cursor: {cursor}")
+    return payload
+
+
+def get_station_page(
+    db: Session,
+    station_type: Optional[str] = None,
+    q: Optional[str] = None,
+    lat: Optional[float] = None,
+    lng: Optional[float] = None,
+    cursor: Optional[str] = None,
+    limit: int = 50,
+) -> dict:
+    """
+    반환: {"order": "recent"|"distance", "items": [...], "next_cursor": str|None}
+    items: find_stations 모양 + "distance_m"(int, 가까운 순일 때만)
+    """
+    if (lat is None) != (lng is None):
+        raise ValueError("lat and lng must be given together")
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+
+    order = "recent" if lat is None else "distance"
+    after = _decode_cursor(cursor) if cursor else None
+    if after is not None and (after.get("o") != order or after.get("at") != ([lat, lng] if lat is not None else None)):
+        raise ValueError("cursor does not match order/location of this request")
+
+    # 한 줄 더 읽어서 다음 페이지가 있는지 판단
+    if order == "recent":
+        rows = find_station_page(db, station_type, q, after["id"] if after else None, limit + 1)
+    else:
+        rows = find_station_page_near(
+            db, lat, lng, station_type, q, (after["d"], after["id"]) if after else None, limit + 1
+        )
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        payload = {"o": order, "id": last["id"]}
+        if order == "distance":
+            payload.update(d=last["distance_m"], at=[lat, lng])
+        next_cursor = _encode_cursor(payload)
+
+    items = rows
+    if order == "distance":
+        items = [{**r, "distance_m": int(round(r["distance_m"]))} for r in rows]
+    return {"order": order, "items": items, "next_cursor": next_cursor}
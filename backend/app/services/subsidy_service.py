@@ -0,0 +1,270 @@
+import csv
+import threading
+from typing import Optional
+
+import numpy as np
+
+from app.core.config import SUBSIDY_RULES_DIR
+from app.core.regions import REGION_CODE_TO_NAME
+
+# -------------------------
+# 무공해차 보조금 계산
+# - 규칙표(rules.csv)의 각 행은 (연도, 시/도, 시/군/구, 차종, 모델, 구매자 유형) 키에
+#   국비/지방비 금액(만원) 또는 비율(%)을 지정한다. "*"는 전체.
+# - 같은 칸에 여러 규칙이 걸리면 더 구체적인 규칙이 이긴다
+#   (모델 > 시/군/구 > 시/도 > 구매자 유형 > 연도 > 차종 순으로 가중치)
+# - 규칙표는 파일이 바뀔 때만 (연도, 지역, 모델, 구매자 유형) 4차원 배열로 미리 펼쳐 두고,
+#   조회는 배열 인덱싱 한 번, 모델 x 지역 비교표도 인덱싱 한 번으로 끝낸다.
+# - 어떤 연도에 금액 규칙이 없는 칸은 직전 연도 금액을 이어받고,
+#   요청 연도가 규칙표보다 뒤면 가장 최근 연도 규칙을 쓴다.
+# -------------------------
+WILDCARD = "*"
+BUYER_TYPES = ("general", "low_income", "youth_first", "business")
+
+# 구체성 가중치 (비트) - 합이 클수록 우선
+_SPECIFICITY = {
+    "model_code": 32, "sigungu_code": 16, "sido_code": 8,
+    "buyer_type": 4, "year": 2, "car_type": 1,
+}
+
+
+class SubsidyRuleError(Exception):
+    pass
+
+
+class SubsidyNotFound(Exception):
+    pass
+
+
+def _read_csv(path) -> list[dict]:
+    if not path.exists():
+        raise SubsidyRuleError(f"subsidy rule file not found: {path}")
+    with open(path, encoding="utf-8", newline="") as f:
+        return [{k: (v or "").strip() for k, v in row.items()} for row in csv.DictReader(f)]
+
+
+def _num(v: str) -> float:
+    return float(v) if v != "" else np.nan
+
+
+def _specificity(rule: dict) -> int:
+    return sum(w for field, w in _SPECIFICITY.items() if rule[field] != WILDCARD)
+
+
+class SubsidyTable:
+    """
+    규칙표를 펼친 조회 테이블
+    - national / local: (연도, 지역, 모델, 구매자 유형) 만원 단위, 규칙이 없는 칸은 NaN
+    - 지역 축: 시/도마다 (시/도, "*") 한 칸 + 규칙표에 나온 시/군/구
+    """
+
+    def __init__(self, models: list[dict], rules: list[dict]):
+        self.models = models
+        self.model_idx = {m["model_code"]: i for i, m in enumerate(models)}
+        model_car_types = np.array([m["car_type"] for m in models])
+
+        self.years = sorted({int(r["year"]) for r in rules if r["year"] != WILDCARD})
+        if not self.years:
+            raise SubsidyRuleError("subsidy rules have no concrete year")
+
+        sigungu_names = {
+            (r["sido_code"], r["sigungu_code"]): r.get("sigungu_name") or r["sigungu_code"]
+            for r in rules if r["sigungu_code"] != WILDCARD
+        }
+        self.regions = []
+        for code in sorted(REGION_CODE_TO_NAME):
+            self.regions.append((code, WILDCARD))
+            self.regions.extend(k for k in sorted(sigungu_names) if k[0] == code)
+        self.region_idx = {k: i for i, k in enumerate(self.regions)}
+        self.region_names = {
+            k: REGION_CODE_TO_NAME[k[0]] + ("" if k[1] == WILDCARD else f" {sigungu_names[k]}")
+            for k in self.regions
+        }
+        region_sido = np.array([k[0] for k in self.regions])
+        region_sigungu = np.array([k[1] for k in self.regions])
+
+        self.buyer_types = list(BUYER_TYPES) + sorted(
+            {r["buyer_type"] for r in rules} - set(BUYER_TYPES) - {WILDCARD}
+        )
+        self.buyer_idx = {b: i for i, b in enumerate(self.buyer_types)}
+
+        shape = (len(self.years), len(self.regions), len(models), len(self.buyer_types))
+        values = {name: np.full(shape, np.nan) for name in ("national", "local")}
+        rates = {name: np.full(shape, 100.0) for name in ("national_pct", "local_pct")}
+
+        years = np.array(self.years)
+        buyers = np.array(self.buyer_types)
+        model_codes = np.array([m["model_code"] for m in models])
+
+        def axis_mask(arr: np.ndarray, value: str) -> np.ndarray:
+            return np.ones(len(arr), dtype=bool) if value == WILDCARD else arr == value
+
+        # 덜 구체적인 규칙부터 덮어쓰기 (같은 구체성이면 파일 순서)
+        for rule in sorted(rules, key=_specificity):
+            ym = np.ones(len(years), dtype=bool) if rule["year"] == WILDCARD else years == int(rule["year"])
+            rm = axis_mask(region_sido, rule["sido_code"]) & axis_mask(region_sigungu, rule["sigungu_code"])
+            mm = axis_mask(model_car_types, rule["car_type"]) & axis_mask(model_codes, rule["model_code"])
+            bm = axis_mask(buyers, rule["buyer_type"])
+            if not (ym.any() and rm.any() and mm.any() and bm.any()):
+                continue
+
+            ix = np.ix_(ym, rm, mm, bm)
+            for name, target in (*values.items(), *rates.items()):
+                v = _num(rule.get(name, ""))
+                if not np.isnan(v):
+                    target[ix] = v
+
+        # 금액은 직전 연도 값을 이어받음 (비율은 연도별 규칙 그대로)
+        for target in values.values():
+            for y in range(1, len(self.years)):
+                target[y] = np.where(np.isnan(target[y]), target[y - 1], target[y])
+
+        self.national = np.round(values["national"] * rates["national_pct"] / 100.0)
+        self.local = np.round(values["local"] * rates["local_pct"] / 100.0)
+
+    # -------------------------
+    # 키 -> 배열 인덱스
+    # -------------------------
+    def resolve_year(self, year: int) -> int:
+        """규칙이 있는 연도 중 요청 연도 이하에서 가장 최근 연도"""
+        pos = int(np.searchsorted(self.years, year, side="right")) - 1
+        if pos < 0:
+            raise SubsidyNotFound(f"no subsidy rules for year {year} (from {self.years[0]})")
+        return pos
+
+    def resolve_region(self, sido_code: str, sigungu_code: Optional[str] = None) -> int:
+        if sido_code not in REGION_CODE_TO_NAME:
+            raise ValueError(f"unknown sido_code: {sido_code}")
+        key = (sido_code, sigungu_code or WILDCARD)
+        # 시/군/구 규칙이 따로 없으면 시/도 규칙을 따른다
+        return self.region_idx.get(key, self.region_idx[(sido_code, WILDCARD)])
+
+    def resolve_model(self, model_code: str, car_type: Optional[str] = None) -> int:
+        if model_code not in self.model_idx:
+            raise ValueError(f"unknown model_code: {model_code}")
+        i = self.model_idx[model_code]
+        if car_type and self.models[i]["car_type"] != car_type:
+            raise ValueError(f"model {model_code} is {self.models[i]['car_type']}, not {car_type}")
+        return i
+
+    def resolve_buyer(self, buyer_type: str) -> int:
+        if buyer_type not in self.buyer_idx:
+            raise ValueError(f"buyer_type must be one of {', '.join(self.buyer_types)}")
+        return self.buyer_idx[buyer_type]
+
+    # -------------------------
+    # 계산
+    # -------------------------
+    def calc(
+        self,
+        year: int,
+        sido_code: str,
+        model_code: str,
+        car_type: Optional[str] = None,
+        sigungu_code: Optional[str] = None,
+        buyer_type: str = "general",
+    ) -> dict:
+        y = self.resolve_year(year)
+        r = self.resolve_region(sido_code, sigungu_code)
+        m = self.resolve_model(model_code, car_type)
+        b = self.resolve_buyer(buyer_type)
+
+        national, local = self.national[y, r, m, b], self.local[y, r, m, b]
+        if np.isnan(national) and np.isnan(local):
+            raise SubsidyNotFound(f"no subsidy rule for {model_code} in {sido_code} ({year})")
+        national = 0 if np.isnan(national) else int(national)
+        local = 0 if np.isnan(local) else int(local)
+
+        return {
+            "year": year,
+            "rule_year": self.years[y],
+            "sido_code": sido_code,
+            "sigungu_code": self.regions[r][1] if self.regions[r][1] != WILDCARD else None,
+            "car_type": self.models[m]["car_type"],
+            "model_code": model_code,
+            "buyer_type": buyer_type,
+            "subsidy_national": national,
+            "subsidy_local": local,
+            "subsidy_total": national + local,
+        }
+
+    def compare(
+        self,
+        year: int,
+        car_type: Optional[str] = None,
+        buyer_type: str = "general",
+        sido_codes: Optional[list[str]] = None,
+        model_codes: Optional[list[str]] = None,
+    ) -> dict:
+        """
+        모델 x 지역 비교표 (한 번의 배열 인덱싱으로 전체 조합 계산)
+        반환 행렬은 [지역][모델] 순서, 규칙이 없는 칸은 None
+        """
+        y = self.resolve_year(year)
+        b = self.resolve_buyer(buyer_type)
+
+        if model_codes:
+            m_idx = [self.resolve_model(c, car_type) for c in model_codes]
+        else:
+            m_idx = [i for i, m in enumerate(self.models) if not car_type or m["car_type"] == car_type]
+
+        if sido_codes:
+            for c in sido_codes:
+                self.resolve_region(c)
+            r_idx = [i for i, k in enumerate(self.regions) if k[0] in set(sido_codes)]
+        else:
+            r_idx = list(range(len(self.regions)))
+
+        rows, cols = np.ix_(r_idx, m_idx)
+        national = self.national[y][rows, cols, b]
+        local = self.local[y][rows, cols, b]
+        missing = np.isnan(national) & np.isnan(local)
+        total = np.where(missing, np.nan, np.nan_to_num(national) + np.nan_to_num(local))
+
+        def matrix(a: np.ndarray) -> list[list]:
+            return [[None if np.isnan(v) else int(v) for v in row] for row in a]
+
+        return {
+            "year": year,
+            "rule_year": self.years[y],
+            "car_type": car_type,
+            "buyer_type": buyer_type,
+            "models": [self.models[i] for i in m_idx],
+            "regions": [
+                {
+                    "sido_code": self.regions[i][0],
+                    "sigungu_code": None if self.regions[i][1] == WILDCARD else self.regions[i][1],
+                    "name": self.region_names[self.regions[i]],
+                }
+                for i in r_idx
+            ],
+            "subsidy_national": matrix(np.where(missing, np.nan, np.nan_to_num(national))),
+            "subsidy_local": matrix(np.where(missing, np.nan, np.nan_to_num(local))),
+            "subsidy_total": matrix(total),
+        }
+
+
+# -------------------------
+# 전역 테이블 (규칙 파일이 바뀌었을 때만 다시 펼침)
+# -------------------------
+_lock = threading.Lock()
+_state = {"table": None, "signature": None}
+
+
+def _signature(paths) -> tuple:
+    return tuple((p.stat().st_mtime_ns, p.stat().st_size) if p.exists() else None for p in paths)
+
+
+def get_subsidy_table() -> SubsidyTable:
+    models_path = SUBSIDY_RULES_DIR / "models.csv"
+    rules_path = SUBSIDY_RULES_DIR / "rules.csv"
+    signature = _signature((models_path, rules_path))
+
+    with _lock:
+        if _state["table"] is not None and _state["signature"] == signature:
+            return _state["table"]
+
+    table = SubsidyTable(_read_csv(models_path), _read_csv(rules_path))
+    with _lock:
+        _state.update(table=table, signature=signature)
+    return table
@@ -0,0 +1,78 @@
+from collections import defaultdict
+
+# -------------------------
+# SymSpell 방식 오타 사전
+# - 사전 단어마다 "최대 거리만큼 글자를 지운 변형"을 미리 색인해 두고,
+#   검색어도 똑같이 지운 변형으로 조회 -> 전체 단어를 훑지 않고 후보만 얻음
+# - 후보는 실제 편집 거리(OSA Damerau-Levenshtein)로 다시 확인
+# - prefix_length: 앞부분만 지운 변형을 만들어서 색인 크기를 제한 (SymSpell 기본값 7)
+# -------------------------
+
+
+def _deletes(word: str, max_distance: int) -> set[str]:
+    result: set[str] = set()
+    frontier = {word}
+    for _ in range(max_distance):
+        nxt = set()
+        for w in frontier:
+            for i in range(len(w)):
+                d = w[:i] + w[i + 1:]
+                if d not in result:
+                    result.add(d)
+                    nxt.add(d)
+        frontier = nxt
+    return result
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """OSA Damerau-Levenshtein 거리 (limit를 넘으면 limit + 1)"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev2 = None
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if prev2 is not None and i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        if min(cur) > limit:
+            return limit + 1
+        prev2, prev = prev, cur
+    return min(prev[-1], limit + 1)
+
+
+class SymSpell:
+    def __init__(self, max_distance: int = 2, prefix_length: int = 7):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.words: set[str] = set()
+        self._deletes: dict[str, set[str]] = defaultdict(set)
+
+    def add(self, word: str) -> None:
+        if word in self.words:
+            return
+        self.words.add(word)
+        prefix = word[: self.prefix_length]
+        self._deletes[prefix].add(word)
+        for d in _deletes(prefix, self.max_distance):
+            self._deletes[d].add(word)
+
+    def lookup(self, word: str, max_distance: int = None) -> list[tuple[str, int]]:
+        """거리 max_distance 이내 단어 [(단어, 거리), ...] 거리 오름차순"""
+        if max_distance is None or max_distance > self.max_distance:
+            max_distance = self.max_distance
+
+        prefix = word[: self.prefix_length]
+        candidates: set[str] = set(self._deletes.get(prefix, ()))
+        for d in _deletes(prefix, max_distance):
+            candidates |= self._deletes.get(d, set())
+
+        found = []
+        for c in candidates:
+            dist = edit_distance(word, c, max_distance)
+            if dist <= max_distance:
+                found.append((c, dist))
+        found.sort(key=lambda x: (x[1], x[0]))
+        return found
@@ -0,0 +1,204 @@
+import hashlib
+import json
+import logging
+import shutil
+import threading
+from typing import Optional
+
+import mapbox_vector_tile
+import numpy as np
+import shapely
+from shapely.geometry import shape
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache, read_bytes, write_bytes_atomic
+from app.core.config import CACHE_DIR, SIGUNGU_GEOJSON_PATH, TILE_MAX_ZOOM, TILE_MEMORY_CACHE_SIZE
+from app.core.data_version import get_stats_version
+from app.repositories.stats_repository import find_region_metrics
+
+# -------------------------
+# 시/군/구 벡터 타일 (Mapbox Vector Tile)
+# - 경계 GeoJSON은 최초 요청 시 한 번만 읽어서 Web Mercator로 투영 + STRtree 인덱스 생성
+# - 줌별 단순화 결과는 줌 단위로 한 번만 계산해서 재사용
+# - 타일 바이트는 메모리 LRU -> 디스크 -> 생성 순으로 조회
+# - 캐시 버전은 통계 버전(등록/대기질) + 경계 파일 버전 (충전소 적재로는 바뀌지 않음)
+#   버전이 바뀌면 그보다 오래된 디스크 캐시 디렉터리는 지움
+# - 경계 파일(SIGUNGU_GEOJSON_PATH)은 저장소에 없음: scripts/prepare_sigungu_geojson.py 로 준비
+#   없으면 타일은 503, /tiles/status 의 available=false (화면에서 시/군/구 토글을 숨김)
+# - 타일 URL에는 버전(?v=)을 붙여서 씀 (/tiles/status 의 version): 데이터가 바뀌면 URL도 바뀌어서
+#   브라우저/프록시가 옛 색상의 타일을 계속 쓰지 않음
+# -------------------------
+logger = logging.getLogger(__name__)
+
+LAYER_NAME = "sigungu"
+EXTENT = 4096
+BUFFER = 64  # 타일 경계 이음새가 보이지 않도록 타일 단위로 여유를 두고 자름
+MERCATOR_MAX = 20037508.342789244
+
+TILE_CACHE_DIR = CACHE_DIR / "tiles"
+
+
+class TileGeometryNotFound(Exception):
+    pass
+
+
+def _lnglat_to_mercator(coords: np.ndarray) -> np.ndarray:
+    lng = coords[:, 0]
+    lat = np.clip(coords[:, 1], -85.05112878, 85.05112878)
+    x = lng * MERCATOR_MAX / 180.0
+    y = np.log(np.tan((90.0 + lat) * np.pi / 360.0)) * MERCATOR_MAX / np.pi
+    return np.column_stack([x, y])
+
+
+def tile_bounds(z: int, x: int, y: int) -> tuple[float, float, float, float]:
+    """(minx, miny, maxx, maxy) - EPSG:3857 미터 단위"""
+    size = 2 * MERCATOR_MAX / (2 ** z)
+    minx = -MERCATOR_MAX + x * size
+    maxy = MERCATOR_MAX - y * size
+    return minx, maxy - size, minx + size, maxy
+
+
+class SigunguGeometry:
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._simplified: dict[int, np.ndarray] = {}
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            raise TileGeometryNotFound(f"sigungu geojson not found: {self.path}")
+
+        stat = self.path.stat()
+        self.version = hashlib.sha1(f"{stat.st_mtime_ns}:{stat.st_size}".encode()).hexdigest()[:8]
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            features = json.load(f)["features"]
+
+        # 공개 경계 파일마다 속성 이름이 달라서 흔한 키 둘 다 대응 (SIG_CD/SIG_KOR_NM, code/name)
+        self.codes = [str(ft["properties"].get("SIG_CD") or ft["properties"].get("code")) for ft in features]
+        self.names = [ft["properties"].get("SIG_KOR_NM") or ft["properties"].get("name") or "" for ft in features]
+        self.sido_codes = [c[:2] for c in self.codes]
+
+        geoms = np.array([shape(ft["geometry"]) for ft in features], dtype=object)
+        self.geoms = shapely.transform(geoms, _lnglat_to_mercator)
+        self.tree = shapely.STRtree(self.geoms)
+        self._loaded = True
+
+    def ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        with self._lock:
+            if not self._loaded:
+                self._load()
+
+    def simplified(self, z: int) -> np.ndarray:
+        # 타일 1픽셀(EXTENT 기준) 보다 작은 꼭짓점은 어차피 안 보이므로 그 크기로 단순화
+        z = min(z, TILE_MAX_ZOOM)
+        cached = self._simplified.get(z)
+        if cached is not None:
+            return cached
+        tolerance = 2 * MERCATOR_MAX / (2 ** z) / EXTENT
+        result = shapely.simplify(self.geoms, tolerance, preserve_topology=True)
+        self._simplified[z] = result
+        return result
+
+    def render(self, z: int, x: int, y: int, metrics: dict[str, dict]) -> bytes:
+        self.ensure_loaded()
+        minx, miny, maxx, maxy = tile_bounds(z, x, y)
+        size = maxx - minx
+        pad = size * BUFFER / EXTENT
+
+        idx = self.tree.query(shapely.box(minx - pad, miny - pad, maxx + pad, maxy + pad))
+        if len(idx) == 0:
+            return b""
+
+        clipped = shapely.clip_by_rect(self.simplified(z)[idx], minx - pad, miny - pad, maxx + pad, maxy + pad)
+        scale = EXTENT / size
+        local = shapely.transform(clipped, lambda c: (c - (minx, miny)) * scale)
+
+        features = []
+        for i, geom in zip(idx, local):
+            if geom.is_empty:
+                continue
+            sido_code = self.sido_codes[i]
+            props = {"code": self.codes[i], "name": self.names[i], "sido_code": sido_code}
+            # 시/군/구 단위 등록 통계가 아직 없어서 소속 시/도 지표를 붙임
+            for k, v in metrics.get(sido_code, {}).items():
+                if v is not None:
+                    props[k] = v
+            features.append({"geometry": geom, "properties": props})
+
+        if not features:
+            return b""
+        return mapbox_vector_tile.encode(
+            [{"name": LAYER_NAME, "features": features}],
+            default_options={"extents": EXTENT, "y_coord_down": False},
+        )
+
+
+_geometry = SigunguGeometry(SIGUNGU_GEOJSON_PATH)
+_tiles = LRUCache(TILE_MEMORY_CACHE_SIZE)
+_metrics = LRUCache(32)
+_pruned_for: Optional[str] = None
+_prune_lock = threading.Lock()
+
+
+def _prune_disk_cache(version: str) -> None:
+    """
+    현재 버전 디렉터리보다 오래된(mtime) 버전 디렉터리 삭제 (버전마다 프로세스당 한 번)
+    - 더 새 디렉터리는 남김: 버전 캐시(TTL)가 늦은 워커가 다른 워커의 새 캐시를 지우지 않도록
+    """
+    global _pruned_for
+    with _prune_lock:
+        if _pruned_for == version:
+            return
+        _pruned_for = version
+        current = TILE_CACHE_DIR / version
+        try:
+            current.mkdir(parents=True, exist_ok=True)
+            current_mtime = current.stat().st_mtime
+            stale = [d for d in TILE_CACHE_DIR.iterdir() if d.is_dir() and d != current and d.stat().st_mtime < current_mtime]
+        except OSError as e:
+            logger.warning("tile cache prune skipped: %s", e)
+            return
+        for d in stale:
+            shutil.rmtree(d, ignore_errors=True)
+
+
+def tile_version(db: Session) -> str:
+    """타일 내용의 버전 (통계 버전 + 경계 파일 버전). 경계 파일이 없으면 TileGeometryNotFound"""
+    _geometry.ensure_loaded()
+    return f"{get_stats_version(db)}-{_geometry.version}"
+
+
+def _get_metrics(db: Session, version: str, year: Optional[int]) -> dict[str, dict]:
+    key = (version, year)
+    cached = _metrics.get(key)
+    if cached is None:
+        cached = find_region_metrics(db, year)
+        _metrics.set(key, cached)
+    return cached
+
+
+def get_tile(db: Session, z: int, x: int, y: int, year: Optional[int] = None) -> tuple[bytes, str]:
+    """반환: (MVT 바이트, 타일 버전)"""
+    if not (0 <= z <= 22) or not (0 <= x < 2 ** z) or not (0 <= y < 2 ** z):
+        raise ValueError(f"invalid tile coordinate: {z}/{x}/{y}")
+
+    version = tile_version(db)
+    key = (version, year, z, x, y)
+    _prune_disk_cache(version)
+
+    data = _tiles.get(key)
+    if data is not None:
+        return data, version
+
+    path = TILE_CACHE_DIR / version / str(year or "latest") / str(z) / str(x) / f"{y}.mvt"
+    data = read_bytes(path)
+    if data is None:
+        data = _geometry.render(z, x, y, _get_metrics(db, version, year))
+        write_bytes_atomic(path, data)
+
+    _tiles.set(key, data)
+    return data, version
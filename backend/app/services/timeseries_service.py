@@ -0,0 +1,97 @@
+from typing import Optional
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache
+from app.core.data_version import get_data_version
+from app.core.regions import REGION_CODE_TO_NAME, to_region_code
+from app.repositories.stats_repository import find_registration_series, find_yearly_pollution
+from app.services.downsample import lttb, minmax_scale
+
+GRANULARITIES = ("month", "quarter", "year")
+
+_cache = LRUCache(128)
+
+
+def _x_axis(period_starts: list[str]) -> np.ndarray:
+    """'YYYY-MM-DD' -> 월 단위 정수 축 (LTTB의 x값)"""
+    return np.array([int(s[0:4]) * 12 + int(s[5:7]) - 1 for s in period_starts], dtype=np.float64)
+
+
+def _build_region_series(rows: list[dict], pollution: dict, max_points: int, normalize: bool) -> dict:
+    # 대기오염도는 연 단위 데이터라 월/분기 구간에는 해당 연도 값을 적용
+    code = rows[0]["code"]
+    reg = np.array([r["registration_count"] for r in rows], dtype=np.float64)
+    poll = np.array(
+        [pollution.get((code, int(r["period_start"][0:4])), np.nan) for r in rows],
+        dtype=np.float64,
+    )
+
+    # 정규화는 다운샘플링 전에 전체 구간 기준으로
+    reg_norm = minmax_scale(reg) if normalize else None
+    poll_norm = minmax_scale(poll) if normalize else None
+
+    keep = lttb(_x_axis([r["period_start"] for r in rows]), reg, max_points)
+
+    points = []
+    for i in keep:
+        p = {
+            "period": rows[i]["period"],
+            "period_start": rows[i]["period_start"],
+            "registration_count": int(reg[i]),
+            "pollution_degree": None if np.isnan(poll[i]) else float(poll[i]),
+        }
+        if normalize:
+            p["registration_norm"] = round(float(reg_norm[i]), 2)
+            p["pollution_norm"] = None if np.isnan(poll_norm[i]) else round(float(poll_norm[i]), 2)
+        points.append(p)
+
+    return {
+        "region": {"code": code, "name": rows[0]["name"] or REGION_CODE_TO_NAME.get(code, "")},
+        "raw_points": len(rows),
+        "points": points,
+    }
+
+
+def get_timeseries(
+    db: Session,
+    granularity: str = "month",
+    sido_code: Optional[str] = None,
+    car_type: Optional[str] = None,
+    usage: Optional[str] = None,
+    normalize: bool = False,
+    max_points: int = 300,
+) -> dict:
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"unknown granularity: {granularity} (allowed: {', '.join(GRANULARITIES)})")
+
+    key = (get_data_version(db), granularity, sido_code, car_type, usage, normalize, max_points)
+    cached = _cache.get(key)
+    if cached is not None:
+        return cached
+
+    rows = find_registration_series(db, granularity, to_region_code(sido_code), car_type, usage)
+    pollution = {
+        (r["code"], r["year"]): r["pollution_degree"]
+        for r in find_yearly_pollution(db)
+        if r["pollution_degree"] is not None
+    }
+
+    # 지역별로 묶기 (SQL에서 지역, 기간 순 정렬됨)
+    by_region: dict[str, list[dict]] = {}
+    for r in rows:
+        by_region.setdefault(r["code"], []).append(r)
+
+    payload = {
+        "filters": {
+            "granularity": granularity, "sido_code": sido_code, "car_type": car_type,
+            "usage": usage, "normalize": normalize, "max_points": max_points,
+        },
+        "series": [
+            _build_region_series(region_rows, pollution, max_points, normalize)
+            for region_rows in by_region.values()
+        ],
+    }
+    _cache.set(key, payload)
+    return payload
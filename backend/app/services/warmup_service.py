@@ -0,0 +1,134 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import DB_POOL_PREFILL, DB_POOL_SIZE
+from app.core.data_version import get_data_version
+from app.core.database import ReadSessionLocal, get_engine, get_replica_pool
+
+# -------------------------
+# 기동 워밍업
+# - 1) 커넥션 풀에 DB_POOL_PREFILL개 커넥션을 미리 열어 둠 (실패하면 not ready)
+# - 2) 읽기 레플리카가 설정돼 있으면 헬스 체크를 한 번 (정상 레플리카가 없어도 조회는 primary로 계속)
+# - 3) 차원 데이터/자주 쓰는 집계 캐시를 기본 조건으로 조회 세션(레플리카)에서 한 번씩 계산
+#      (개별 단계 실패는 로그만 남기고 계속, 해당 캐시는 첫 요청에서 채워짐)
+# - /ready 는 워밍업이 끝날 때까지 503
+# -------------------------
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_state = {"status": "starting", "started_at": None, "finished_at": None, "steps": []}
+
+
+def _prefill_pool() -> int:
+    """풀 크기 안에서 커넥션 N개를 동시에 빌렸다가 돌려줘서 유휴 커넥션으로 남겨 둔다."""
+    engine = get_engine()
+    n = max(0, min(DB_POOL_PREFILL, DB_POOL_SIZE))
+    conns = []
+    try:
+        for _ in range(n):
+            conn = engine.connect()
+            conns.append(conn)
+            conn.execute(text("SELECT 1"))
+    finally:
+        for conn in conns:
+            conn.close()
+    return n
+
+
+def _cache_steps() -> list[tuple[str, Callable[[Session], object]]]:
+    # 서비스 모듈은 여기서 import (numpy/shapely 등 로딩도 워밍업 시간에 포함)
+    from app.services.analysis_service import get_correlation
+    from app.services.dashboard_service import get_dashboard_bundle
+    from app.services.dimension_service import get_filters, get_regions
+    from app.services.faq_search import build_faq_index
+    from app.services.heatmap_service import get_heatmap
+    from app.services.hot_datasets import get_hot_datasets
+    from app.services.subsidy_service import get_subsidy_table
+    from app.services.timeseries_service import get_timeseries
+
+    return [
+        ("data_version", get_data_version),
+        ("hot_datasets", get_hot_datasets),
+        ("regions", get_regions),
+        ("filters", get_filters),
+        ("faq_index", build_faq_index),
+        ("dashboard_bundle", lambda db: get_dashboard_bundle(db, None, True)),
+        ("subsidy_table", lambda db: get_subsidy_table()),
+        ("timeseries", lambda db: get_timeseries(db, "month", None, None, None, False, 300)),
+        ("correlation", get_correlation),
+        ("heatmap_registrations", lambda db: get_heatmap(db, "registrations")),
+        ("heatmap_pollution", lambda db: get_heatmap(db, "pollution")),
+    ]
+
+
+def _record(name: str, started: float, error: Exception = None) -> None:
+    step = {"name": name, "ms": round((time.perf_counter() - started) * 1000, 1), "ok": error is None}
+    if error is not None:
+        step["error"] = f"{type(error).__name__}: {error}"
+    with _lock:
+        _state["steps"].append(step)
+
+
+def _run_cache_step(name: str, fn: Callable[[Session], object]) -> None:
+    started = time.perf_counter()
+    db = ReadSessionLocal()
+    try:
+        fn(db)
+        _record(name, started)
+    except Exception as e:
+        logger.exception("warmup step %s failed", name)
+        _record(name, started, e)
+    finally:
+        db.close()
+
+
+def warm_up() -> None:
+    """lifespan에서 백그라운드로 호출. 끝나면 status가 ready(또는 failed)가 된다."""
+    with _lock:
+        _state.update(status="warming", started_at=time.time(), finished_at=None, steps=[])
+
+    started = time.perf_counter()
+    try:
+        _prefill_pool()
+        _record("db_pool", started)
+    except Exception as e:
+        logger.exception("warmup: DB connection failed")
+        _record("db_pool", started, e)
+        with _lock:
+            _state.update(status="failed", finished_at=time.time())
+        return
+
+    replicas = get_replica_pool()
+    if len(replicas):
+        started = time.perf_counter()
+        healthy = replicas.check_all()
+        _record("replicas", started, None if healthy else RuntimeError("no healthy replica, reads use primary"))
+
+    steps = _cache_steps()
+    # data_version은 다른 캐시 키에, hot_datasets는 여러 캐시의 원본으로 쓰이므로 먼저 차례로
+    # 나머지는 풀 크기 안에서 병렬로
+    for step in steps[:2]:
+        _run_cache_step(*step)
+    with ThreadPoolExecutor(max_workers=max(1, min(4, DB_POOL_SIZE))) as pool:
+        list(pool.map(lambda s: _run_cache_step(*s), steps[2:]))
+
+    with _lock:
+        _state.update(status="ready", finished_at=time.time())
+    logger.info("warmup finished in %.1f ms", (time.perf_counter() - started) * 1000)
+
+
+def mark_ready() -> None:
+    """워밍업을 끈 경우 바로 ready로 표시"""
+    with _lock:
+        _state.update(status="ready", finished_at=time.time())
+
+
+def get_readiness() -> dict:
+    with _lock:
+        return {**_state, "steps": list(_state["steps"])}
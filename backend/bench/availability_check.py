@@ -0,0 +1,174 @@
+"""
+충전기 실시간 상태 점검 (DB/외부 API 없이)
+
+- mock 소스로 충전소 N곳의 상태를 만들어 저장소에 반영: 초기 적재/폴링 1회 반영 시간, 저장소 크기, 변경분 개수
+- /stations/availability/stream 을 ASGI로 직접 호출해서 (같은 이벤트 루프)
+  snapshot -> delta 순서로 오는지, ids 필터가 적용되는지, gzip 요청에도 압축/버퍼링 없이 바로 흘러가는지,
+  Last-Event-ID로 재접속하면 놓친 변경분만 오는지, 다른 워커가 준 id(EPOCH가 다름)면 스냅샷부터 오는지 확인
+- 공유 폴러: 잠금을 잡은 쪽만 리더, 팔로워는 리더가 내려 둔 파일로 같은 요약이 되는지
+
+사용법 (backend 디렉터리에서):
+    python bench/availability_check.py --stations 60000 --polls 5
+"""
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.api.app_api import app  # noqa: E402
+from app.services import availability_service as av  # noqa: E402
+from app.services.charger_status_source import MockStatusSource  # noqa: E402
+
+
+def parse_events(raw: bytes) -> list[dict]:
+    events = []
+    for block in raw.decode("utf-8").split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if ": " in line and not line.startswith(":"))
+        if "event" in fields:
+            events.append({
+                "id": fields["id"],
+                "seq": av.parse_event_id(fields["id"]),
+                "event": fields["event"],
+                "data": json.loads(fields["data"]),
+            })
+    return events
+
+
+async def open_stream(query: str, headers: list[tuple[bytes, bytes]]):
+    """스트림 요청을 보내고 (받은 바이트 버퍼, 응답 헤더, 끊기 함수, 태스크)"""
+    disconnect = asyncio.Event()
+    body, start = bytearray(), {}
+
+    async def receive():
+        await disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            start.update(status=message["status"], headers=dict(message["headers"]))
+        elif message["type"] == "http.response.body":
+            body.extend(message.get("body", b""))
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": "/stations/availability/stream", "raw_path": b"/stations/availability/stream",
+        "query_string": query.encode(), "headers": headers, "client": ("127.0.0.1", 1), "server": ("test", 80),
+        "root_path": "",
+    }
+    task = asyncio.create_task(app(scope, receive, send))
+    return body, start, disconnect, task
+
+
+async def settle(n: int = 20) -> None:
+    for _ in range(n):
+        await asyncio.sleep(0.01)
+
+
+async def check_stream(source: MockStatusSource, watch_ids: set[int]) -> None:
+    headers = [(b"accept-encoding", b"gzip, br"), (b"accept", b"text/event-stream")]
+    ids_param = "ids=" + ",".join(map(str, sorted(watch_ids)))
+    body, start, disconnect, task = await open_stream(ids_param, headers)
+    await settle()
+
+    # 구독 중에 폴링 몇 번
+    for _ in range(3):
+        av.hub.publish(av.store.apply(source.fetch()))
+        await settle()
+    first = parse_events(bytes(body))
+    disconnect.set()
+    await asyncio.wait_for(task, 5)
+
+    encoding = start["headers"].get(b"content-encoding")
+    assert start["status"] == 200, start
+    assert encoding is None, f"stream must not be compressed (content-encoding={encoding!r})"
+    assert first and first[0]["event"] == "snapshot", first[:1]
+    deltas = [e for e in first if e["event"] == "delta"]
+    assert all(c["station_id"] in watch_ids for e in deltas for c in e["data"]), "ids filter leaked other stations"
+    print(f"stream: snapshot({len(first[0]['data'])} stations) + {len(deltas)} delta events, uncompressed, filtered")
+
+    # 재접속: 마지막으로 받은 id 이후만
+    last = first[-1]
+    assert last["seq"] is not None, last["id"]
+    for _ in range(2):
+        av.hub.publish(av.store.apply(source.fetch()))
+    body, start, disconnect, task = await open_stream(ids_param, headers + [(b"last-event-id", last["id"].encode())])
+    await settle()
+    disconnect.set()
+    await asyncio.wait_for(task, 5)
+    resumed = parse_events(bytes(body))
+    assert all(e["event"] == "delta" and e["seq"] > last["seq"] for e in resumed), resumed[:1]
+    print(f"resume from id {last['id']}: {len(resumed)} missed delta events replayed, no snapshot")
+
+    # 다른 워커가 준 id (순번은 같아도 EPOCH가 다름) -> 이어 보내지 않고 스냅샷
+    foreign = f"0{av.EPOCH}-{last['seq']}"
+    body, start, disconnect, task = await open_stream(ids_param, headers + [(b"last-event-id", foreign.encode())])
+    await settle()
+    disconnect.set()
+    await asyncio.wait_for(task, 5)
+    other = parse_events(bytes(body))
+    assert other and other[0]["event"] == "snapshot", other[:1]
+    print(f"resume with foreign id {foreign}: snapshot")
+    assert not av.hub.subscribers, "subscribers must be released on disconnect"
+
+
+def check_shared_feed(mapping: dict[str, int]) -> None:
+    directory = Path(tempfile.mkdtemp(prefix="avail_feed_"))
+    leader_feed, follower_feed = av.SharedFeed(directory), av.SharedFeed(directory)
+    assert leader_feed.is_leader() and not follower_feed.is_leader(), "only one worker may lead"
+
+    leader, follower = av.AvailabilityStore(), av.AvailabilityStore()
+    leader.set_mapping(mapping)
+    follower.set_mapping(mapping)
+    source = MockStatusSource(sorted(mapping), seed=11)
+    for _ in range(3):
+        if leader.apply(source.fetch()):
+            leader_feed.write(leader.charger_statuses())
+        follower.apply(follower_feed.read_new() or [])
+    assert follower_feed.read_new() is None, "unchanged file must not be re-read"
+
+    key = lambda rows: sorted((r["stat_id"], r["available"], r["charging"], r["total"]) for r in rows)  # noqa: E731
+    assert key(leader.snapshot()) == key(follower.snapshot())
+    leader_feed.close()
+    assert follower_feed.is_leader(), "follower takes over when the leader releases the lock"
+    follower_feed.close()
+    print(f"shared feed: follower summary matches leader ({follower.station_count:,} stations), takeover ok")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--stations", type=int, default=60000)
+    parser.add_argument("--polls", type=int, default=5)
+    parser.add_argument("--change-rate", type=float, default=0.02)
+    args = parser.parse_args()
+
+    mapping = {f"ME{i:08d}": i for i in range(1, args.stations + 1)}
+    av.store.set_mapping(mapping)
+    source = MockStatusSource(sorted(mapping), change_rate=args.change_rate, seed=7)
+
+    t0 = time.perf_counter()
+    initial = av.store.apply(source.fetch())
+    print(
+        f"initial load: {len(av.store):,} chargers / {av.store.station_count:,} stations "
+        f"in {(time.perf_counter() - t0) * 1000:.0f} ms, store {av.store.nbytes() / 1024:.0f} KiB (+ index dicts)"
+    )
+    av.hub.publish(initial)
+
+    for i in range(args.polls):
+        batch = source.fetch()
+        t0 = time.perf_counter()
+        changes = av.store.apply(batch)
+        ms = (time.perf_counter() - t0) * 1000
+        av.hub.publish(changes)
+        print(f"poll {i + 1}: {len(batch):,} charger updates -> {len(changes):,} station deltas ({ms:.1f} ms)")
+
+    asyncio.run(check_stream(source, set(range(1, 201))))
+    check_shared_feed({k: v for k, v in list(mapping.items())[:2000]})
+
+
+if __name__ == "__main__":
+    main()
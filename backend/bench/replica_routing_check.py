@@ -0,0 +1,99 @@
+"""
+읽기/쓰기 세션 라우팅 점검 (DB 없이 SQLite 파일 3개로)
+
+- primary 1개 + 레플리카 2개를 임시 SQLite 파일로 만들고, heartbeat 테이블의 값을 복제 지연으로 사용
+- 확인하는 것:
+  1) 조회 세션은 정상 레플리카를 라운드로빈으로 돈다
+  2) 지연이 DB_REPLICA_MAX_LAG_SEC를 넘는 레플리카는 빠진다
+  3) 정상 레플리카가 없으면 primary로 간다
+  4) 쓰기 세션(SessionLocal)은 항상 primary
+
+사용법 (backend 디렉터리에서):
+    python bench/replica_routing_check.py
+"""
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+TMP = Path(tempfile.mkdtemp(prefix="replica_check_"))
+DBS = {"primary": TMP / "primary.db", "r1": TMP / "r1.db", "r2": TMP / "r2.db"}
+
+# app.core.config 를 import 하기 전에 환경변수 설정
+os.environ["DB_REPLICA_URLS"] = ",".join(f"sqlite:///{DBS[n]}" for n in ("r1", "r2"))
+os.environ["DB_REPLICA_LAG_SQL"] = "SELECT lag_sec FROM heartbeat"
+os.environ["DB_REPLICA_MAX_LAG_SEC"] = "5"
+os.environ["DB_REPLICA_CHECK_INTERVAL_SEC"] = "0"
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import create_engine, text  # noqa: E402
+
+import app.core.database as database  # noqa: E402
+
+
+def set_lag(name: str, lag) -> None:
+    with sqlite3.connect(DBS[name]) as conn:
+        conn.execute("DELETE FROM heartbeat")
+        conn.execute("INSERT INTO heartbeat VALUES (?)", (lag,))
+
+
+def setup() -> None:
+    for name, path in DBS.items():
+        with sqlite3.connect(path) as conn:
+            conn.execute("CREATE TABLE heartbeat (lag_sec REAL)")
+            conn.execute("CREATE TABLE whoami (name TEXT)")
+            conn.execute("INSERT INTO whoami VALUES (?)", (name,))
+        set_lag(name, 0)
+
+    # primary도 SQLite로 바꿔 끼움
+    database._engine = create_engine(f"sqlite:///{DBS['primary']}")
+    database.SessionLocal.configure(bind=database._engine)
+
+
+def whoami(factory) -> str:
+    db = factory()
+    try:
+        return db.execute(text("SELECT name FROM whoami")).scalar()
+    finally:
+        db.close()
+
+
+def reads(n: int = 4) -> list[str]:
+    return [whoami(database.ReadSessionLocal) for _ in range(n)]
+
+
+def main() -> None:
+    setup()
+
+    got = reads()
+    assert sorted(set(got)) == ["r1", "r2"] and got[0] != got[1], got
+    print("round robin       :", got)
+
+    set_lag("r2", 30)
+    got = reads()
+    assert set(got) == {"r1"}, got
+    print("r2 lagging        :", got)
+
+    set_lag("r1", None)  # 복제 중단
+    got = reads()
+    assert set(got) == {"primary"}, got
+    print("no healthy replica:", got)
+
+    set_lag("r1", 0)
+    set_lag("r2", 1)
+    got = reads()
+    assert set(got) == {"r1", "r2"}, got
+    print("recovered         :", got)
+
+    assert whoami(database.SessionLocal) == "primary"
+    print("write session     : primary")
+    print("status            :", database.get_replica_pool().status())
+    database.dispose_engine()
+    shutil.rmtree(TMP, ignore_errors=True)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+응답 직렬화/압축 벤치마크
+
+/stats/registrations, /stations 와 같은 모양의 큰 페이로드를 만들어서
+- FastAPI 기본 경로 (jsonable_encoder + json.dumps)
+- orjson / MessagePack
+- gzip / brotli 압축 (크기, 시간)
+- EncodedPayload 캐시 재사용 (두 번째 요청부터는 인코딩 없이 바이트 반환)
+을 비교한다. DB 없이 실행 가능.
+
+사용법 (backend 디렉터리에서):
+    python bench/serialization_bench.py
+    python bench/serialization_bench.py --months 120 --stations 50000 --repeat 5
+"""
+import argparse
+import gzip
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+
+from app.core.config import BROTLI_QUALITY, GZIP_LEVEL  # noqa: E402
+from app.core.regions import REGION_CODE_TO_NAME  # noqa: E402
+from app.core.serialization import EncodedPayload, brotli, dumps_json, dumps_msgpack, msgpack, orjson  # noqa: E402
+
+VEHICLE_TYPES = ("EV", "HYBRID", "H2", "ICE")
+USAGE_TYPES = ("PRIVATE", "COMMERCIAL")
+
+
+def registrations_payload(months: int) -> dict:
+    rng = random.Random(0)
+    data = []
+    for m in range(months):
+        base_month = (2015 + m // 12) * 100 + m % 12 + 1
+        for code, name in REGION_CODE_TO_NAME.items():
+            for vt in VEHICLE_TYPES:
+                for ut in USAGE_TYPES:
+                    data.append({
+                        "base_month": base_month,
+                        "region": {"code": code, "name": name},
+                        "vehicle_type": vt,
+                        "usage_type": ut,
+                        "registration_count": rng.randint(0, 500_000),
+                    })
+    return {"filters": {"year": None, "sido_code": None, "car_type": None, "usage": None}, "data": data}
+
+
+def stations_payload(n: int) -> list:
+    rng = random.Random(1)
+    return [
+        {
+            "id": i,
+            "name": f"충전소 {i}",
+            "address": f"서울특별시 강남구 테헤란로 {i % 500}",
+            "latitude": round(rng.uniform(33.0, 38.5), 6),
+            "longitude": round(rng.uniform(124.5, 131.0), 6),
+            "type": "전기차" if i % 5 else "수소차",
+        }
+        for i in range(n)
+    ]
+
+
+def timed(fn, repeat: int):
+    best = float("inf")
+    out = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return out, best * 1000
+
+
+def bench(name: str, payload, repeat: int) -> None:
+    print(f"\n## {name}")
+    print(f"{'method':<38}{'ms':>10}{'bytes':>14}")
+
+    def row(label, fn):
+        body, ms = timed(fn, repeat)
+        print(f"{label:<38}{ms:>10.1f}{len(body):>14,}")
+        return body
+
+    baseline = row(
+        "jsonable_encoder + json.dumps",
+        lambda: json.dumps(jsonable_encoder(payload), ensure_ascii=False).encode("utf-8"),
+    )
+    body = row("orjson" if orjson else "json (orjson 없음)", lambda: dumps_json(payload))
+    if msgpack:
+        row("msgpack", lambda: dumps_msgpack(payload))
+
+    row(f"gzip level {GZIP_LEVEL} (json)", lambda: gzip.compress(body, compresslevel=GZIP_LEVEL))
+    if brotli:
+        row(f"brotli quality {BROTLI_QUALITY} (json)", lambda: brotli.compress(body, quality=BROTLI_QUALITY))
+
+    # 캐시된 EncodedPayload: 첫 요청에서 인코딩/압축, 이후는 같은 바이트
+    encoded = EncodedPayload(payload)
+    encoding = "br" if brotli else "gzip"
+    encoded.body("json", encoding)
+    row(f"EncodedPayload cached ({encoding})", lambda: encoded.body("json", encoding))
+
+    print(f"(기본 경로 대비 크기: {len(baseline):,} bytes)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="응답 직렬화/압축 벤치마크")
+    parser.add_argument("--months", type=int, default=120, help="/stats/registrations 개월 수")
+    parser.add_argument("--stations", type=int, default=20000, help="/stations 행 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    bench(f"/stats/registrations ({args.months} months)", registrations_payload(args.months), args.repeat)
+    bench(f"/stations ({args.stations:,} rows)", stations_payload(args.stations), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+워커 간 공유 메모리 캐시 점검 (DB 없이)
+
+- 워커 프로세스 N개가 같은 버전을 동시에 요청 -> 빌드는 한 번만, 나머지는 붙기만 하는지
+- 각 워커의 배열이 같은 세그먼트를 가리키는지 (복사 없음), 워커별 메모리(RssAnon/RssShmem, Linux)
+- 버전이 바뀌면 새 세그먼트로 교체되고 이전 세그먼트 이름은 지워지는지
+- 버전 캐시가 아직 이전 버전인 워커는 새 세그먼트를 덮어쓰지 않고 다시 확인한 버전으로 붙기만 하는지
+
+사용법 (backend 디렉터리에서):
+    python bench/shared_cache_check.py --workers 4 --stations 2000000
+"""
+import argparse
+import multiprocessing as mp
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np  # noqa: E402
+
+from app.core.shared_store import SharedArrayStore  # noqa: E402
+
+
+def fake_arrays(version: str, stations: int) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(abs(hash(version)) % 2**32)
+    return {
+        "region_codes": np.array(["11", "26", "27", "41"], dtype=str),
+        "reg_yearly": rng.random((4, 10)),
+        "station_lat": rng.uniform(33.0, 38.7, stations),
+        "station_lng": rng.uniform(124.5, 131.0, stations),
+    }
+
+
+def memory_kb() -> dict:
+    out = {}
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(("RssAnon", "RssShmem")):
+                    k, v = line.split(":")
+                    out[k] = int(v.split()[0])
+    except OSError:
+        pass
+    return out
+
+
+def worker(directory: str, version: str, stations: int, built, barrier, results) -> None:
+    store = SharedArrayStore(Path(directory), "vaicheck")
+    barrier.wait()
+
+    def build():
+        with built.get_lock():
+            built.value += 1
+        return fake_arrays(version, stations)
+
+    ds = store.get_or_build(version, build)
+    # 한 번씩 전부 읽어서 페이지를 매핑
+    checksum = float(ds["station_lat"].sum() + ds["station_lng"].sum())
+    results.put({
+        "version": ds.version,
+        "segment": ds.segment,
+        "checksum": round(checksum, 3),
+        "writeable": bool(ds["station_lat"].flags.writeable),
+        **memory_kb(),
+    })
+    barrier.wait()  # 모두 읽을 때까지 세그먼트 유지
+
+
+def run(directory: Path, version: str, workers: int, stations: int) -> list[dict]:
+    ctx = mp.get_context("spawn")
+    built = ctx.Value("i", 0)
+    barrier = ctx.Barrier(workers)
+    results = ctx.Queue()
+    procs = [ctx.Process(target=worker, args=(str(directory), version, stations, built, barrier, results)) for _ in range(workers)]
+    for p in procs:
+        p.start()
+    rows = [results.get() for _ in procs]
+    for p in procs:
+        p.join()
+    print(f"\n## version {version}: builds={built.value}")
+    for r in rows:
+        print(r)
+    assert built.value == 1, "빌드는 한 번만"
+    assert len({r["segment"] for r in rows}) == 1 and len({r["checksum"] for r in rows}) == 1
+    assert not any(r["writeable"] for r in rows)
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="공유 메모리 캐시 점검")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--stations", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    directory = Path(tempfile.mkdtemp(prefix="shm_check_"))
+    try:
+        print(f"배열 크기: {sum(a.nbytes for a in fake_arrays('v', args.stations).values()) / 1e6:.1f} MB")
+        first = run(directory, "v1", args.workers, args.stations)
+        second = run(directory, "v2", args.workers, args.stations)
+        assert first[0]["segment"] != second[0]["segment"]
+
+        store = SharedArrayStore(directory, "vaicheck")
+        try:
+            store._attach({**store.read_manifest(), "segment": first[0]["segment"]})
+            raise AssertionError("이전 세그먼트가 남아 있음")
+        except FileNotFoundError:
+            print("\n이전 세그먼트 unlink 확인")
+
+        # 버전 캐시(TTL)가 아직 v1인 워커: 다시 확인하면 v2 -> 빌드/게시 없이 v2에 붙음
+        stale = SharedArrayStore(directory, "vaicheck")
+        builds = []
+        ds = stale.get_or_build("v1", lambda: builds.append(1) or fake_arrays("v1", 10), lambda: "v2")
+        assert not builds and ds.version == "v2" and ds.segment == second[0]["segment"], (builds, ds.version)
+        assert store.read_manifest()["segment"] == second[0]["segment"]
+        print("stale worker attached to v2 without rebuilding")
+
+        # 정리: 마지막 세그먼트도 지움 (서비스에서는 다음 게시 때 지워짐)
+        from app.core.shared_store import _unlink_segment
+        _unlink_segment(store.read_manifest()["segment"])
+        print("OK")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
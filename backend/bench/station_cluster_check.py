@@ -0,0 +1,76 @@
+"""
+충전소 클러스터 인덱스 점검 (DB 없이)
+
+- 무작위 충전소 N개로 인덱스를 만들고 빌드 시간 / 메모리(칸 수) 확인
+- 줌마다 칸 개수 합이 N과 같은지 (계층 격자에서 점이 빠지거나 중복되지 않는지)
+- 여러 bbox x 줌 조합에서 응답 개수(clusters + points)가 상한을 넘지 않는지, 조회 시간
+
+사용법 (backend 디렉터리에서):
+    python bench/station_cluster_check.py --stations 300000 --max-features 300
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np  # noqa: E402
+
+from app.services.station_cluster_service import DEFAULT_BBOX, StationClusterIndex  # noqa: E402
+
+
+def fake_stations(n: int, seed: int = 0) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # 도시 주변에 몰려 있는 분포 + 전국에 흩어진 분포
+    rng = np.random.default_rng(seed)
+    centers = np.array([(37.56, 126.98), (35.18, 129.08), (35.87, 128.60), (37.46, 126.70), (36.35, 127.38)])
+    k = n * 7 // 10
+    pick = centers[rng.integers(0, len(centers), k)]
+    lat = np.concatenate([pick[:, 0] + rng.normal(0, 0.08, k), rng.uniform(33.2, 38.5, n - k)])
+    lng = np.concatenate([pick[:, 1] + rng.normal(0, 0.08, k), rng.uniform(126.0, 129.5, n - k)])
+    return lat, lng, np.arange(1, n + 1, dtype=np.int64)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--stations", type=int, default=300000)
+    parser.add_argument("--max-zoom", type=int, default=16)
+    parser.add_argument("--cell-bits", type=int, default=2, help="타일당 격자 칸 수 = 2^bits (2 -> 64px 칸)")
+    parser.add_argument("--max-features", type=int, default=300)
+    args = parser.parse_args()
+
+    lat, lng, ids = fake_stations(args.stations)
+    t0 = time.perf_counter()
+    index = StationClusterIndex(lat, lng, ids, args.max_zoom, args.cell_bits)
+    build_ms = (time.perf_counter() - t0) * 1000
+    cells = sum(len(level["cx"]) for level in index.levels.values())
+    print(f"build: {build_ms:.0f} ms, {args.stations:,} stations -> {cells:,} cells over {len(index.levels)} zoom levels")
+
+    for z, level in sorted(index.levels.items()):
+        assert int(level["count"].sum()) == args.stations, f"zoom {z}: count mismatch"
+    print("hierarchy: every zoom level accounts for all stations")
+
+    views = {
+        "korea": DEFAULT_BBOX,
+        "seoul": (126.76, 37.42, 127.18, 37.70),
+        "gangnam": (127.00, 37.48, 127.08, 37.52),
+        "block": (126.975, 37.560, 126.985, 37.566),
+    }
+    worst = 0
+    for name, bbox in views.items():
+        for zoom in (7, 10, 12, 14, 16, 18):
+            t0 = time.perf_counter()
+            r = index.query(bbox, zoom, args.max_features)
+            ms = (time.perf_counter() - t0) * 1000
+            n = len(r["clusters"]) + len(r["points"])
+            worst = max(worst, n)
+            assert n <= args.max_features, f"{name} z{zoom}: {n} features"
+            print(
+                f"{name:8s} z{zoom:<2d} -> grid z{r['cluster_zoom']!s:4s} "
+                f"clusters={len(r['clusters']):4d} points={len(r['points']):4d} total={r['total']:7d} {ms:6.2f} ms"
+            )
+    print(f"max features in one response: {worst} (limit {args.max_features})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+0001 지역 차원 테이블 (region_dim) + 등록 통계를 정수 지역 키로 이전
+
+1) region_dim 생성 (app.models.region.Region 정의 그대로), 시/도 17개 upsert
+   --with-sigungu: 시/군/구 경계 GeoJSON(SIGUNGU_GEOJSON_PATH)의 SIG_CD/이름/중심점도 level 2로 upsert
+2) car_registration_stats.region_code SMALLINT UNSIGNED 추가 -> region_name으로 채움
+   -> 못 채운 행이 있으면 여기서 중단 (이름 목록 출력)
+   -> NOT NULL + (region_code, base_month) 인덱스 + region_dim FK
+3) air_pollution.region_code 를 SMALLINT UNSIGNED로 맞추고 (region_code, year) 인덱스
+4) --drop-region-name: 등록 통계의 region_name 문자열 컬럼 삭제 (API는 더 이상 읽지 않음)
+
+여러 번 실행해도 됨 (이미 된 단계는 건너뜀). primary DB(.env)에 적용.
+
+사용법 (backend 디렉터리에서):
+    python migrations/0001_region_dim.py --dry-run
+    python migrations/0001_region_dim.py --with-sigungu
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import text  # noqa: E402
+
+from app.core.config import SIGUNGU_GEOJSON_PATH  # noqa: E402
+from app.core.database import get_engine  # noqa: E402
+from app.core.regions import REGION_CENTROIDS, REGION_CODE_TO_NAME, SIDO_LEVEL, SIGUNGU_LEVEL  # noqa: E402
+from app.models.region import Region  # noqa: E402
+
+UPSERT_SQL = """
+    INSERT INTO region_dim (region_code, level, parent_code, name, lat, lng)
+    VALUES (:region_code, :level, :parent_code, :name, :lat, :lng)
+    ON DUPLICATE KEY UPDATE
+        level = VALUES(level), parent_code = VALUES(parent_code), name = VALUES(name),
+        lat = VALUES(lat), lng = VALUES(lng)
+"""
+
+
+class Migration:
+    def __init__(self, conn, dry_run: bool):
+        self.conn = conn
+        self.dry_run = dry_run
+
+    def run(self, sql: str, params=None) -> None:
+        print(" ".join(sql.split()) + (f"  -- {len(params)} rows" if isinstance(params, list) else ""))
+        if not self.dry_run:
+            self.conn.execute(text(sql), params or {})
+
+    def scalar(self, sql: str, **params):
+        return self.conn.execute(text(sql), params).scalar()
+
+    def column_type(self, table: str, column: str):
+        return self.scalar("""
+            SELECT COLUMN_TYPE FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :t AND COLUMN_NAME = :c
+        """, t=table, c=column)
+
+    def is_nullable(self, table: str, column: str) -> bool:
+        return self.scalar("""
+            SELECT IS_NULLABLE FROM information_schema.COLUMNS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :t AND COLUMN_NAME = :c
+        """, t=table, c=column) != "NO"
+
+    def has_index(self, table: str, name: str) -> bool:
+        return bool(self.scalar("""
+            SELECT COUNT(*) FROM information_schema.STATISTICS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :t AND INDEX_NAME = :n
+        """, t=table, n=name))
+
+    def has_constraint(self, table: str, name: str) -> bool:
+        return bool(self.scalar("""
+            SELECT COUNT(*) FROM information_schema.TABLE_CONSTRAINTS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :t AND CONSTRAINT_NAME = :n
+        """, t=table, n=name))
+
+
+def sido_rows() -> list[dict]:
+    return [
+        {
+            "region_code": int(code), "level": SIDO_LEVEL, "parent_code": None, "name": name,
+            "lat": REGION_CENTROIDS.get(code, (None, None))[0], "lng": REGION_CENTROIDS.get(code, (None, None))[1],
+        }
+        for code, name in sorted(REGION_CODE_TO_NAME.items())
+    ]
+
+
+def sigungu_rows(path: Path) -> list[dict]:
+    from shapely.geometry import shape
+
+    with open(path, "r", encoding="utf-8") as f:
+        features = json.load(f)["features"]
+    rows = []
+    for ft in features:
+        props = ft["properties"]
+        code = str(props.get("SIG_CD") or props.get("code"))
+        if not code.isdigit() or len(code) != 5 or code[:2] not in REGION_CODE_TO_NAME:
+            continue
+        center = shape(ft["geometry"]).representative_point()
+        rows.append({
+            "region_code": int(code), "level": SIGUNGU_LEVEL, "parent_code": int(code[:2]),
+            "name": props.get("SIG_KOR_NM") or props.get("name") or code,
+            "lat": round(center.y, 6), "lng": round(center.x, 6),
+        })
+    return rows
+
+
+def migrate(m: Migration, with_sigungu: bool, drop_region_name: bool) -> None:
+    print("-- 1) region_dim")
+    if not m.dry_run:
+        Region.__table__.create(m.conn, checkfirst=True)
+    m.run(UPSERT_SQL, sido_rows())
+    if with_sigungu:
+        m.run(UPSERT_SQL, sigungu_rows(SIGUNGU_GEOJSON_PATH))
+
+    print("-- 2) car_registration_stats.region_code")
+    if m.column_type("car_registration_stats", "region_code") is None:
+        m.run("ALTER TABLE car_registration_stats ADD COLUMN region_code SMALLINT UNSIGNED NULL AFTER region_name")
+    if m.column_type("car_registration_stats", "region_name") is not None:
+        m.run("""
+            UPDATE car_registration_stats r
+            JOIN region_dim d ON d.level = 1 AND d.name = r.region_name
+            SET r.region_code = d.region_code
+            WHERE r.region_code IS NULL
+        """)
+        if not m.dry_run:
+            missing = m.conn.execute(text("""
+                SELECT region_name, COUNT(*) AS n FROM car_registration_stats
+                WHERE region_code IS NULL GROUP BY region_name
+            """)).all()
+            if missing:
+                raise SystemExit(f"region_name not in region_dim, add them first: {[tuple(r) for r in missing]}")
+
+    if m.is_nullable("car_registration_stats", "region_code"):
+        m.run("ALTER TABLE car_registration_stats MODIFY region_code SMALLINT UNSIGNED NOT NULL")
+    if not m.has_index("car_registration_stats", "idx_reg_region_month"):
+        m.run("ALTER TABLE car_registration_stats ADD INDEX idx_reg_region_month (region_code, base_month)")
+    if not m.has_constraint("car_registration_stats", "fk_reg_region"):
+        m.run("""
+            ALTER TABLE car_registration_stats
+            ADD CONSTRAINT fk_reg_region FOREIGN KEY (region_code) REFERENCES region_dim (region_code)
+        """)
+
+    print("-- 3) air_pollution.region_code")
+    if "unsigned" not in (m.column_type("air_pollution", "region_code") or ""):
+        m.run("ALTER TABLE air_pollution MODIFY region_code SMALLINT UNSIGNED NOT NULL")
+    if not m.has_index("air_pollution", "idx_air_region_year"):
+        m.run("ALTER TABLE air_pollution ADD INDEX idx_air_region_year (region_code, year)")
+    if not m.dry_run:
+        orphans = m.scalar("""
+            SELECT COUNT(*) FROM air_pollution a
+            LEFT JOIN region_dim d ON d.region_code = a.region_code
+            WHERE d.region_code IS NULL
+        """)
+        if orphans:
+            print(f"warning: {orphans} air_pollution rows have region_code not in region_dim")
+
+    if drop_region_name and m.column_type("car_registration_stats", "region_name") is not None:
+        print("-- 4) drop car_registration_stats.region_name")
+        m.run("ALTER TABLE car_registration_stats DROP COLUMN region_name")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="0001 region_dim migration")
+    parser.add_argument("--dry-run", action="store_true", help="SQL만 출력 (스키마 조회는 함)")
+    parser.add_argument("--with-sigungu", action="store_true", help="시/군/구 경계 파일로 level 2 행도 채움")
+    parser.add_argument("--drop-region-name", action="store_true", help="등록 통계의 region_name 컬럼 삭제")
+    args = parser.parse_args()
+
+    if args.with_sigungu and not SIGUNGU_GEOJSON_PATH.exists():
+        parser.error(
+            f"sigungu geojson not found: {SIGUNGU_GEOJSON_PATH} "
+            "(python scripts/prepare_sigungu_geojson.py --src <경계 GeoJSON> 으로 먼저 준비)"
+        )
+
+    engine = get_engine()
+    with engine.begin() as conn:
+        migrate(Migration(conn, args.dry_run), args.with_sigungu, args.drop_region_name)
+    print("done" if not args.dry_run else "dry run (nothing applied)")
+
+
+if __name__ == "__main__":
+    main()
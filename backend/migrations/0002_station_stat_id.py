@@ -0,0 +1,81 @@
+"""
+0002 충전소에 한국환경공단 충전소 ID(statId) 컬럼 추가 (충전기 실시간 상태 매핑용)
+
+1) station.stat_id VARCHAR(16) NULL + 인덱스
+2) --csv PATH: "station_id,stat_id" 헤더가 있는 CSV로 값 채움 (이미 채워진 행도 덮어씀)
+
+값이 없는 충전소는 실시간 상태(/stations/availability)에 나오지 않을 뿐 다른 API에는 영향 없음.
+여러 번 실행해도 됨 (이미 된 단계는 건너뜀). primary DB(.env)에 적용.
+
+사용법 (backend 디렉터리에서):
+    python migrations/0002_station_stat_id.py --dry-run
+    python migrations/0002_station_stat_id.py --csv data/station_stat_ids.csv
+"""
+import argparse
+import csv
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import text  # noqa: E402
+
+from app.core.database import get_engine  # noqa: E402
+
+
+def column_type(conn, table: str, column: str):
+    return conn.execute(text("""
+        SELECT COLUMN_TYPE FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :t AND COLUMN_NAME = :c
+    """), {"t": table, "c": column}).scalar()
+
+
+def has_index(conn, table: str, name: str) -> bool:
+    return bool(conn.execute(text("""
+        SELECT COUNT(*) FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :t AND INDEX_NAME = :n
+    """), {"t": table, "n": name}).scalar())
+
+
+def read_mapping(path: Path) -> list[dict]:
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        return [
+            {"id": int(row["station_id"]), "stat_id": row["stat_id"].strip()}
+            for row in csv.DictReader(f)
+            if row.get("station_id") and row.get("stat_id")
+        ]
+
+
+def migrate(conn, dry_run: bool, csv_path: Path | None) -> None:
+    def run(sql: str, params=None) -> None:
+        print(" ".join(sql.split()) + (f"  -- {len(params)} rows" if isinstance(params, list) else ""))
+        if not dry_run:
+            conn.execute(text(sql), params or {})
+
+    print("-- 1) station.stat_id")
+    if column_type(conn, "station", "stat_id") is None:
+        run("ALTER TABLE station ADD COLUMN stat_id VARCHAR(16) NULL")
+    if not has_index(conn, "station", "idx_station_stat_id"):
+        run("ALTER TABLE station ADD INDEX idx_station_stat_id (stat_id)")
+
+    if csv_path is not None:
+        print("-- 2) fill stat_id")
+        rows = read_mapping(csv_path)
+        if rows:
+            run("UPDATE station SET stat_id = :stat_id WHERE id = :id", rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="0002 station.stat_id migration")
+    parser.add_argument("--dry-run", action="store_true", help="SQL만 출력 (스키마 조회는 함)")
+    parser.add_argument("--csv", type=Path, default=None, help="station_id,stat_id 매핑 CSV")
+    args = parser.parse_args()
+
+    engine = get_engine()
+    with engine.begin() as conn:
+        migrate(conn, args.dry_run, args.csv)
+    print("done" if not args.dry_run else "dry run (nothing applied)")
+
+
+if __name__ == "__main__":
+    main()
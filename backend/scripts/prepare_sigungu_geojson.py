@@ -0,0 +1,116 @@
+"""
+시/군/구 경계 GeoJSON 준비 (벡터 타일 /tiles, migrations/0001 --with-sigungu 용)
+
+경계 파일은 용량/라이선스 때문에 저장소에 넣지 않는다. 공개 경계 파일을 받아서 이 스크립트로
+SIGUNGU_GEOJSON_PATH(기본 backend/data/korea_sigungu.geojson)에 맞는 모양으로 정리한다.
+
+- 입력: WGS84(EPSG:4326) GeoJSON 파일 경로 또는 http(s) URL
+  · 시/군/구 경계 (속성 SIG_CD / SIG_KOR_NM) - 국가공간정보포털/SGIS 시군구 경계 SHP를
+    ogr2ogr -f GeoJSON -t_srs EPSG:4326 out.geojson SIG.shp 로 변환한 것
+  · 행정동 경계 (속성 sgg / sggnm, 예: vuski/admdongkor) - 시/군/구 코드별로 합쳐서 사용
+- 출력: 시/군/구 하나당 feature 하나, 속성 {"code", "name"}
+  · 코드 앞 두 자리가 특별자치도 전환 뒤 코드(51 강원, 52 전북)면 region_dim 코드(42, 45)로 바꿈
+  · --simplify(도 단위)로 꼭짓점을 줄여서 파일 크기/첫 로딩 시간을 줄임 (타일은 줌별로 다시 단순화)
+
+사용법 (backend 디렉터리에서):
+    python scripts/prepare_sigungu_geojson.py --src ~/Downloads/sig.geojson
+    python scripts/prepare_sigungu_geojson.py --src https://.../HangJeongDong.geojson --simplify 0.0002
+"""
+import argparse
+import json
+import sys
+import urllib.request
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import shapely  # noqa: E402
+from shapely.geometry import mapping, shape  # noqa: E402
+
+from app.core.config import SIGUNGU_GEOJSON_PATH  # noqa: E402
+from app.core.regions import REGION_CODE_TO_NAME  # noqa: E402
+
+# (코드 키, 이름 키) - 앞에서부터 먼저 있는 것
+PROPERTY_KEYS = (("SIG_CD", "SIG_KOR_NM"), ("sgg", "sggnm"), ("code", "name"))
+
+# 특별자치도 전환으로 바뀐 시/도 코드 -> region_dim 코드
+SIDO_ALIASES = {"51": "42", "52": "45"}
+
+
+def load(src: str) -> dict:
+    if src.startswith(("http://", "https://")):
+        with urllib.request.urlopen(src, timeout=120) as resp:
+            return json.loads(resp.read().decode("utf-8"))
+    with open(src, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def detect_keys(props: dict) -> tuple[str, str]:
+    for code_key, name_key in PROPERTY_KEYS:
+        if code_key in props:
+            return code_key, name_key
+    raise ValueError(f"시/군/구 코드 속성을 찾지 못함 (지원: {PROPERTY_KEYS}), 속성: {sorted(props)}")
+
+
+def normalize_code(raw) -> str | None:
+    code = str(raw or "").strip()[:5]
+    if len(code) != 5 or not code.isdigit():
+        return None
+    code = SIDO_ALIASES.get(code[:2], code[:2]) + code[2:]
+    return code if code[:2] in REGION_CODE_TO_NAME else None
+
+
+def prepare(collection: dict, simplify: float) -> tuple[list[dict], int]:
+    features = collection.get("features") or []
+    if not features:
+        raise ValueError("feature가 없음")
+    code_key, name_key = detect_keys(features[0]["properties"])
+
+    geoms, names, skipped = defaultdict(list), {}, 0
+    for ft in features:
+        props = ft.get("properties") or {}
+        code = normalize_code(props.get(code_key))
+        if code is None or not ft.get("geometry"):
+            skipped += 1
+            continue
+        geoms[code].append(shape(ft["geometry"]))
+        # 행정동 파일은 sggnm이 "서울특별시 종로구"처럼 시/도 이름을 포함
+        names.setdefault(code, str(props.get(name_key) or code).split(" ")[-1])
+
+    out = []
+    for code in sorted(geoms):
+        geom = geoms[code][0] if len(geoms[code]) == 1 else shapely.union_all(geoms[code])
+        minx, miny, maxx, maxy = geom.bounds
+        if not (-180 <= minx <= maxx <= 180 and -90 <= miny <= maxy <= 90):
+            raise ValueError(f"{code}: 좌표가 경위도가 아님 (EPSG:4326으로 변환 필요, bounds={geom.bounds})")
+        if simplify > 0:
+            geom = shapely.simplify(geom, simplify, preserve_topology=True)
+        out.append({"type": "Feature", "properties": {"code": code, "name": names[code]}, "geometry": mapping(geom)})
+    return out, skipped
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="시/군/구 경계 GeoJSON 준비")
+    parser.add_argument("--src", required=True, help="원본 GeoJSON 경로 또는 URL (EPSG:4326)")
+    parser.add_argument("--out", type=Path, default=SIGUNGU_GEOJSON_PATH, help="출력 경로 (기본 SIGUNGU_GEOJSON_PATH)")
+    parser.add_argument("--simplify", type=float, default=0.0001, help="단순화 허용 오차(도), 0이면 그대로")
+    args = parser.parse_args()
+
+    features, skipped = prepare(load(args.src), args.simplify)
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump({"type": "FeatureCollection", "features": features}, f, ensure_ascii=False, separators=(",", ":"))
+
+    per_sido = defaultdict(int)
+    for ft in features:
+        per_sido[ft["properties"]["code"][:2]] += 1
+    print(f"{len(features)} 시/군/구 -> {args.out} ({args.out.stat().st_size / 1e6:.1f} MB), 건너뜀 {skipped}")
+    print("시/도별: " + ", ".join(f"{REGION_CODE_TO_NAME[c]} {n}" for c, n in sorted(per_sido.items())))
+    missing = sorted(set(REGION_CODE_TO_NAME) - set(per_sido))
+    if missing:
+        print("경계가 없는 시/도: " + ", ".join(REGION_CODE_TO_NAME[c] for c in missing))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# backend 디렉터리를 import 경로에 (app.* 패키지)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,114 @@
+"""동시성 제한 미들웨어: 파티션 대기열이 차면 503 + Retry-After, 다른 파티션은 영향 없음"""
+import asyncio
+import json
+
+import pytest
+
+from app.core import admission
+from app.core.admission import AdmissionControlMiddleware, AdmissionController, Partition
+
+
+@pytest.fixture(autouse=True)
+def enabled(monkeypatch):
+    monkeypatch.setattr(admission, "ADMISSION_ENABLED", True)
+
+
+def _scope(path: str) -> dict:
+    return {"type": "http", "method": "GET", "path": path, "headers": []}
+
+
+async def _request(app, path: str) -> tuple[int, dict, bytes]:
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(_scope(path), receive, send)
+    start = next(m for m in messages if m["type"] == "http.response.start")
+    headers = {k.decode(): v.decode() for k, v in start["headers"]}
+    body = b"".join(m.get("body", b"") for m in messages if m["type"] == "http.response.body")
+    return start["status"], headers, body
+
+
+def _blocking_app(release: asyncio.Event, entered: list):
+    async def app(scope, receive, send):
+        entered.append(scope["path"])
+        if scope["path"].startswith("/stats/"):
+            await release.wait()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    return app
+
+
+def _middleware(app, heavy_queue: int, timeout: float = 5.0):
+    controller = AdmissionController(
+        {"heavy": Partition("heavy", 1, heavy_queue), "default": Partition("default", 4, 4)},
+        queue_timeout=timeout,
+    )
+    return AdmissionControlMiddleware(app, controller), controller
+
+
+def test_full_queue_returns_503_with_retry_after():
+    async def scenario():
+        release, entered = asyncio.Event(), []
+        app, controller = _middleware(_blocking_app(release, entered), heavy_queue=1)
+
+        running = asyncio.create_task(_request(app, "/stats/rankings"))
+        queued = asyncio.create_task(_request(app, "/stats/timeseries"))
+        await asyncio.sleep(0.01)
+        heavy = controller.partitions["heavy"].metrics()
+        assert (heavy["active"], heavy["queued"]) == (1, 1)
+
+        status, headers, body = await _request(app, "/stats/registrations")
+        assert status == 503
+        assert 1 <= int(headers["retry-after"]) <= 30
+        payload = json.loads(body)
+        assert payload["retry_after"] == int(headers["retry-after"])
+        assert "queue full" in payload["detail"]
+
+        # 다른 파티션은 그대로 통과
+        status, headers, _ = await _request(app, "/regions")
+        assert status == 200 and "server-timing" in headers
+
+        release.set()
+        assert (await running)[0] == 200
+        assert (await queued)[0] == 200
+        heavy = controller.partitions["heavy"].metrics()
+        assert (heavy["active"], heavy["queued"], heavy["rejected"]) == (0, 0, 1)
+        assert entered.count("/stats/registrations") == 0
+
+    asyncio.run(scenario())
+
+
+def test_queue_timeout_returns_503():
+    async def scenario():
+        release, entered = asyncio.Event(), []
+        app, controller = _middleware(_blocking_app(release, entered), heavy_queue=4, timeout=0.05)
+
+        running = asyncio.create_task(_request(app, "/stats/rankings"))
+        await asyncio.sleep(0.01)
+        status, headers, body = await _request(app, "/stats/timeseries")
+        assert status == 503 and "retry-after" in headers
+        assert "queue timeout" in json.loads(body)["detail"]
+
+        release.set()
+        assert (await running)[0] == 200
+        heavy = controller.partitions["heavy"].metrics()
+        assert (heavy["active"], heavy["queued"], heavy["timed_out"]) == (0, 0, 1)
+
+    asyncio.run(scenario())
+
+
+def test_exempt_paths_skip_admission():
+    async def scenario():
+        release, entered = asyncio.Event(), []
+        app, controller = _middleware(_blocking_app(release, entered), heavy_queue=0)
+        status, headers, _ = await _request(app, "/health")
+        assert status == 200 and "server-timing" not in headers
+        assert controller.partition_for("/stations/availability/stream") is None
+
+    asyncio.run(scenario())
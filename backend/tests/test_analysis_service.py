@@ -0,0 +1,27 @@
+"""등록대수-오염도 상관 분석: 연도 축과 시차"""
+import numpy as np
+
+from app.services.analysis_service import build_yearly_matrices, compute_correlations
+
+
+def test_year_axis_has_no_gaps():
+    reg = [{"code": "11", "year": y, "reg_total": y} for y in (2018, 2021)]
+    air = [{"code": "11", "year": 2019, "pollution_degree": 1.0}]
+    _, years, R, P = build_yearly_matrices(reg, air)
+    assert years == [2018, 2019, 2020, 2021]
+    assert np.isnan(R[0, 1]) and np.isnan(R[0, 2])
+
+
+def test_lag_pairs_years_not_columns():
+    # 오염도(y) = 등록대수(y-1) x 10, 2020년은 두 지표 모두 없음 -> lag 1은 정확히 r = 1
+    reg_values = {2018: 5.0, 2019: 1.0, 2021: 7.0, 2022: 2.0, 2023: 9.0}
+    reg = [{"code": "11", "year": y, "reg_total": v} for y, v in reg_values.items()]
+    air = [
+        {"code": "11", "year": y, "pollution_degree": reg_values.get(y - 1, 3.0) * 10}
+        for y in (2019, 2021, 2022, 2023, 2024)
+    ]
+    _, _, R, P = build_yearly_matrices(reg, air)
+    result = compute_correlations(R, P, max_lag=1)
+
+    assert result["n"][1, 0] == 4
+    assert abs(result["pearson"][1, 0] - 1.0) < 1e-9
@@ -0,0 +1,40 @@
+"""LTTB 다운샘플링과 min-max 정규화"""
+import numpy as np
+
+from app.services.downsample import lttb, minmax_scale
+
+
+def test_lttb_keeps_endpoints_and_returns_n_points():
+    rng = np.random.default_rng(0)
+    x = np.arange(1000, dtype=np.float64)
+    y = rng.normal(size=1000).cumsum()
+    for n_out in (3, 10, 97, 500):
+        idx = lttb(x, y, n_out)
+        assert len(idx) == n_out
+        assert idx[0] == 0 and idx[-1] == 999
+        assert np.all(np.diff(idx) > 0)
+
+
+def test_lttb_keeps_spike():
+    x = np.arange(200, dtype=np.float64)
+    y = np.zeros(200)
+    y[123] = 50.0
+    assert 123 in lttb(x, y, 20)
+
+
+def test_lttb_passthrough_when_not_reducing():
+    x = np.arange(10, dtype=np.float64)
+    assert lttb(x, x, 10).tolist() == list(range(10))
+    assert lttb(x, x, 2).tolist() == list(range(10))
+
+
+def test_minmax_scale():
+    out = minmax_scale(np.array([2.0, np.nan, 4.0, 3.0]))
+    assert out[0] == 0 and out[2] == 100 and out[3] == 50
+    assert np.isnan(out[1])
+
+
+def test_minmax_scale_constant_series_is_midline():
+    # 프론트 _minmax_100 과 같은 규칙: 값이 모두 같으면 가운데(50)
+    out = minmax_scale(np.array([7.0, np.nan, 7.0]))
+    assert out[0] == 50 and out[2] == 50 and np.isnan(out[1])
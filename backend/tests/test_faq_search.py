@@ -0,0 +1,87 @@
+"""FAQ 검색 인덱스 (BM25 + 차종/용도 태그 필터 + fuzzy 확장), 작은 메모리 문서 집합으로"""
+import pytest
+
+from app.services.faq_search import FaqIndex, find_highlights, strip_josa, tokenize
+from app.services.hangul import chosung, decompose, is_chosung_only
+from app.services.symspell import SymSpell
+
+DOCS = [
+    {"id": 1, "category": "보조금", "question": "보조금은 언제 지급되나요?", "answer": "출고 후 지자체가 보조금을 지급합니다."},
+    {"id": 2, "category": "충전", "question": "충전소는 어디에 있나요?", "answer": "지도에서 가까운 충전소를 확인하세요."},
+    {"id": 3, "category": "보조금", "question": "화물 트럭도 보조금이 있나요?", "answer": "화물 전기차는 별도 기준이 있습니다."},
+    {"id": 4, "category": "일반", "question": "택시 영업용 차량 신청 방법", "answer": "법인 택시 사업자가 신청합니다."},
+]
+
+
+@pytest.fixture
+def index():
+    return FaqIndex([dict(d) for d in DOCS])
+
+
+def ids(result) -> list[int]:
+    return [item["id"] for item in result["items"]]
+
+
+def test_tokenize_adds_bigrams():
+    assert tokenize("보조금은") == ["보조금은", "보조", "조금", "금은"]
+
+
+def test_bm25_ranks_term_frequency_first(index):
+    result = index.search("보조금")
+    assert ids(result)[0] == 1  # 질문 + 답변에 모두 나옴
+    assert set(ids(result)) == {1, 3}
+    assert result["items"][0]["score"] > result["items"][1]["score"]
+
+
+def test_empty_query_keeps_order_and_applies_filters(index):
+    assert ids(index.search("")) == [1, 2, 3, 4]
+    assert ids(index.search("", category="충전")) == [2]
+
+
+def test_untagged_faq_is_common_to_all_vehicle_types(index):
+    # 3번은 "화물" 태그, 1/2/4번은 차종 태그가 없어서 모든 차종에 해당
+    assert ids(index.search("", vehicle_type="승용")) == [1, 2, 4]
+    assert 3 in ids(index.search("", vehicle_type="화물"))
+    assert 4 not in ids(index.search("", usage="자가용"))  # "택시" -> 영업용 태그
+
+
+def test_highlights_merge_overlaps():
+    assert find_highlights("보조금은 보조금", ["보조금", "금은"]) == [[0, 4], [5, 8]]
+
+
+def test_hangul_helpers():
+    assert chosung("보조금") == "ㅂㅈㄱ"
+    assert is_chosung_only("ㅂㅈㄱ") and not is_chosung_only("보조금")
+    assert decompose("굼") != decompose("금")
+
+
+def test_symspell_lookup_by_jamo_distance():
+    spell = SymSpell(2)
+    spell.add(decompose("보조금"))
+    assert spell.lookup(decompose("보조굼"), 1) == [(decompose("보조금"), 1)]
+
+
+def test_strip_josa_keeps_two_syllable_stem():
+    assert strip_josa("보조금은") == "보조금"
+    assert strip_josa("충전소에서") == "충전소"
+    assert strip_josa("차는") == "차는"  # 남는 부분이 한 글자면 그대로
+
+
+def test_chosung_expansion(index):
+    result = index.search("ㅂㅈㄱ", mode="fuzzy")
+    assert "보조금" in result["expansions"]["ㅂㅈㄱ"]
+    assert set(ids(result)) == {1, 3}
+
+
+def test_typo_corrects_to_particle_stripped_stem(index):
+    # 본문에는 "보조금은/보조금을/보조금이"처럼 조사 붙은 꼴만 있음
+    result = index.search("보조굼", mode="fuzzy")
+    assert result["expansions"] == {"보조굼": ["보조금"]}
+    assert ids(result)[0] == 1
+    assert result["items"][0]["highlights"]["question"] == [[0, 3]]
+
+
+def test_exact_mode_does_not_expand(index):
+    # 바이그램("보조")으로는 걸리지만 교정 어휘로 확장되지는 않음
+    result = index.search("보조굼")
+    assert result["expansions"] == {}
@@ -0,0 +1,130 @@
+"""
+읽기/쓰기 세션 라우팅 (bench/replica_routing_check.py와 같은 시나리오, SQLite 파일 3개로)
+- primary 1개 + 레플리카 2개, heartbeat 테이블 값을 복제 지연으로 사용
+"""
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine, text
+
+import app.core.database as database
+
+MAX_LAG_SEC = 5
+
+
+@pytest.fixture
+def dbs(tmp_path, monkeypatch):
+    paths = {name: tmp_path / f"{name}.db" for name in ("primary", "r1", "r2")}
+    for name, path in paths.items():
+        with sqlite3.connect(path) as conn:
+            conn.execute("CREATE TABLE heartbeat (lag_sec REAL)")
+            conn.execute("INSERT INTO heartbeat VALUES (0)")
+            conn.execute("CREATE TABLE whoami (name TEXT)")
+            conn.execute("INSERT INTO whoami VALUES (?)", (name,))
+
+    primary = create_engine(f"sqlite:///{paths['primary']}")
+    pool = database.ReplicaPool([f"sqlite:///{paths[n]}" for n in ("r1", "r2")], MAX_LAG_SEC, 0)
+    monkeypatch.setattr(database, "DB_REPLICA_LAG_SQL", "SELECT lag_sec FROM heartbeat")
+    monkeypatch.setattr(database, "_engine", primary)
+    monkeypatch.setattr(database, "_replica_pool", pool)
+    database.SessionLocal.configure(bind=primary)
+    yield paths
+    pool.dispose()
+    primary.dispose()
+    database.SessionLocal.configure(bind=None)
+
+
+def _set_lag(path, lag) -> None:
+    with sqlite3.connect(path) as conn:
+        conn.execute("UPDATE heartbeat SET lag_sec = ?", (lag,))
+
+
+def _whoami(factory) -> str:
+    db = factory()
+    try:
+        return db.execute(text("SELECT name FROM whoami")).scalar()
+    finally:
+        db.close()
+
+
+def _reads(n: int = 4) -> list[str]:
+    return [_whoami(database.ReadSessionLocal) for _ in range(n)]
+
+
+def test_reads_round_robin_over_healthy_replicas(dbs):
+    got = _reads()
+    assert set(got) == {"r1", "r2"}
+    assert got[0] != got[1]
+
+
+def test_lagging_replica_is_excluded(dbs):
+    _set_lag(dbs["r2"], MAX_LAG_SEC * 6)
+    assert set(_reads()) == {"r1"}
+    status = {s["name"].rsplit("/", 1)[-1]: s for s in database.get_replica_pool().status()}
+    assert status["r2.db"]["healthy"] is False
+
+
+def test_falls_back_to_primary_without_healthy_replica(dbs):
+    _set_lag(dbs["r1"], None)  # 복제 중단
+    _set_lag(dbs["r2"], MAX_LAG_SEC * 6)
+    assert set(_reads()) == {"primary"}
+
+    _set_lag(dbs["r1"], 0)
+    _set_lag(dbs["r2"], 1)
+    assert set(_reads()) == {"r1", "r2"}
+
+
+def test_write_session_always_uses_primary(dbs):
+    assert _whoami(database.SessionLocal) == "primary"
+
+
+class _Result:
+    def __init__(self, row):
+        self._row = row
+
+    def mappings(self):
+        return self
+
+    def first(self):
+        return self._row
+
+
+class _MySQLConn:
+    """SHOW ... STATUS 응답만 흉내 내는 커넥션 (stmt -> row 또는 예외)"""
+
+    class dialect:
+        name = "mysql"
+
+    def __init__(self, replies: dict):
+        self.replies = replies
+
+    def exec_driver_sql(self, stmt):
+        reply = self.replies.get(stmt, RuntimeError(f"{stmt} not supported"))
+        if isinstance(reply, Exception):
+            raise reply
+        return _Result(reply)
+
+
+@pytest.fixture
+def mysql_lag(monkeypatch):
+    monkeypatch.setattr(database, "DB_REPLICA_LAG_SQL", None)
+    return lambda replies: database._replication_lag(_MySQLConn(replies))
+
+
+def test_mysql_lag_from_show_replica_status(mysql_lag):
+    assert mysql_lag({"SHOW REPLICA STATUS": {"Seconds_Behind_Source": 3}}) == 3.0
+
+
+def test_mysql_lag_falls_back_to_show_slave_status(mysql_lag):
+    assert mysql_lag({"SHOW SLAVE STATUS": {"Seconds_Behind_Master": 7}}) == 7.0
+
+
+def test_mysql_replication_stopped_is_unknown(mysql_lag):
+    assert mysql_lag({"SHOW REPLICA STATUS": {"Seconds_Behind_Source": None}}) is None
+
+
+def test_mysql_lag_unknown_without_privilege(mysql_lag, caplog):
+    denied = PermissionError("Access denied; you need the REPLICATION CLIENT privilege")
+    lag = mysql_lag({"SHOW REPLICA STATUS": denied, "SHOW SLAVE STATUS": denied})
+    assert lag is None
+    assert "DB_REPLICA_LAG_SQL" in caplog.text
@@ -0,0 +1,106 @@
+"""single-flight 요청 병합: follower는 leader의 결과/예외를 그대로 받는다"""
+import threading
+import time
+
+import pytest
+
+from app.core.singleflight import SingleFlight, coalesce
+
+FOLLOWERS = 5
+
+
+def _wait_until(cond):
+    deadline = time.monotonic() + 5
+    while not cond():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def _run_concurrently(group: SingleFlight, key, fn):
+    """leader가 fn 안에서 막혀 있는 동안 follower들을 붙이고, 모두 붙은 뒤 풀어준다"""
+    started = threading.Event()
+    release = threading.Event()
+    outcomes = [None] * (FOLLOWERS + 1)
+
+    def leader_fn():
+        started.set()
+        release.wait(5)
+        return fn()
+
+    def call(i, f):
+        try:
+            outcomes[i] = ("ok", group.do(key, f))
+        except Exception as e:
+            outcomes[i] = ("error", e)
+
+    threads = [threading.Thread(target=call, args=(0, leader_fn))]
+    threads[0].start()
+    assert started.wait(5)
+    for i in range(1, FOLLOWERS + 1):
+        # follower의 fn은 실행되면 안 됨
+        threads.append(threading.Thread(target=call, args=(i, lambda: pytest.fail("follower executed"))))
+        threads[-1].start()
+
+    _wait_until(lambda: group.metrics()["coalesced"] == FOLLOWERS)
+    release.set()
+    for t in threads:
+        t.join(5)
+    return outcomes
+
+
+def test_followers_share_leader_result():
+    group = SingleFlight("test")
+    result = {"rows": [1, 2, 3]}
+    outcomes = _run_concurrently(group, "k", lambda: result)
+
+    assert all(kind == "ok" and value is result for kind, value in outcomes)
+    stats = group.metrics()
+    assert stats["executions"] == 1
+    assert stats["coalesced"] == FOLLOWERS
+    assert stats["in_flight"] == 0
+
+
+def test_followers_share_leader_exception():
+    group = SingleFlight("test")
+    error = RuntimeError("db down")
+
+    def boom():
+        raise error
+
+    outcomes = _run_concurrently(group, "k", boom)
+
+    assert all(kind == "error" and value is error for kind, value in outcomes)
+    assert group.metrics()["errors"] == 1
+
+
+def test_finished_call_is_not_cached():
+    group = SingleFlight("test")
+    calls = []
+    group.do("k", lambda: calls.append(1))
+    group.do("k", lambda: calls.append(2))
+    assert calls == [1, 2]
+
+
+def test_coalesce_normalizes_args_and_ignores_session():
+    seen = []
+
+    @coalesce("test-coalesce")
+    def find(db, code, year=2024):
+        seen.append((db, code, year))
+        return code
+
+    group = find.singleflight
+    release = threading.Event()
+    key = ("find", ("code", "11"), ("year", 2024))
+    holder = threading.Thread(target=group.do, args=(key, lambda: release.wait(5)))
+    holder.start()
+    _wait_until(lambda: group.metrics()["in_flight"] == 1)
+
+    # 다른 세션 + 키워드 인자로 불러도 같은 키 -> 이미 실행 중인 호출에 합류
+    follower = threading.Thread(target=find, args=("other-session",), kwargs={"code": "11"})
+    follower.start()
+    _wait_until(lambda: group.metrics()["coalesced"] == 1)
+    release.set()
+    holder.join(5)
+    follower.join(5)
+    assert seen == []
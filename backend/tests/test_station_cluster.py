@@ -0,0 +1,79 @@
+"""충전소 클러스터 인덱스: 줌마다 칸 개수 합 = 충전소 수, 계층 일관성, max_features 제한"""
+import numpy as np
+import pytest
+
+from app.services.station_cluster_service import DEFAULT_BBOX, StationClusterIndex, parse_bbox
+
+MAX_ZOOM = 14
+N = 3000
+
+
+@pytest.fixture(scope="module")
+def index():
+    rng = np.random.default_rng(7)
+    # 도심처럼 몰린 점 + 남한 전역에 흩어진 점 + 좌표가 똑같은 점
+    dense_lat = rng.normal(37.55, 0.05, N // 2)
+    dense_lng = rng.normal(126.98, 0.05, N // 2)
+    west, south, east, north = DEFAULT_BBOX
+    spread_lat = rng.uniform(south, north, N // 2 - 10)
+    spread_lng = rng.uniform(west, east, N // 2 - 10)
+    lat = np.concatenate([dense_lat, spread_lat, np.full(10, 35.1796)])
+    lng = np.concatenate([dense_lng, spread_lng, np.full(10, 129.0756)])
+    return StationClusterIndex(lat, lng, np.arange(100, 100 + N), MAX_ZOOM, cell_bits=2)
+
+
+def test_level_counts_sum_to_total(index):
+    for z in range(MAX_ZOOM + 1):
+        level = index.levels[z]
+        assert level["count"].sum() == N, z
+        assert np.all(level["count"] >= 1)
+
+
+def test_parent_cells_contain_children(index):
+    for z in range(1, MAX_ZOOM + 1):
+        child, parent = index.levels[z], index.levels[z - 1]
+        parent_count = dict(zip(zip(parent["cx"].tolist(), parent["cy"].tolist()), parent["count"].tolist()))
+        rolled: dict = {}
+        for cx, cy, c in zip((child["cx"] >> 1).tolist(), (child["cy"] >> 1).tolist(), child["count"].tolist()):
+            rolled[(cx, cy)] = rolled.get((cx, cy), 0) + c
+        assert rolled == parent_count
+
+
+def test_query_counts_sum_to_total_at_every_zoom(index):
+    box = (-180.0, -85.0, 180.0, 85.0)
+    for zoom in range(MAX_ZOOM + 2):
+        result = index.query(box, zoom, max_features=10 ** 6)
+        cluster_sum = sum(c[3] for c in result["clusters"])
+        assert cluster_sum + len(result["points"]) == result["total"] == N, zoom
+        # 점으로 내려가는 칸은 한 개짜리, 같은 점이 두 번 나오지 않음
+        assert len(set(result["points"])) == len(result["points"])
+        assert all(c[3] > 1 for c in result["clusters"])
+
+
+def test_max_features_falls_back_to_coarser_zoom(index):
+    result = index.query(DEFAULT_BBOX, MAX_ZOOM + 1, max_features=50)
+    assert result["cluster_zoom"] is not None and result["cluster_zoom"] <= MAX_ZOOM
+    assert len(result["clusters"]) + len(result["points"]) <= 50
+    assert sum(c[3] for c in result["clusters"]) + len(result["points"]) == result["total"]
+
+
+def test_bbox_query_covers_every_station_inside(index):
+    box = (126.8, 37.4, 127.2, 37.7)
+    inside = set(np.flatnonzero(
+        (index.lng >= box[0]) & (index.lng <= box[2]) & (index.lat >= box[1]) & (index.lat <= box[3])
+    ).tolist())
+    for zoom in (5, 9, 12, MAX_ZOOM):
+        result = index.query(box, zoom, max_features=10 ** 6)
+        # 경계에 걸친 칸은 통째로 들어오므로 bbox 안 개수 이상
+        assert result["total"] >= len(inside)
+    points = index.query(box, MAX_ZOOM + 1, max_features=10 ** 6)
+    assert points["cluster_zoom"] is None and set(points["points"]) == inside
+
+
+def test_parse_bbox():
+    assert parse_bbox(None) == DEFAULT_BBOX
+    assert parse_bbox("126,37,127,38") == (126.0, 37.0, 127.0, 38.0)
+    with pytest.raises(ValueError):
+        parse_bbox("127,37,126,38")
+    with pytest.raises(ValueError):
+        parse_bbox("a,b,c")
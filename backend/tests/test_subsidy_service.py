@@ -0,0 +1,65 @@
+"""보조금 규칙표 펼치기/조회 (저장소의 data/subsidy/*.csv 기준)"""
+import pytest
+
+from app.services.subsidy_service import SubsidyNotFound, get_subsidy_table
+
+
+@pytest.fixture(scope="module")
+def table():
+    return get_subsidy_table()
+
+
+def test_national_plus_sido_local(table):
+    r = table.calc(2026, "11", "HY_IONIQ5")
+    assert (r["subsidy_national"], r["subsidy_local"], r["subsidy_total"]) == (570, 150, 720)
+    assert r["rule_year"] == 2026
+
+
+def test_later_year_uses_latest_rules(table):
+    r = table.calc(2030, "11", "HY_IONIQ5")
+    assert r["rule_year"] == 2027
+    assert r["subsidy_national"] == 530
+
+
+def test_amount_carries_forward_to_later_year(table):
+    # 2027년 규칙에 없는 모델은 2026년 국비를 이어받음
+    assert table.calc(2027, "11", "HY_IONIQ6")["subsidy_national"] == 580
+
+
+def test_more_specific_rule_wins(table):
+    assert table.calc(2026, "41", "HY_IONIQ5", sigungu_code="41110")["subsidy_local"] == 250  # 수원시 > 경기도
+    assert table.calc(2026, "41", "HY_IONIQ5")["subsidy_local"] == 200
+    assert table.calc(2026, "11", "HY_NEXO")["subsidy_local"] == 1100  # 서울 H2 > H2 기본값
+    assert table.calc(2026, "36", "HY_NEXO")["subsidy_local"] == 1000
+
+
+def test_unknown_sigungu_falls_back_to_sido(table):
+    r = table.calc(2026, "41", "HY_IONIQ5", sigungu_code="41999")
+    assert r["subsidy_local"] == 200
+    assert r["sigungu_code"] is None
+
+
+def test_percentage_rule_scales_national_only(table):
+    r = table.calc(2026, "11", "HY_IONIQ5", buyer_type="low_income")
+    assert r["subsidy_national"] == 684  # 570 x 120%
+    assert r["subsidy_local"] == 150
+
+
+def test_year_before_first_rule(table):
+    with pytest.raises(SubsidyNotFound):
+        table.calc(2025, "11", "HY_IONIQ5")
+
+
+def test_model_car_type_mismatch(table):
+    with pytest.raises(ValueError):
+        table.calc(2026, "11", "HY_NEXO", car_type="EV")
+
+
+def test_compare_matches_calc(table):
+    result = table.compare(2026, car_type="EV", sido_codes=["11", "41"], model_codes=["HY_IONIQ5", "KIA_EV6"])
+    names = [r["name"] for r in result["regions"]]
+    row = names.index("서울특별시")
+    assert result["subsidy_total"][row] == [720, 715]
+    for i, region in enumerate(result["regions"]):
+        expected = table.calc(2026, region["sido_code"], "KIA_EV6", sigungu_code=region["sigungu_code"])
+        assert result["subsidy_total"][i][1] == expected["subsidy_total"]
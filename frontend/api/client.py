@@ -1,6 +1,7 @@
 # frontend/api/client.py
 import requests
 from typing import List, Optional
+from urllib.parse import quote
 
 from dto.dataset_dto import RegionDTO, RegistrationStatDTO, AirPollutionStatDTO, FaqDTO
 
@@ -47,6 +48,107 @@ class MockApiClient:
             for i, r in enumerate(regions)
         ]
 
+    @staticmethod
+    def tiles_url(version: str) -> str:
+        """
+        시/군/구 벡터 타일 URL 템플릿 (Leaflet이 {z}/{x}/{y}를 채움)
+        version(/tiles/status)을 붙여서 데이터가 바뀌면 브라우저가 옛 타일 캐시를 쓰지 않게 함
+        """
+        return f"{MockApiClient.BASE_URL}/tiles/{{z}}/{{x}}/{{y}}.mvt?v={quote(version)}"
+
+    @staticmethod
+    def tiles_version() -> Optional[str]:
+        """시/군/구 벡터 타일 버전 (/tiles/status, 경계 파일이 없거나 실패하면 None -> 타일 사용 안 함)"""
+        try:
+            resp = requests.get(f"{MockApiClient.BASE_URL}/tiles/status", timeout=MockApiClient.TIMEOUT_SEC)
+            resp.raise_for_status()
+            data = resp.json()
+            return data.get("version") if data.get("available") else None
+        except Exception:
+            return None
+
+    @staticmethod
+    def availability_stream_url(station_ids: Optional[list] = None) -> str:
+        """
+        충전기 실시간 상태 SSE URL (브라우저 EventSource가 직접 붙음, 바뀐 충전소만 push)
+        station_ids가 없으면 ids 없는 기본 URL (목록 컴포넌트가 불러온 충전소 id를 붙임)
+        """
+        url = f"{MockApiClient.BASE_URL}/stations/availability/stream"
+        if not station_ids:
+            return url
+        return f"{url}?ids={','.join(str(i) for i in station_ids)}"
+
+    @staticmethod
+    def station_page_url() -> str:
+        """충전소 목록 커서 페이지 URL (/stations/page, 목록 컴포넌트가 스크롤하며 브라우저에서 직접 요청)"""
+        return f"{MockApiClient.BASE_URL}/stations/page"
+
+    @staticmethod
+    def _heatmap_params(year=None, car_type=None, usage=None) -> dict:
+        params = {"year": year, "car_type": car_type, "usage": usage}
+        return {k: v for k, v in params.items() if v not in (None, "")}
+
+    @staticmethod
+    def get_heatmap_png(layer: str, year=None, car_type=None, usage=None) -> Optional[bytes]:
+        """
+        서버에서 캐시된 히트맵 PNG를 받아온다. (layer: stations | registrations | pollution)
+        실패하면 None.
+        """
+        url = f"{MockApiClient.BASE_URL}/heatmaps/{layer}.png"
+        try:
+            resp = requests.get(
+                url,
+                params=MockApiClient._heatmap_params(year, car_type, usage),
+                timeout=MockApiClient.TIMEOUT_SEC,
+            )
+            resp.raise_for_status()
+            return resp.content
+        except Exception:
+            return None
+
+    @staticmethod
+    def get_correlation(car_type=None, usage=None, max_lag: int = 3) -> Optional[dict]:
+        """
+        서버에서 계산/캐시된 등록대수-대기오염도 상관계수 (/analysis/correlation)
+        실패하면 None.
+        """
+        url = f"{MockApiClient.BASE_URL}/analysis/correlation"
+        params = {"car_type": car_type, "usage": usage, "max_lag": max_lag}
+        params = {k: v for k, v in params.items() if v not in (None, "")}
+        try:
+            resp = requests.get(url, params=params, timeout=MockApiClient.TIMEOUT_SEC)
+            resp.raise_for_status()
+            return resp.json()
+        except Exception:
+            return None
+
+    @staticmethod
+    def get_timeseries(
+        sido_code: Optional[str] = None,
+        granularity: str = "year",
+        normalize: bool = False,
+        max_points: int = 300,
+        car_type: Optional[str] = None,
+        usage: Optional[str] = None,
+    ) -> Optional[dict]:
+        """
+        지역별 등록대수/대기오염도 시계열 (/stats/timeseries)
+        집계/정규화/다운샘플링은 서버에서 처리. 실패하면 None.
+        """
+        url = f"{MockApiClient.BASE_URL}/stats/timeseries"
+        params = {
+            "sido_code": sido_code, "granularity": granularity,
+            "normalize": str(normalize).lower(), "max_points": max_points,
+            "car_type": car_type, "usage": usage,
+        }
+        params = {k: v for k, v in params.items() if v not in (None, "")}
+        try:
+            resp = requests.get(url, params=params, timeout=MockApiClient.TIMEOUT_SEC)
+            resp.raise_for_status()
+            return resp.json()
+        except Exception:
+            return None
+
     @staticmethod
     def get_stations(
         car_kind: str,
@@ -126,6 +228,88 @@ class MockApiClient:
             for i in range(n)
         ]
 
+    @staticmethod
+    def get_dashboard_bundle(year: Optional[int] = None, sparklines: bool = True) -> Optional[dict]:
+        """
+        메인 대시보드 번들 (/dashboard/bundle, 지역별 등록대수+오염도(+연도 추이) 한 번에, gzip)
+        실패하면 None.
+        """
+        url = f"{MockApiClient.BASE_URL}/dashboard/bundle"
+        params = {"sparklines": str(sparklines).lower()}
+        if year is not None:
+            params["year"] = year
+        try:
+            resp = requests.get(url, params=params, timeout=MockApiClient.TIMEOUT_SEC)
+            resp.raise_for_status()
+            return resp.json()
+        except Exception:
+            return None
+
+    @staticmethod
+    def get_region_summary(
+        year: Optional[int] = None,
+        car_type: Optional[str] = None,
+        usage: Optional[str] = None,
+    ) -> Optional[dict]:
+        """
+        시/도별 등록대수 합계 + 대기오염도 (/stats/region-summary, 서버에서 조인해 지역마다 한 줄)
+        실패하면 None.
+        """
+        url = f"{MockApiClient.BASE_URL}/stats/region-summary"
+        params = {"year": year, "car_type": car_type, "usage": usage}
+        params = {k: v for k, v in params.items() if v not in (None, "")}
+        try:
+            resp = requests.get(url, params=params, timeout=MockApiClient.TIMEOUT_SEC)
+            resp.raise_for_status()
+            return resp.json()
+        except Exception:
+            return None
+
+    @staticmethod
+    def get_station_clusters(
+        bbox: Optional[tuple] = None,
+        zoom: int = 7,
+        station_type: Optional[str] = None,
+    ) -> Optional[dict]:
+        """
+        지도용 충전소 클러스터 (/stations/clusters, 화면 범위 안 클러스터/개별 충전소만)
+        bbox: (min_lng, min_lat, max_lng, max_lat)
+        실패하면 None.
+        """
+        url = f"{MockApiClient.BASE_URL}/stations/clusters"
+        params = {"zoom": zoom}
+        if bbox is not None:
+            params["bbox"] = ",".join(f"{v:.5f}" for v in bbox)
+        if station_type:
+            params["station_type"] = station_type
+        try:
+            resp = requests.get(url, params=params, timeout=MockApiClient.TIMEOUT_SEC)
+            resp.raise_for_status()
+            return resp.json()
+        except Exception:
+            return None
+
+    @staticmethod
+    def get_subsidy_table(
+        year: int,
+        car_type: Optional[str] = None,
+        sido_code: Optional[str] = None,
+        buyer_type: str = "general",
+    ) -> Optional[dict]:
+        """
+        서버 보조금 비교표 (/subsidies/calc/batch, 지역 x 모델 행렬, 만원 단위)
+        실패하면 None.
+        """
+        url = f"{MockApiClient.BASE_URL}/subsidies/calc/batch"
+        params = {"year": year, "car_type": car_type, "sido_code": sido_code, "buyer_type": buyer_type}
+        params = {k: v for k, v in params.items() if v is not None}
+        try:
+            resp = requests.get(url, params=params, timeout=MockApiClient.TIMEOUT_SEC)
+            resp.raise_for_status()
+            return resp.json()
+        except Exception:
+            return None
+
     @staticmethod
     def get_faqs() -> List[FaqDTO]:
         return [
@@ -175,3 +359,30 @@ class MockApiClient:
                 category="차량/배터리",
             ),
         ]
+
+    @staticmethod
+    def search_faqs(
+        q: str = "",
+        category: Optional[str] = None,
+        vehicle_type: Optional[str] = None,
+        usage: Optional[str] = None,
+        page: int = 1,
+        size: int = 10,
+        mode: str = "exact",
+    ) -> Optional[dict]:
+        """
+        서버 FAQ 검색 (/faqs/search, BM25 랭킹 + 하이라이트 구간 + 페이지네이션)
+        mode="fuzzy"면 오타/초성 검색까지 허용. 실패하면 None.
+        """
+        url = f"{MockApiClient.BASE_URL}/faqs/search"
+        params = {
+            "q": q, "category": category, "vehicle_type": vehicle_type,
+            "usage": usage, "page": page, "size": size, "mode": mode,
+        }
+        params = {k: v for k, v in params.items() if v not in (None, "")}
+        try:
+            resp = requests.get(url, params=params, timeout=MockApiClient.TIMEOUT_SEC)
+            resp.raise_for_status()
+            return resp.json()
+        except Exception:
+            return None
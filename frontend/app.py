@@ -1,5 +1,6 @@
+import importlib
+
 import streamlit as st
-from views import main, heatmap, calculator, faq  # faq가 없으면 제거하세요
 
 
 st.set_page_config(
@@ -53,13 +54,19 @@ if not is_popup:
 
 # -------------------------
 # Page Routing
+# - 뷰 모듈은 처음 렌더링할 때 import (folium/pandas/matplotlib 등 무거운 의존성은
+#   해당 페이지를 열 때만 로드되고, 이후 rerun에서는 sys.modules 캐시를 사용)
+# - 첫 로딩 시간 점검: python scripts/importtime_report.py --check
 # -------------------------
-if current_menu == "지역별 자동차 등록 현황":
-    main.render()
-elif current_menu == "무공해차 보조금 계산기":
-    calculator.render()
-elif current_menu == "무공해차 FAQ":
-    # faq 페이지가 실제로 없다면 이 블록 자체를 지우세요.
-    faq.render()
-else:
-    main.render()
+VIEW_MODULES = {
+    "지역별 자동차 등록 현황": "views.main",
+    "무공해차 보조금 계산기": "views.calculator",
+    "무공해차 FAQ": "views.faq",
+}
+
+
+def load_view(menu: str):
+    return importlib.import_module(VIEW_MODULES.get(menu, "views.main"))
+
+
+load_view(current_menu).render()
@@ -0,0 +1,199 @@
+# frontend/charts/renderer.py
+import hashlib
+import io
+import json
+import os
+import platform
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+from matplotlib import font_manager  # noqa: E402
+from matplotlib.figure import Figure  # noqa: E402
+
+# -------------------------
+# 차트 렌더 캐시
+# - 차트를 PNG/SVG 바이트로 그려서 (메모리 LRU + 디스크) 캐시
+# - 키: 차트 종류 + 입력값 + 데이터 버전
+# - 렌더링은 전용 워커 스레드 1개에서만 수행 (matplotlib rcParams가 전역이라 직렬화)
+# - pyplot을 쓰지 않고 Figure 객체를 직접 만들어서, 전역 figure 목록에 쌓이지 않음
+# -------------------------
+CACHE_DIR = Path(os.getenv("CHART_CACHE_DIR", str(Path(__file__).resolve().parents[1] / ".cache" / "charts")))
+MEMORY_MAX_ITEMS = int(os.getenv("CHART_MEMORY_MAX_ITEMS", "64"))
+DISK_MAX_FILES = int(os.getenv("CHART_DISK_MAX_FILES", "512"))
+
+FORMATS = {"png": "image/png", "svg": "image/svg+xml"}
+
+_FONT_CANDIDATES = {
+    "Windows": ["Malgun Gothic"],
+    "Darwin": ["AppleGothic", "Apple SD Gothic Neo"],
+}
+_FONT_FALLBACKS = ["NanumGothic", "Noto Sans CJK KR", "Noto Sans KR", "UnDotum"]
+
+
+def _resolve_korean_font() -> Optional[str]:
+    """설치된 폰트 중 한글 폰트 하나를 고른다. (앱 시작 시 한 번만)"""
+    installed = {f.name for f in font_manager.fontManager.ttflist}
+    for name in _FONT_CANDIDATES.get(platform.system(), []) + _FONT_FALLBACKS:
+        if name in installed:
+            return name
+    return None
+
+
+KOREAN_FONT = _resolve_korean_font()
+_RC = {"font.family": KOREAN_FONT or "sans-serif", "axes.unicode_minus": False}
+
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chart-render")
+_memory: "OrderedDict[str, bytes]" = OrderedDict()
+_inflight: Dict[str, Future] = {}
+_lock = threading.Lock()
+
+_BUILDERS: Dict[str, Callable[[Figure, dict], None]] = {}
+
+
+def chart(kind: str):
+    """차트 종류 등록 데코레이터. builder(fig, spec)는 fig 위에 그리기만 한다."""
+    def register(fn):
+        _BUILDERS[kind] = fn
+        return fn
+    return register
+
+
+# -------------------------
+# 캐시 헬퍼
+# -------------------------
+def _cache_key(kind: str, spec: dict, data_version: str, fmt: str) -> str:
+    raw = json.dumps(
+        {"kind": kind, "spec": spec, "data_version": data_version, "fmt": fmt, "font": KOREAN_FONT},
+        sort_keys=True, ensure_ascii=False, default=str,
+    )
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _memory_get(key: str) -> Optional[bytes]:
+    with _lock:
+        data = _memory.get(key)
+        if data is not None:
+            _memory.move_to_end(key)
+        return data
+
+
+def _memory_set(key: str, data: bytes) -> None:
+    with _lock:
+        _memory[key] = data
+        _memory.move_to_end(key)
+        while len(_memory) > MEMORY_MAX_ITEMS:
+            _memory.popitem(last=False)
+
+
+def _disk_get(path: Path) -> Optional[bytes]:
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    os.utime(path)  # 최근 사용 표시 (디스크 정리 시 오래된 것부터 삭제)
+    return data
+
+
+def _disk_set(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+    files = [p for p in path.parent.iterdir() if p.suffix in (".png", ".svg")]
+    if len(files) > DISK_MAX_FILES:
+        files.sort(key=lambda p: p.stat().st_mtime)
+        for old in files[: len(files) - DISK_MAX_FILES]:
+            old.unlink(missing_ok=True)
+
+
+# -------------------------
+# 렌더링
+# -------------------------
+def _draw(kind: str, spec: dict, fmt: str) -> bytes:
+    with matplotlib.rc_context(_RC):
+        fig = Figure(figsize=spec.get("figsize", (10, 5)))
+        try:
+            _BUILDERS[kind](fig, spec)
+            buf = io.BytesIO()
+            fig.savefig(buf, format=fmt, bbox_inches="tight", dpi=spec.get("dpi", 100))
+            return buf.getvalue()
+        finally:
+            fig.clear()
+
+
+def _render_and_store(key: str, kind: str, spec: dict, fmt: str, path: Path) -> bytes:
+    try:
+        data = _disk_get(path)
+        if data is None:
+            data = _draw(kind, spec, fmt)
+            _disk_set(path, data)
+        _memory_set(key, data)
+        return data
+    finally:
+        with _lock:
+            _inflight.pop(key, None)
+
+
+def submit_chart(kind: str, spec: dict, data_version: str = "", fmt: str = "png") -> Future:
+    """
+    렌더링을 워커 스레드에 맡기고 Future를 돌려준다. (미리 그려두기용)
+    같은 키가 이미 그려지는 중이면 그 Future를 공유한다.
+    """
+    if kind not in _BUILDERS:
+        raise ValueError(f"unknown chart kind: {kind}")
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown format: {fmt}")
+
+    key = _cache_key(kind, spec, data_version, fmt)
+    future: Future = Future()
+    cached = _memory_get(key)
+    if cached is not None:
+        future.set_result(cached)
+        return future
+
+    with _lock:
+        running = _inflight.get(key)
+        if running is not None:
+            return running
+        path = CACHE_DIR / f"{key}.{fmt}"
+        future = _executor.submit(_render_and_store, key, kind, spec, fmt, path)
+        _inflight[key] = future
+    return future
+
+
+def render_chart(kind: str, spec: dict, data_version: str = "", fmt: str = "png") -> bytes:
+    """캐시에 있으면 바로, 없으면 워커 스레드에서 그린 결과를 기다려서 바이트로 반환"""
+    return submit_chart(kind, spec, data_version, fmt).result()
+
+
+# -------------------------
+# 차트 종류
+# -------------------------
+@chart("trend")
+def _trend(fig: Figure, spec: dict) -> None:
+    """
+    정규화(0~100) 추이 라인 차트
+    spec: title, periods, series=[{"label", "values", "color", "marker"}], ylabel
+    """
+    ax = fig.add_subplot(1, 1, 1)
+    x = list(range(len(spec["periods"])))
+    for s in spec["series"]:
+        ax.plot(x, s["values"], label=s["label"], color=s.get("color"), marker=s.get("marker", "o"), linewidth=2)
+
+    ax.set_title(spec.get("title", ""), fontsize=14)
+    ax.set_ylim(-10, 110)
+    ax.set_xticks(x)
+    ax.set_xticklabels(spec["periods"])
+    ax.set_ylabel(spec.get("ylabel", ""))
+    ax.legend(loc="upper left")
+    ax.grid(True, linestyle="--", alpha=0.5)
+    ax.spines["top"].set_visible(False)
+    ax.spines["right"].set_visible(False)
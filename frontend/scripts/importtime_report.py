@@ -0,0 +1,120 @@
+"""
+첫 로딩(cold start) import 시간 리포트
+
+페이지마다 새 파이썬 프로세스에서 `python -X importtime -c "import streamlit, views.xxx"`를 실행해서
+- 페이지별 import 총 시간 (모든 모듈 self 시간 합)
+- 오래 걸리는 패키지 TOP N (하위 모듈 self 시간을 최상위 패키지 이름으로 합산)
+- 가벼운 페이지(FAQ/계산기)에 무거운 패키지(folium/pandas/matplotlib)가 섞여 들어왔는지
+를 보여준다.
+
+사용법 (frontend 디렉터리에서):
+    python scripts/importtime_report.py                   # 리포트만
+    python scripts/importtime_report.py --check           # 예산 초과 시 exit code 1 (배포 전 점검용)
+    python scripts/importtime_report.py --check --budget views.main=3000 --runs 5
+"""
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+FRONTEND_DIR = Path(__file__).resolve().parents[1]
+
+# app.py 자체가 import하는 것 (뷰 모듈은 라우팅 시점에 import)
+SHELL_MODULE = "streamlit"
+
+# 대상 -> 예산(ms). 대상은 "streamlit + 해당 뷰"를 import했을 때의 시간
+DEFAULT_BUDGET_MS = {
+    "streamlit": 1500,
+    "views.faq": 2000,
+    "views.calculator": 2000,
+    "views.heatmap": 2500,
+    "views.main": 5000,
+}
+
+# 이 페이지들이 import하면 안 되는 무거운 패키지
+HEAVY_PACKAGES = ("folium", "streamlit_folium", "pandas", "matplotlib")
+LIGHT_TARGETS = ("streamlit", "views.faq", "views.calculator")
+
+_LINE_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+\d+\s+\|\s*(\S+)")
+
+
+def measure(target: str) -> dict:
+    """새 프로세스에서 한 번 import하고 모듈별 시간을 모은다. 반환: {"total_ms", "modules", "packages"}"""
+    modules = [SHELL_MODULE] if target == SHELL_MODULE else [SHELL_MODULE, target]
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+        cwd=FRONTEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        tail = "\n".join(proc.stderr.strip().splitlines()[-5:])
+        raise RuntimeError(f"import {target} failed:\n{tail}")
+
+    total_us = 0
+    loaded = set()
+    packages: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        m = _LINE_RE.match(line)
+        if not m:
+            continue
+        self_us, name = int(m.group(1)), m.group(2)
+        total_us += self_us
+        loaded.add(name)
+        root = name.split(".")[0]
+        packages[root] = packages.get(root, 0) + self_us
+
+    return {"total_ms": total_us / 1000.0, "modules": loaded, "packages": packages}
+
+
+def parse_budgets(items: list[str]) -> dict:
+    budgets = dict(DEFAULT_BUDGET_MS)
+    for item in items or []:
+        target, _, ms = item.partition("=")
+        if not ms:
+            raise SystemExit(f"--budget must look like target=ms (got {item!r})")
+        budgets[target] = float(ms)
+    return budgets
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Streamlit 페이지별 cold start import 시간 리포트")
+    parser.add_argument("--check", action="store_true", help="예산 초과/무거운 패키지 유입 시 exit code 1")
+    parser.add_argument("--budget", action="append", help="대상별 예산 덮어쓰기 (예: views.main=3000)")
+    parser.add_argument("--runs", type=int, default=3, help="대상별 측정 횟수 (중앙값 사용)")
+    parser.add_argument("--top", type=int, default=8, help="느린 패키지 표시 개수")
+    args = parser.parse_args()
+
+    budgets = parse_budgets(args.budget)
+    failures = []
+
+    for target, budget in budgets.items():
+        runs = [measure(target) for _ in range(max(1, args.runs))]
+        total = statistics.median(r["total_ms"] for r in runs)
+        last = runs[-1]
+
+        status = "OK" if total <= budget else "OVER"
+        print(f"\n[{status}] import {target}: {total:,.0f} ms (budget {budget:,.0f} ms, {len(last['modules'])} modules)")
+        slowest = sorted(last["packages"].items(), key=lambda kv: -kv[1])[: args.top]
+        for name, us in slowest:
+            print(f"    {us / 1000.0:>9,.1f} ms  {name}")
+
+        if total > budget:
+            failures.append(f"{target}: {total:,.0f} ms > {budget:,.0f} ms")
+        if target in LIGHT_TARGETS:
+            leaked = sorted(p for p in HEAVY_PACKAGES if p in last["modules"])
+            if leaked:
+                print(f"    !! heavy packages imported: {', '.join(leaked)}")
+                failures.append(f"{target}: imports {', '.join(leaked)}")
+
+    if failures:
+        print("\nimport-time budget exceeded:\n  " + "\n  ".join(failures))
+        return 1 if args.check else 0
+    print("\nall targets within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
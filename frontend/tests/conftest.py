@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# frontend 디렉터리(views, api, dto)와 scripts를 import 경로에
+FRONTEND_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(FRONTEND_DIR))
+sys.path.insert(0, str(FRONTEND_DIR / "scripts"))
@@ -0,0 +1,24 @@
+"""
+첫 로딩 import 시간 예산 (scripts/importtime_report.py --check와 같은 기준)
+- 페이지마다 새 프로세스에서 측정, 중앙값이 예산 이하인지
+- 가벼운 페이지(FAQ/계산기)에 무거운 패키지가 섞여 들어오지 않았는지
+"""
+import statistics
+
+import pytest
+
+from importtime_report import DEFAULT_BUDGET_MS, HEAVY_PACKAGES, LIGHT_TARGETS, measure
+
+RUNS = 3
+
+
+@pytest.mark.parametrize("target", LIGHT_TARGETS)
+def test_light_pages_do_not_import_heavy_packages(target):
+    leaked = sorted(p for p in HEAVY_PACKAGES if p in measure(target)["modules"])
+    assert not leaked, f"{target} imports {', '.join(leaked)}"
+
+
+@pytest.mark.parametrize("target, budget_ms", sorted(DEFAULT_BUDGET_MS.items()))
+def test_import_time_within_budget(target, budget_ms):
+    total = statistics.median(measure(target)["total_ms"] for _ in range(RUNS))
+    assert total <= budget_ms, f"import {target}: {total:,.0f} ms > {budget_ms:,.0f} ms"
@@ -89,6 +89,35 @@ SUBSIDY_MAP: Dict[str, Dict[str, Union[int, str]]] = {
 }
 
 
+# 화면 지역명 -> 시/도 코드 (백엔드 /subsidies 조회용)
+SIDO_CODES = {
+    "서울특별시": "11", "부산광역시": "26", "대구광역시": "27", "인천광역시": "28",
+    "광주광역시": "29", "대전광역시": "30", "울산광역시": "31", "세종특별자치시": "36",
+    "경기도": "41", "강원특별자치도": "42", "충청북도": "43", "충청남도": "44",
+    "전북특별자치도": "45", "전라남도": "46", "경상북도": "47", "경상남도": "48",
+    "제주특별자치도": "50",
+}
+
+CAR_TYPE_CODES = {"전기차": "EV", "수소차": "H2"}
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def load_subsidy_range(year: int, sido_code: str, car_type: str):
+    """
+    서버 규칙표 기준 해당 시/도 모델별 보조금 (국비+지방비) 최소/최대
+    서버에 연결할 수 없으면 None (SUBSIDY_MAP으로 대체)
+    """
+    table = MockApiClient.get_subsidy_table(year, car_type=car_type, sido_code=sido_code)
+    if not table or not table.get("regions"):
+        return None
+
+    # 첫 행이 시/도 기본값 (시/군/구별 규칙은 다음 행들)
+    totals = [v for v in table["subsidy_total"][0] if v is not None]
+    if not totals:
+        return None
+    return min(totals), max(totals)
+
+
 def calc_subsidy(year: int, do_name: str, si_name: str, car_kind: str) -> Dict[str, str]:
     do_selected = do_name != "- 선택 -"
     si_selected = si_name != "- 선택 -"
@@ -102,6 +131,17 @@ def calc_subsidy(year: int, do_name: str, si_name: str, car_kind: str) -> Dict[s
 
     applied_region = si_name if si_selected else do_name
 
+    sido_code = SIDO_CODES.get(applied_region)
+    server_range = load_subsidy_range(year, sido_code, CAR_TYPE_CODES[car_kind]) if sido_code else None
+    if server_range:
+        low, high = server_range
+        value = f"{low}" if low == high else f"{low}~{high}"
+        return {
+            "status": "ok",
+            "message": f"{year}년 기준 당신의 예상 보조금은 {value}만원입니다. (국비+지방비, 차종별 상이)",
+            "applied_region": applied_region,
+        }
+
     region_row = SUBSIDY_MAP.get(applied_region)
     if not region_row or car_kind not in region_row:
         return {
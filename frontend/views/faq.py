@@ -1,24 +1,55 @@
 # frontend/views/faq.py
 import streamlit as st
-import re
 from api.client import MockApiClient
 
+FAQ_PAGE_SIZE = 10
+VEHICLE_TYPE_OPTIONS = ["전체", "승용", "승합", "화물", "이륜"]
+USAGE_OPTIONS = ["전체", "자가용", "영업용"]
 
-def _highlight_text(text: str, keyword: str) -> str:
+
+def _apply_highlights(text: str, spans) -> str:
+    """서버가 준 [start, end) 구간에 하이라이트 span을 씌운다. (뒤에서부터 삽입해서 offset 유지)"""
+    for start, end in sorted(spans or [], reverse=True):
+        text = (
+            text[:start]
+            + f"<span style='background-color:#FFF3B0; font-weight:700;'>{text[start:end]}</span>"
+            + text[end:]
+        )
+    return text
+
+
+def _find_spans(text: str, keyword: str):
     if not keyword:
-        return text
-    pattern = re.compile(re.escape(keyword), re.IGNORECASE)
-    return pattern.sub(
-        lambda m: f"<span style='background-color:#FFF3B0; font-weight:700;'>{m.group()}</span>",
-        text
-    )
+        return []
+    lowered, kw = text.lower(), keyword.lower()
+    spans, start = [], lowered.find(kw)
+    while start != -1:
+        spans.append([start, start + len(kw)])
+        start = lowered.find(kw, start + len(kw))
+    return spans
+
+
+def _local_search(keyword: str, page: int, size: int) -> dict:
+    """서버 검색을 못 쓸 때: 더미 FAQ에서 부분 문자열 검색 (기존 동작)"""
+    items = []
+    for faq in MockApiClient.get_faqs():
+        q_spans = _find_spans(faq.question, keyword)
+        a_spans = _find_spans(faq.answer, keyword)
+        if keyword and not (q_spans or a_spans):
+            continue
+        items.append({
+            "question": faq.question, "answer": faq.answer,
+            "source": faq.source, "category": faq.category,
+            "highlights": {"question": q_spans, "answer": a_spans},
+        })
+    start = (page - 1) * size
+    return {"total": len(items), "page": page, "size": size, "items": items[start:start + size]}
 
 
 def render():
     # -----------------------------
-    # 1) 더미 FAQ 데이터 가져오기 (DB 접근 X)
+    # 1) FAQ 데이터는 검색어/필터가 정해진 뒤 서버 검색으로 가져옴 (DB 접근 X)
     # -----------------------------
-    faqs = MockApiClient.get_faqs()
 
     # -----------------------------
     # 2) 페이지 공통 CSS (검색바/버튼/카드 정렬 개선)
@@ -119,6 +150,11 @@ def render():
         st.session_state["faq_query"] = ""
     if "faq_search" not in st.session_state:
         st.session_state["faq_search"] = ""
+    if "faq_page" not in st.session_state:
+        st.session_state["faq_page"] = 1
+
+    def reset_page():
+        st.session_state["faq_page"] = 1
 
     # 가로 폭 줄이기: 중앙에 55% 정도만 쓰도록 컬럼 비율 조정
     _, center, _ = st.columns([3, 6, 3])
@@ -142,28 +178,40 @@ def render():
             # 버튼을 눌렀을 때만 검색어 확정
             if submitted:
                 st.session_state["faq_search"] = st.session_state["faq_query"].strip()
+                st.session_state["faq_page"] = 1
 
         st.markdown('</div>', unsafe_allow_html=True)
 
+        # 차종/용도 필터 (README의 "선택한 차종/용도에 맞는 FAQ" 흐름)
+        f1, f2 = st.columns(2)
+        with f1:
+            vehicle_type = st.selectbox("차종", VEHICLE_TYPE_OPTIONS, key="faq_vehicle_type", on_change=reset_page)
+        with f2:
+            usage = st.selectbox("용도", USAGE_OPTIONS, key="faq_usage", on_change=reset_page)
+
+        fuzzy = st.checkbox("오타·초성 검색 허용 (예: ㅂㅈㄱ, 보조굼)", value=True, key="faq_fuzzy", on_change=reset_page)
+
     search_keyword = st.session_state["faq_search"]
+    page = st.session_state["faq_page"]
+
+    result = MockApiClient.search_faqs(
+        q=search_keyword,
+        vehicle_type=None if vehicle_type == "전체" else vehicle_type,
+        usage=None if usage == "전체" else usage,
+        page=page,
+        size=FAQ_PAGE_SIZE,
+        mode="fuzzy" if fuzzy else "exact",
+    )
+    if result is None:
+        result = _local_search(search_keyword, page, FAQ_PAGE_SIZE)
 
     # -----------------------------
     # 5) FAQ List
     # -----------------------------
-    shown = 0
-
-    for faq in faqs:
-        q_text = faq.question
-        a_text = faq.answer
-
-        # 버튼으로 확정된 검색어가 있을 때만 필터링
-        if search_keyword:
-            haystack = f"{q_text} {a_text}".lower()
-            if search_keyword.lower() not in haystack:
-                continue
-
-        q_highlight = _highlight_text(q_text, search_keyword)
-        a_highlight = _highlight_text(a_text, search_keyword)
+    for faq in result["items"]:
+        highlights = faq.get("highlights") or {}
+        q_highlight = _apply_highlights(faq["question"], highlights.get("question"))
+        a_highlight = _apply_highlights(faq["answer"], highlights.get("answer"))
 
         st.markdown(
             f"""
@@ -171,14 +219,37 @@ def render():
               <p class="faq-q"><strong>Q.</strong> {q_highlight}</p>
               <p class="faq-a"><strong>A.</strong> {a_highlight}</p>
               <div class="faq-meta">
-                <span>출처: {faq.source}</span>
-                <span style="margin-left:12px;">카테고리: {faq.category}</span>
+                <span>출처: {faq.get("source") or ""}</span>
+                <span style="margin-left:12px;">카테고리: {faq.get("category") or ""}</span>
               </div>
             </div>
             """,
             unsafe_allow_html=True
         )
-        shown += 1
 
-    if search_keyword and shown == 0:
+    corrected = sorted({w for words in (result.get("expansions") or {}).values() for w in words})
+    if corrected:
+        st.caption("함께 검색한 단어: " + ", ".join(corrected[:10]))
+
+    if search_keyword and result["total"] == 0:
         st.info("검색 결과가 없습니다. 다른 키워드로 검색해보세요.")
+
+    # -----------------------------
+    # 6) 페이지 이동
+    # -----------------------------
+    last_page = max(1, -(-result["total"] // FAQ_PAGE_SIZE))
+    if last_page > 1:
+        p1, p2, p3 = st.columns([1, 2, 1])
+        with p1:
+            if st.button("◀ 이전", disabled=page <= 1, use_container_width=True):
+                st.session_state["faq_page"] = page - 1
+                st.rerun()
+        with p2:
+            st.markdown(
+                f"<div style='text-align:center; padding-top:8px;'>{page} / {last_page}</div>",
+                unsafe_allow_html=True,
+            )
+        with p3:
+            if st.button("다음 ▶", disabled=page >= last_page, use_container_width=True):
+                st.session_state["faq_page"] = page + 1
+                st.rerun()
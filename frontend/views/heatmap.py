@@ -1,6 +1,4 @@
 import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
 import streamlit.components.v1 as components
 from urllib.parse import quote
 
@@ -23,13 +21,15 @@ def get_filters_from_session_or_defaults():
     """
     메인 페이지에서 넘어온 값을 session_state로 받는 것을 가정.
     값이 없으면 데모 기본값을 사용.
+    - 차종/용도는 그대로 백엔드 필터(car_type/usage)로 넘어가고 DB 코드와 정확히 같아야 하므로
+      기본값은 필터 없음(None, 화면에는 "전체")
     """
     defaults = {
         "sido": "제주특별자치도",
         "sigungu": "제주시",
         "year": 2026,
-        "vehicle_type": "승용",
-        "usage": "자가용",
+        "vehicle_type": None,
+        "usage": None,
     }
 
     for k, v in defaults.items():
@@ -96,62 +96,60 @@ def render_filter_summary(filters: dict):
     )
 
 
-def make_dummy_heatmap_matrix(seed: int, size: int = 120) -> np.ndarray:
-    rng = np.random.default_rng(seed)
-    x = np.linspace(-2.5, 2.5, size)
-    y = np.linspace(-2.5, 2.5, size)
-    X, Y = np.meshgrid(x, y)
+@st.cache_data(ttl=600, show_spinner=False)
+def load_heatmap(layer: str, year, vehicle_type, usage):
+    """
+    서버에서 미리 계산/캐시된 히트맵 PNG를 가져온다.
+    - rerun마다 matplotlib으로 다시 그리지 않음
+    """
+    return MockApiClient.get_heatmap_png(layer, year=year, car_type=vehicle_type, usage=usage)
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def load_correlation(vehicle_type, usage):
+    return MockApiClient.get_correlation(car_type=vehicle_type, usage=usage)
+
 
-    cx, cy = rng.uniform(-0.8, 0.8), rng.uniform(-0.8, 0.8)
-    sx, sy = rng.uniform(0.6, 1.2), rng.uniform(0.6, 1.2)
+def _render_heatmap_panel(layer: str, title: str, filters: dict):
+    png = load_heatmap(layer, filters.get("year"), filters.get("vehicle_type"), filters.get("usage"))
+    if png is None:
+        st.info("히트맵을 불러오지 못했습니다. 백엔드 서버 상태를 확인해주세요.")
+    else:
+        st.image(png, use_container_width=True)
 
-    Z = np.exp(-(((X - cx) ** 2) / (2 * sx**2) + ((Y - cy) ** 2) / (2 * sy**2)))
-    Z += 0.35 * np.exp(-(((X + cx) ** 2) / (2 * (sx * 1.2) ** 2) + ((Y + cy) ** 2) / (2 * (sy * 1.2) ** 2)))
-    Z += rng.normal(0, 0.06, size=(size, size))
-    Z = np.clip(Z, 0, None)
-    return Z
+    st.markdown(
+        f"<div style='text-align:center; font-weight:700; margin-top:6px;'>{title}</div>",
+        unsafe_allow_html=True,
+    )
 
 
 def render_heatmaps(filters: dict):
     st.write("")
     col1, col2 = st.columns(2, gap="medium")
 
-    seed_base = abs(
-        hash(
-            f"{filters.get('sido')}_{filters.get('sigungu')}_{filters.get('year')}_{filters.get('vehicle_type')}_{filters.get('usage')}"
-        )
-    ) % (2**31)
-
     with col1:
-        Z_reg = make_dummy_heatmap_matrix(seed=seed_base + 1)
-        fig = plt.figure(figsize=(4, 3))
-        plt.imshow(Z_reg, aspect="auto")
-        plt.axis("off")
-        st.pyplot(fig, use_container_width=False)
-
-        st.markdown(
-            "<div style='text-align:center; font-weight:700; margin-top:6px;'>Vehicle Registration Heatmap</div>",
-            unsafe_allow_html=True,
-        )
+        _render_heatmap_panel("registrations", "Vehicle Registration Heatmap", filters)
 
     with col2:
-        Z_air = make_dummy_heatmap_matrix(seed=seed_base + 2)
-        fig = plt.figure(figsize=(4, 3))
-        plt.imshow(Z_air, aspect="auto")
-        plt.axis("off")
-        st.pyplot(fig, use_container_width=False)
+        _render_heatmap_panel("pollution", "Air Quality Heatmap", filters)
 
-        st.markdown(
-            "<div style='text-align:center; font-weight:700; margin-top:6px;'>Air Quality Heatmap</div>",
-            unsafe_allow_html=True,
-        )
 
-    return Z_reg, Z_air
+def _pick_correlation(corr, sido: str):
+    """선택한 시/도 결과가 있으면 그 지역, 없으면 전국 결과의 lag 0 항목"""
+    if not corr:
+        return None, "전국"
+    for item in corr.get("regions", []):
+        if item["region"]["name"] == sido and item["correlations"]:
+            return item["correlations"][0], sido
+    national = corr.get("national") or []
+    return (national[0] if national else None), "전국"
 
 
-def render_analysis_text(Z_reg: np.ndarray, Z_air: np.ndarray):
-    r = np.corrcoef(Z_reg.flatten(), Z_air.flatten())[0, 1]
-    r = float(r)
+def render_analysis_text(filters: dict):
+    corr = load_correlation(filters.get("vehicle_type"), filters.get("usage"))
+    item, scope = _pick_correlation(corr, _safe_label(filters.get("sido"), ""))
+    r = item.get("pearson") if item else None
+    rho = item.get("spearman") if item else None
 
     st.markdown("### 데이터 해석")
 
@@ -182,7 +180,8 @@ def render_analysis_text(Z_reg: np.ndarray, Z_air: np.ndarray):
             color: #444;
             margin-bottom: 10px;
         ">
-            (참고) 두 지표 간 상관계수: {r:.2f}
+            (참고) {scope} 등록대수-대기오염도 상관계수:
+            Pearson {"-" if r is None else f"{r:.2f}"} / Spearman {"-" if rho is None else f"{rho:.2f}"}
         </div>
         """,
         unsafe_allow_html=True,
@@ -279,6 +278,7 @@ def render():
     app.py 라우팅에서 호출되는 Heatmap 페이지 렌더 함수
     - DB 직접 접근 금지
     - MockApiClient(더미) 기반 흐름 유지
+    - 히트맵은 백엔드(/heatmaps)에서 미리 계산/캐시된 이미지를 받아서 표시
     """
     st.markdown("## 히트맵 분석 (상세 페이지)")
 
@@ -313,8 +313,8 @@ def render():
     filters = get_filters_from_session_or_defaults()
 
     render_filter_summary(filters)
-    Z_reg, Z_air = render_heatmaps(filters)
-    render_analysis_text(Z_reg, Z_air)
+    render_heatmaps(filters)
+    render_analysis_text(filters)
     render_cta()
 
     # ✅ 여기서 팝업 버튼 렌더
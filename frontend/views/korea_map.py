@@ -0,0 +1,285 @@
+# frontend/views/korea_map.py
+import hashlib
+import re
+
+import folium
+import streamlit as st
+from branca.element import MacroElement
+from folium.elements import JSCSSMixin
+from folium.features import DivIcon
+from jinja2 import Template
+from streamlit_folium import generate_leaflet_string, get_full_id, st_folium
+
+# -------------------------
+# 지도 렌더링 레이어
+# - 기본 지도의 무거운 레이어(시/도 GeoJson + 라벨 마커 + 시/군/구 타일)는 데이터 버전당 한 번만
+#   Leaflet JS 문자열로 렌더해서 캐시 (GeoJson 스타일 계산/직렬화, 경계 계산을 rerun마다 하지 않음)
+# - rerun마다는 빈 지도 + 캐시된 JS(PrerenderedLayers)만 st_folium에 넘기고,
+#   바뀌는 것(선택 영역 강조)은 feature_group_to_add에만 담음
+#   -> 기본 지도 스크립트가 rerun마다 같아서 st_folium은 iframe을 다시 그리지 않고 feature group만 교체
+# - folium 객체는 st_folium이 렌더하면서 고치므로 세션끼리 공유하지 않음 (캐시는 문자열만)
+# -------------------------
+PROVINCE_CENTERS = {
+    "서울": [37.5665, 126.9780], "경기": [37.4138, 127.5183], "인천": [37.4563, 126.7052],
+    "강원": [37.8228, 128.1555], "충북": [36.6357, 127.4912], "충남": [36.6588, 126.6728],
+    "대전": [36.3504, 127.3845], "세종": [36.4800, 127.2890], "경북": [36.4919, 128.8889],
+    "경남": [35.4606, 128.2132], "대구": [35.8714, 128.6014], "울산": [35.5389, 129.3114],
+    "부산": [35.1796, 129.0756], "전북": [35.7175, 127.1530], "전남": [34.8679, 126.9910],
+    "광주": [35.1595, 126.8526], "제주": [33.4996, 126.5312],
+}
+
+BASE_STYLE = {"fillColor": "#ffffff", "color": "#cccccc", "weight": 1, "fillOpacity": 0.1}
+SELECTED_STYLE = {"fillColor": "#318ce7", "color": "#0047ab", "weight": 3, "fillOpacity": 0.6}
+
+# 시/군/구 벡터 타일 색상 구간 (등록대수 기준, 연한색 -> 진한색)
+SIGUNGU_COLORS = ["#eff6ff", "#bfdbfe", "#60a5fa", "#2563eb", "#1e3a8a"]
+
+# 포커스 테두리 제거 (클릭한 영역에 검은 테두리가 남지 않도록)
+FOCUS_FIX_HTML = """
+<style>
+    path.leaflet-interactive:focus, .leaflet-container:focus {
+        outline: none !important;
+        box-shadow: none !important;
+    }
+</style>
+<script>
+    document.addEventListener('click', function(e) {
+        if (e.target.classList.contains('leaflet-interactive')) {
+            e.target.blur();
+        }
+    });
+</script>
+"""
+
+
+class VectorTileLayer(JSCSSMixin, MacroElement):
+    """
+    백엔드 /tiles/{z}/{x}/{y}.mvt 를 Leaflet.VectorGrid로 그리는 레이어
+    - 화면에 보이는 타일만 요청하므로 250여개 시/군/구 경계를 통째로 내려받지 않음
+    - breaks: reg_total 색상 구간 경계값 (len(colors) - 1 개)
+    """
+
+    _template = Template(
+        """
+        {% macro script(this, kwargs) %}
+        // 시/도 GeoJson(overlayPane, z=400) 위에서 클릭을 받도록 별도 pane 사용
+        {{ this._parent.get_name() }}.createPane("sigunguPane");
+        {{ this._parent.get_name() }}.getPane("sigunguPane").style.zIndex = 450;
+        var {{ this.get_name() }} = L.vectorGrid.protobuf(
+            {{ this.url|tojson }},
+            {
+                pane: "sigunguPane",
+                interactive: true,
+                maxNativeZoom: {{ this.max_native_zoom }},
+                vectorTileLayerStyles: {
+                    {{ this.layer_name|tojson }}: function(properties, zoom) {
+                        var breaks = {{ this.breaks|tojson }};
+                        var colors = {{ this.colors|tojson }};
+                        var v = properties.reg_total || 0;
+                        var i = 0;
+                        while (i < breaks.length && v > breaks[i]) { i++; }
+                        return {
+                            fill: true, fillColor: colors[i], fillOpacity: 0.55,
+                            color: "#64748b", weight: 0.6
+                        };
+                    }
+                }
+            }
+        );
+        {{ this.get_name() }}.on("click", function(e) {
+            var p = e.layer.properties || {};
+            var reg = (p.reg_total != null) ? p.reg_total.toLocaleString() + "대" : "데이터 없음";
+            var poll = (p.pollution_degree != null) ? p.pollution_degree + " μg/m³" : "-";
+            L.popup()
+                .setLatLng(e.latlng)
+                .setContent("<b>" + p.name + "</b><br>🚗 " + reg + "<br>🌫 " + poll)
+                .openOn({{ this._parent.get_name() }});
+        });
+        {{ this.get_name() }}.addTo({{ this._parent.get_name() }});
+        {% endmacro %}
+        """
+    )
+
+    default_js = [
+        (
+            "leaflet.vectorgrid",
+            "https://unpkg.com/leaflet.vectorgrid@1.3.0/dist/Leaflet.VectorGrid.bundled.js",
+        )
+    ]
+
+    def __init__(self, url: str, breaks: list, colors: list = None,
+                 layer_name: str = "sigungu", max_native_zoom: int = 14):
+        super().__init__()
+        self._name = "VectorTileLayer"
+        self.url = url
+        self.breaks = list(breaks)
+        self.colors = list(colors or SIGUNGU_COLORS)
+        self.layer_name = layer_name
+        self.max_native_zoom = max_native_zoom
+
+
+class PrerenderedLayers(JSCSSMixin, MacroElement):
+    """
+    미리 렌더한 레이어 JS를 그대로 지도에 붙이는 요소
+    - script는 지도 변수 이름이 map_div로 바뀐 상태 (st_folium이 지도를 map_div로 만듦)
+    - default_js: 레이어가 쓰는 외부 스크립트 (st_folium이 iframe에 로드)
+    """
+
+    _template = Template(
+        """
+        {% macro script(this, kwargs) %}
+        {{ this.script }}
+        {% endmacro %}
+        """
+    )
+
+    def __init__(self, script: str, default_js: list = ()):
+        super().__init__()
+        self._name = "PrerenderedLayers"
+        self.script = script
+        self.default_js = list(default_js)
+
+    def render(self, **kwargs):
+        # st_folium은 _template에서 스크립트를 바로 꺼내 씀. 기본 render는 결과 문자열을 jinja 템플릿으로
+        # 다시 만들어 figure에 넣는데, 수 MB짜리 GeoJson을 rerun마다 파싱하게 되므로 건너뜀
+        pass
+
+
+def clean_name(x: str) -> str:
+    if not x:
+        return ""
+    x = re.sub(r"\s+", "", str(x).strip())
+    return re.sub(r"(특별시|광역시|특별자치시|특별자치도|도|시)$", "", x)
+
+
+def compute_data_version(df) -> str:
+    """지도에 들어가는 값(시/도, 등록대수, 오염도)이 바뀌면 달라지는 짧은 해시"""
+    payload = df[["province", "reg_count", "poll_degree"]].to_json(orient="values")
+    return hashlib.md5(payload.encode("utf-8")).hexdigest()[:12]
+
+
+def _new_map(drill_down: bool) -> folium.Map:
+    """배경 타일만 있는 지도 (sigungu 타일이 있으면 확대/이동 허용)"""
+    m = folium.Map(
+        location=[36.3, 127.8],
+        zoom_start=7,
+        tiles="cartodbpositron",
+        dragging=drill_down,
+        zoom_control=drill_down,
+        scrollWheelZoom=drill_down,
+        doubleClickZoom=drill_down,
+        touchZoom=drill_down,
+    )
+    m.get_root().header.add_child(folium.Element(FOCUS_FIX_HTML))
+    return m
+
+
+def build_base_map(geo: dict, sigungu_tiles: tuple = ()) -> folium.Map:
+    """
+    선택 상태와 무관한 기본 지도 (시/도 GeoJson + 라벨 마커 + 시/군/구 타일)
+    - sigungu_tiles: (타일 URL, 색상 구간) 이 주어지면 시/군/구 벡터 타일을 얹고 확대/이동을 허용
+    """
+    drill_down = bool(sigungu_tiles)
+    m = _new_map(drill_down)
+
+    folium.GeoJson(
+        geo,
+        style_function=lambda _: BASE_STYLE,
+        highlight_function=lambda x: {"fillColor": "#b2d8ff", "fillOpacity": 0.8},
+        tooltip=folium.GeoJsonTooltip(
+            fields=["name", "reg_val", "poll_val"],
+            aliases=["📍 지역:", "🚗 자동차:", "🌫 오염도:"],
+            style="background-color: white; border: 1px solid grey; border-radius: 5px; padding: 10px;",
+        ),
+    ).add_to(m)
+
+    if drill_down:
+        url, breaks = sigungu_tiles
+        VectorTileLayer(url, breaks=breaks).add_to(m)
+
+    for name, coords in PROVINCE_CENTERS.items():
+        folium.Marker(
+            location=coords,
+            icon=DivIcon(
+                icon_size=(0, 0),
+                icon_anchor=(0, 0),
+                html=f"""<div style="position: relative; left: -25px; top: -10px; width: 50px; font-size: 11pt;
+                            font-weight: bold; color: #333; text-align: center; pointer-events: none;
+                            text-shadow: -1px -1px 0 #fff, 1px -1px 0 #fff, -1px 1px 0 #fff, 1px 1px 0 #fff;
+                            white-space: nowrap;">{name}</div>""",
+            ),
+        ).add_to(m)
+
+    return m
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def render_base_layers(_geo: dict, data_version: str, sigungu_tiles: tuple = ()) -> tuple[str, tuple]:
+    """
+    기본 지도의 레이어들(배경 타일 제외)을 데이터 버전별로 한 번만 Leaflet JS로 렌더한다.
+    반환: (script, default_js) - script 안의 지도 변수는 map_div
+    """
+    m = build_base_map(_geo, sigungu_tiles)
+    m.get_root().render()  # GeoJson 스타일 맵 등 렌더 전에 계산되는 값 채우기
+
+    map_id = get_full_id(m)
+    parts, default_js = [], []
+    for idx, child in enumerate(m._children.values()):
+        if isinstance(child, folium.TileLayer):
+            continue
+        parts.append(generate_leaflet_string(child, base_id=f"base_{idx}").replace(map_id, "map_div"))
+        default_js.extend(getattr(child, "default_js", []))
+    return "\n".join(parts), tuple(default_js)
+
+
+def build_selection_layer(_geo: dict, data_version: str, selected: str) -> folium.FeatureGroup:
+    """
+    선택된 시/도 하나만 강조 스타일로 그리는 레이어 (클릭은 기본 지도가 받도록 interactive=False)
+    st_folium이 id/부모를 바꾸므로 캐시하지 않고 렌더마다 새로 만든다 (시/도 하나라 가벼움)
+    """
+    fg = folium.FeatureGroup(name="selection")
+    if not selected:
+        return fg
+
+    features = [
+        f for f in _geo["features"]
+        if clean_name(f["properties"].get("name", "")) == selected
+    ]
+    if features:
+        folium.GeoJson(
+            {"type": "FeatureCollection", "features": features},
+            style_function=lambda _: SELECTED_STYLE,
+            interactive=False,
+        ).add_to(fg)
+    return fg
+
+
+def render_korea_map(
+    geo: dict,
+    data_version: str,
+    selected: str,
+    key: str = "korea_map_dashboard",
+    sigungu_tiles: tuple = (),
+) -> str:
+    """
+    지도를 그리고, 사용자가 클릭한 시/도 이름(clean_name 적용)을 반환한다.
+    클릭이 없으면 빈 문자열.
+    """
+    script, default_js = render_base_layers(geo, data_version, sigungu_tiles)
+    m = _new_map(bool(sigungu_tiles))
+    PrerenderedLayers(script, default_js).add_to(m)
+    selection = build_selection_layer(geo, data_version, clean_name(selected))
+
+    map_out = st_folium(
+        m,
+        key=key,
+        height=550,
+        use_container_width=True,
+        feature_group_to_add=selection,
+        returned_objects=["last_active_drawing"],
+    )
+
+    clicked = (map_out or {}).get("last_active_drawing")
+    if not clicked:
+        return ""
+    return clean_name(clicked.get("properties", {}).get("name", ""))
@@ -1,49 +1,20 @@
 import json
-import platform
-import re
 import os
 
 import streamlit as st
 import pandas as pd
-import folium
-import matplotlib.pyplot as plt
 import streamlit.components.v1 as components
 from urllib.parse import quote
 
-from folium.features import DivIcon
-from streamlit_folium import st_folium
 from api.client import MockApiClient
+from charts.renderer import render_chart
+from views.korea_map import clean_name as _clean_name, compute_data_version, render_korea_map
+from views.station_list import render_station_list
+from views.station_map import render_station_map
 
 # -------------------------
 # 1. 상수 및 유틸리티 설정
 # -------------------------
-PROVINCE_CENTERS = {
-    "서울": [37.5665, 126.9780], "경기": [37.4138, 127.5183], "인천": [37.4563, 126.7052],
-    "강원": [37.8228, 128.1555], "충북": [36.6357, 127.4912], "충남": [36.6588, 126.6728],
-    "대전": [36.3504, 127.3845], "세종": [36.4800, 127.2890], "경북": [36.4919, 128.8889],
-    "경남": [35.4606, 128.2132], "대구": [35.8714, 128.6014], "울산": [35.5389, 129.3114],
-    "부산": [35.1796, 129.0756], "전북": [35.7175, 127.1530], "전남": [34.8679, 126.9910],
-    "광주": [35.1595, 126.8526], "제주": [33.4996, 126.5312],
-}
-
-
-def _clean_name(x: str) -> str:
-    if not x:
-        return ""
-    x = re.sub(r"\s+", "", str(x).strip())
-    return re.sub(r"(특별시|광역시|특별자치시|특별자치도|도|시)$", "", x)
-
-
-def set_korean_font():
-    """Matplotlib 한글 깨짐 방지 설정"""
-    os_name = platform.system()
-    if os_name == "Windows":
-        plt.rc("font", family="Malgun Gothic")
-    elif os_name == "Darwin":
-        plt.rc("font", family="AppleGothic")
-    else:
-        plt.rc("font", family="NanumGothic")
-    plt.rc("axes", unicode_minus=False)
 
 
 @st.cache_data
@@ -57,25 +28,87 @@ def load_geojson():
         return None
 
 
-@st.cache_data
-def get_processed_data():
-    reg_stats = MockApiClient.get_registration_stats()
-    air_stats = MockApiClient.get_air_pollution_stats()
+@st.cache_data(ttl=300, show_spinner=False)
+def load_dashboard_bundle(year=None):
+    """서버에서 지역별로 미리 합쳐 둔 대시보드 데이터 한 번에 (/dashboard/bundle)"""
+    return MockApiClient.get_dashboard_bundle(year=year, sparklines=True)
 
-    reg_df = pd.DataFrame(
-        [{"province": s.region.name, "reg_count": s.registration_count} for s in reg_stats]
-    )
-    air_df = pd.DataFrame(
-        [{"province": s.region.name, "poll_degree": s.pollution_degree} for s in air_stats]
-    )
 
-    merged = pd.merge(reg_df, air_df, on="province", how="outer").fillna(0)
+@st.cache_data(ttl=300, show_spinner=False)
+def load_region_summary(year=None, car_type=None, usage=None):
+    """서버에서 지역별로 조인해 둔 등록대수 합계 + 오염도 (/stats/region-summary)"""
+    return MockApiClient.get_region_summary(year=year, car_type=car_type, usage=usage)
+
+
+def get_processed_data(year=None):
+    # 번들이 없으면(추이 계산 실패 등) 같은 지역별 요약만 따로 받아옴
+    source = load_dashboard_bundle(year) or load_region_summary(year)
+    if source:
+        merged = pd.DataFrame(
+            [
+                {
+                    "province": r["name"],
+                    "reg_count": r.get("reg_total") or 0,
+                    "poll_degree": r.get("pollution_degree") or 0,
+                }
+                for r in source["regions"]
+            ]
+        )
+    else:
+        # 서버에 연결할 수 없을 때: 더미 데이터를 화면에서 합침
+        reg_stats = MockApiClient.get_registration_stats()
+        air_stats = MockApiClient.get_air_pollution_stats()
+        reg_df = pd.DataFrame(
+            [{"province": s.region.name, "reg_count": s.registration_count} for s in reg_stats]
+        )
+        air_df = pd.DataFrame(
+            [{"province": s.region.name, "poll_degree": s.pollution_degree} for s in air_stats]
+        )
+        merged = pd.merge(reg_df, air_df, on="province", how="outer").fillna(0)
+
     merged["p_clean"] = merged["province"].apply(_clean_name)
     return merged
 
 
+def _minmax_100(values: list) -> list:
+    """0~100 정규화 (값이 모두 같으면 50, None 유지) - 백엔드 downsample.minmax_scale 과 같은 규칙"""
+    present = [v for v in values if v is not None]
+    if not present:
+        return list(values)
+    lo, hi = min(present), max(present)
+    return [None if v is None else (100.0 * (v - lo) / (hi - lo) if hi > lo else 50.0) for v in values]
+
+
+def trend_points_from_bundle(sido_code: str) -> list:
+    """번들의 연도별 추이(spark)를 추이 차트 입력 형태로 (0~100 정규화 포함)"""
+    bundle = load_dashboard_bundle()
+    if not bundle or "spark_years" not in bundle:
+        return []
+    region = next((r for r in bundle["regions"] if r["code"] == sido_code), None)
+    if not region:
+        return []
+
+    rows = [
+        (y, reg, poll)
+        for y, reg, poll in zip(bundle["spark_years"], region["spark"]["reg"], region["spark"]["poll"])
+        if reg is not None
+    ]
+    reg_norm = _minmax_100([r[1] for r in rows])
+    poll_norm = _minmax_100([r[2] for r in rows])
+    return [
+        {
+            "period": str(y),
+            "registration_count": reg,
+            "pollution_degree": poll,
+            "registration_norm": rn,
+            "pollution_norm": pn,
+        }
+        for (y, reg, poll), rn, pn in zip(rows, reg_norm, poll_norm)
+    ]
+
+
 @st.cache_data
-def get_enriched_geojson(_geo, _df):
+def get_enriched_geojson(_geo, _df, data_version: str):
     geo_copy = json.loads(json.dumps(_geo))
     for feature in geo_copy["features"]:
         p_name = _clean_name(feature["properties"].get("name", ""))
@@ -89,42 +122,32 @@ def get_enriched_geojson(_geo, _df):
     return geo_copy
 
 
-# -------------------------
-# 2. UI 구성 요소 렌더링 함수
-# -------------------------
-def render_stations(stations, max_height_px: int = 320):
-    cards = []
-    for s in stations:
-        dist_m = int(s.get("distance_m", 0) or 0)
-        dist = f"{dist_m}m" if dist_m < 1000 else f"{dist_m / 1000:.1f}km"
-
-        lat = s.get("latitude")
-        lng = s.get("longitude")
-
-        coord_text = ""
-        if lat is not None and lng is not None:
-            coord_text = f"<div style='font-size:12px;color:#777;'>위도/경도: {lat}, {lng}</div>"
-
-        cards.append(
-            f"""
-            <div style="background:#fff;border:1px solid #ddd;border-radius:10px;
-                        padding:12px;margin-bottom:10px;">
-              <div style="font-weight:700;">{s.get('name', '')}</div>
-              <div style="font-size:13px;color:#555;">주소: {s.get('address', '')}</div>
-              <div style="font-size:13px;color:#555;">거리: {dist}</div>
-              {coord_text}
-            </div>
-            """
-        )
+def _region_code(province: str) -> str:
+    """지도에서 선택한 시/도 이름(약칭 포함) -> 시/도 코드"""
+    target = _clean_name(province)
+    for r in MockApiClient.get_regions():
+        if _clean_name(r.name) == target:
+            return r.code
+    return province
 
-    html = f"""
-    <div style="max-height:{max_height_px}px;overflow-y:auto;">
-        {''.join(cards)}
-    </div>
-    """
-    components.html(html, height=max_height_px + 20)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_tiles_version():
+    """시/군/구 벡터 타일 버전 (/tiles/status), 쓸 수 없으면 None"""
+    return MockApiClient.tiles_version()
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def load_trend_points(sido_code: str):
+    """서버에서 연 단위로 집계 + 정규화된 추이 (/stats/timeseries)"""
+    data = MockApiClient.get_timeseries(sido_code=sido_code, granularity="year", normalize=True)
+    series = (data or {}).get("series") or []
+    return series[0]["points"] if series else []
 
 
+# -------------------------
+# 2. UI 구성 요소 렌더링 함수
+# -------------------------
 def render_cta():
     st.markdown(
         """
@@ -290,92 +313,28 @@ def render():
         st.error("GeoJSON 파일을 찾지 못했습니다. korea_8do_seoul.geojson 경로를 확인해주세요.")
         return
 
-    geo = get_enriched_geojson(raw_geo, merged_df)
+    data_version = compute_data_version(merged_df)
+    geo = get_enriched_geojson(raw_geo, merged_df, data_version)
 
     if "selected_province" not in st.session_state:
         st.session_state.selected_province = ""
 
-    # 지도 생성
-    m = folium.Map(
-        location=[36.3, 127.8],
-        zoom_start=7,
-        tiles="cartodbpositron",
-        dragging=False,
-        zoom_control=False,
-        scrollWheelZoom=False,
-        doubleClickZoom=False,
-        touchZoom=False,
-    )
-
-    # 포커스 방지 JS
-    m.get_root().header.add_child(
-        folium.Element(
-            """
-            <style>
-                path.leaflet-interactive:focus, .leaflet-container:focus {
-                    outline: none !important;
-                    box-shadow: none !important;
-                }
-            </style>
-            <script>
-                document.addEventListener('click', function(e) {
-                    if (e.target.classList.contains('leaflet-interactive')) {
-                        e.target.blur();
-                    }
-                });
-            </script>
-            """
-        )
-    )
-
-    def style_fn(feature):
-        selected = _clean_name(st.session_state.selected_province)
-        is_selected = (_clean_name(feature["properties"].get("name", "")) == selected)
-        return {
-            "fillColor": "#318ce7" if is_selected else "#ffffff",
-            "color": "#0047ab" if is_selected else "#cccccc",
-            "weight": 3 if is_selected else 1,
-            "fillOpacity": 0.6 if is_selected else 0.1,
-        }
-
-    folium.GeoJson(
-        geo,
-        style_function=style_fn,
-        highlight_function=lambda x: {"fillColor": "#b2d8ff", "fillOpacity": 0.8},
-        tooltip=folium.GeoJsonTooltip(
-            fields=["name", "reg_val", "poll_val"],
-            aliases=["📍 지역:", "🚗 자동차:", "🌫 오염도:"],
-            style="background-color: white; border: 1px solid grey; border-radius: 5px; padding: 10px;",
-        ),
-    ).add_to(m)
-
-    for name, coords in PROVINCE_CENTERS.items():
-        folium.Marker(
-            location=coords,
-            icon=DivIcon(
-                icon_size=(0, 0),
-                icon_anchor=(0, 0),
-                html=f"""<div style="position: relative; left: -25px; top: -10px; width: 50px; font-size: 11pt;
-                            font-weight: bold; color: #333; text-align: center; pointer-events: none;
-                            text-shadow: -1px -1px 0 #fff, 1px -1px 0 #fff, -1px 1px 0 #fff, 1px 1px 0 #fff;
-                            white-space: nowrap;">{name}</div>""",
-            ),
-        ).add_to(m)
-
-    map_out = st_folium(
-        m,
-        key="korea_map_dashboard",
-        height=550,
-        use_container_width=True,
-        returned_objects=["last_active_drawing"],
+    # 경계 파일이 준비되지 않은 서버면 타일이 전부 503이라 토글 자체를 숨김
+    tiles_version = load_tiles_version()
+    show_sigungu = tiles_version is not None and st.toggle("시/군/구 단위로 보기", value=False, key="show_sigungu")
+    sigungu_tiles = ()
+    if show_sigungu:
+        # 색상 구간은 시/도 등록대수 분위수 기준 (타일 속성도 같은 지표)
+        breaks = merged_df["reg_count"].quantile([0.2, 0.4, 0.6, 0.8]).astype(int).tolist()
+        sigungu_tiles = (MockApiClient.tiles_url(tiles_version), tuple(breaks))
+
+    # 지도: 기본 지도는 캐시, 선택 변경 시 선택 레이어만 교체
+    new_sel = render_korea_map(
+        geo, data_version, st.session_state.selected_province, sigungu_tiles=sigungu_tiles
     )
-
-    clicked = map_out.get("last_active_drawing")
-    if clicked:
-        new_sel = _clean_name(clicked.get("properties", {}).get("name", ""))
-        if new_sel and st.session_state.selected_province != new_sel:
-            st.session_state.selected_province = new_sel
-            st.rerun()
+    if new_sel and st.session_state.selected_province != new_sel:
+        st.session_state.selected_province = new_sel
+        st.rerun()
 
     st.divider()
     sel_name = st.session_state.selected_province
@@ -414,55 +373,44 @@ def render():
     else:
         st.markdown(f"### 📈 {target_name} 지표별 변화 추이 (Scale Normalized)")
 
-        years = [2022, 2023, 2024, 2025, 2026]
-        region_rows = merged_df[merged_df["p_clean"] == _clean_name(target_name)]
-
-        if not region_rows.empty:
-            region_data = region_rows.iloc[0]
-            base_reg = region_data["reg_count"]
-            base_poll = region_data["poll_degree"]
-
-            df_trend = pd.DataFrame({
-                "연도": years,
-                "자동차 등록대수": [int(base_reg * (0.9 + (i * 0.025))) for i in range(len(years))],
-                "대기질 오염도": [base_poll + (i * 1.5) - (i % 2 * 3) for i in range(len(years))],
-            })
-
-            def normalize(series):
-                if series.max() == series.min():
-                    return series * 0
-                return (series - series.min()) / (series.max() - series.min()) * 100
-
-            reg_norm = normalize(df_trend["자동차 등록대수"])
-            poll_norm = normalize(df_trend["대기질 오염도"])
-
-            set_korean_font()
-            fig, ax = plt.subplots(figsize=(10, 5))
-            ax.plot(years, reg_norm, label="자동차 등록대수", color="#318ce7", marker="o", linewidth=2)
-            ax.plot(years, poll_norm, label="대기질 오염도", color="#ff4b4b", marker="s", linewidth=2)
-
-            ax.set_title(f"{target_name} 지표별 상관관계 분석", fontsize=14)
-            ax.set_ylim(-10, 110)
-            ax.set_xticks(years)
-            ax.set_ylabel("상대적 변화율 (0-100)")
-            ax.legend(loc="upper left")
-            ax.grid(True, linestyle="--", alpha=0.5)
-            ax.spines["top"].set_visible(False)
-            ax.spines["right"].set_visible(False)
-
-            st.pyplot(fig)
-            plt.close(fig)
+        sido_code = _region_code(target_name)
+        points = trend_points_from_bundle(sido_code) or load_trend_points(sido_code)
+
+        if not points:
+            st.info("추이 데이터를 불러오지 못했습니다. 백엔드 서버 상태를 확인해주세요.")
+        else:
+            png = render_chart(
+                "trend",
+                {
+                    "title": f"{target_name} 지표별 상관관계 분석",
+                    "periods": [p["period"] for p in points],
+                    "ylabel": "상대적 변화율 (0-100)",
+                    "series": [
+                        {"label": "자동차 등록대수", "color": "#318ce7", "marker": "o",
+                         "values": [p.get("registration_norm") for p in points]},
+                        {"label": "대기질 오염도", "color": "#ff4b4b", "marker": "s",
+                         "values": [p.get("pollution_norm") for p in points]},
+                    ],
+                },
+                data_version=data_version,
+            )
+            st.image(png, use_container_width=True)
 
             st.caption(
                 "**💡 그래프 설명:** 연도별 자동차 등록대수 증가와 대기질 오염도의 상관관계를 분석하기 위해, "
                 "서로 다른 단위의 두 지표를 0~100 사이의 상대적 수치로 정규화(Normalization)하여 나타낸 분석 차트입니다."
             )
 
+            first_reg = points[0]["registration_count"]
+            last_reg = points[-1]["registration_count"]
+            last_poll = points[-1]["pollution_degree"]
+            growth = (last_reg - first_reg) / first_reg * 100 if first_reg else 0.0
+
             st.divider()
             m1, m2, m3 = st.columns(3)
-            m1.metric("최종 자동차 등록대수", f"{int(df_trend['자동차 등록대수'].iloc[-1]):,} 대")
-            m2.metric("최종 대기질 오염도", f"{df_trend['대기질 오염도'].iloc[-1]:.1f} μg/m³")
-            m3.metric("5개년 등록 증가 추세", "+10.0%")
+            m1.metric("최종 자동차 등록대수", f"{int(last_reg):,} 대")
+            m2.metric("최종 대기질 오염도", "-" if last_poll is None else f"{last_poll:.1f} μg/m³")
+            m3.metric(f"{len(points)}개 기간 등록 증가 추세", f"{growth:+.1f}%")
 
     # -------------------------
     # CTA + 보조금 팝업 버튼
@@ -493,16 +441,14 @@ def render():
         st.caption(
             "현재 위치(GPS)를 아직 받지 못했어요. "
             "위의 **'현재 위치 사용'** 버튼을 눌러 위치 권한을 허용하면, "
-            "내 위치 기준으로 더 정확한 주변 충전소를 안내할 수 있어요."
+            "내 위치 기준으로 더 정확한 주변 충전소를 안내할 수 있어요. (지금은 최근 등록 순)"
         )
     else:
         st.caption(f"내 위치 기준으로 가까운 충전소를 보여드려요. (위도 {user_lat:.5f}, 경도 {user_lng:.5f})")
 
-    stations = MockApiClient.get_stations(
-        car_kind=car_kind,
-        n=12,
-        user_lat=user_lat,
-        user_lng=user_lng,
-    )
-    stations = sorted(stations, key=lambda x: int(x.get("distance_m", 0) or 0))
-    render_stations(stations, max_height_px=320)
\ No newline at end of file
+    # 충전소 목록 (가상 스크롤, 스크롤하면 서버 커서로 다음 페이지)
+    station_type = "EV" if car_kind == "전기차" else "H2"
+    render_station_list(station_type, user_lat, user_lng, height_px=320)
+
+    # 전국 충전소 지도 (서버 클러스터, 확대하면 개별 충전소)
+    render_station_map(station_type)
\ No newline at end of file
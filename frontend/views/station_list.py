@@ -0,0 +1,46 @@
+from pathlib import Path
+from typing import Optional
+
+import streamlit.components.v1 as components
+
+from api.client import MockApiClient
+
+# -------------------------
+# 충전소 목록 (가상 스크롤 컴포넌트)
+# - 목록 HTML을 매 rerun마다 components.html로 통째로 다시 넣지 않고, 선언형 컴포넌트 iframe 하나를 유지
+#   (같은 key면 rerun 때 인자만 다시 전달 -> 조건이 같으면 불러온 목록/스크롤 위치/SSE 구독 그대로)
+# - 보이는 줄만 DOM에 그리고, 스크롤이 끝에 가까워지면 브라우저가 /stations/page 커서로 다음 페이지를 직접 받음
+# - 위치가 있으면 가까운 순, 없으면 최근 등록 순 (서버 정렬)
+# - 프론트엔드: components/station_list/index.html (빌드 없는 정적 HTML/JS)
+# -------------------------
+_COMPONENT_DIR = Path(__file__).resolve().parents[1] / "components" / "station_list"
+_station_list = components.declare_component("station_list", path=str(_COMPONENT_DIR))
+
+PAGE_SIZE = 50
+ROW_HEIGHT_PX = 100
+
+
+def render_station_list(
+    station_type: str,
+    user_lat: Optional[float] = None,
+    user_lng: Optional[float] = None,
+    q: Optional[str] = None,
+    height_px: int = 320,
+    key: str = "station_list",
+) -> None:
+    # GPS 값의 미세한 흔들림으로 목록이 처음부터 다시 읽히지 않도록 (약 1m)
+    lat = None if user_lat is None else round(user_lat, 5)
+    lng = None if user_lng is None else round(user_lng, 5)
+    _station_list(
+        page_url=MockApiClient.station_page_url(),
+        stream_url=MockApiClient.availability_stream_url(),
+        station_type=station_type,
+        q=q or None,
+        lat=lat if lng is not None else None,
+        lng=lng if lat is not None else None,
+        page_size=PAGE_SIZE,
+        row_height=ROW_HEIGHT_PX,
+        height=height_px,
+        key=key,
+        default=None,
+    )
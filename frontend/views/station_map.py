@@ -0,0 +1,89 @@
+import copy
+import math
+
+import folium
+import streamlit as st
+from folium.features import DivIcon
+from streamlit_folium import st_folium
+
+from api.client import MockApiClient
+
+# -------------------------
+# 충전소 클러스터 지도
+# - 서버(/stations/clusters)가 화면 범위(bbox) x 줌에 맞춰 클러스터/개별 충전소만 내려줌 (수백 개 이하)
+# - 기본 지도는 한 번만 만들고, 클러스터는 feature group으로만 교체 (iframe 재생성 없음)
+#   st_folium이 넘겨받은 Map에 feature group을 붙이므로 캐시된 Map은 렌더마다 deepcopy해서 넘김
+#   (원본에 이전 클러스터가 쌓이면 지도 HTML이 바뀌어 처음 화면으로 다시 그려지고, 세션끼리 마커가 섞임)
+# - 지도를 움직이면 st_folium이 bounds/zoom을 돌려주고, 다음 rerun에서 그 범위로 다시 요청
+# -------------------------
+KOREA_CENTER = [36.3, 127.8]
+KOREA_BBOX = (124.5, 33.0, 131.0, 38.7)
+
+
+@st.cache_resource(show_spinner=False)
+def build_station_base_map() -> folium.Map:
+    return folium.Map(location=KOREA_CENTER, zoom_start=7, tiles="cartodbpositron")
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_station_clusters(bbox: tuple, zoom: int, station_type: str):
+    return MockApiClient.get_station_clusters(bbox=bbox, zoom=zoom, station_type=station_type)
+
+
+def _cluster_layer(data: dict) -> folium.FeatureGroup:
+    fg = folium.FeatureGroup(name="stations")
+    for c in data.get("clusters", []):
+        count = c["count"]
+        size = int(24 + 8 * math.log10(max(count, 1)))
+        label = f"{count / 1000:.1f}k" if count >= 1000 else str(count)
+        folium.Marker(
+            location=[c["latitude"], c["longitude"]],
+            tooltip=f"충전소 {count:,}곳 (확대하면 나뉘어요)",
+            icon=DivIcon(
+                icon_size=(size, size),
+                icon_anchor=(size // 2, size // 2),
+                html=f"""<div style="width:{size}px;height:{size}px;border-radius:50%;
+                            background:rgba(33,145,140,0.75);color:#fff;font-size:12px;font-weight:700;
+                            display:flex;align-items:center;justify-content:center;">{label}</div>""",
+            ),
+        ).add_to(fg)
+    for p in data.get("points", []):
+        folium.CircleMarker(
+            location=[p["latitude"], p["longitude"]],
+            radius=6,
+            color="#21918c",
+            fill=True,
+            fill_opacity=0.9,
+            tooltip=f"{p.get('name') or ''}<br>{p.get('address') or ''}",
+        ).add_to(fg)
+    return fg
+
+
+def _view_from_state(key: str) -> tuple[tuple, int]:
+    state = st.session_state.get(key) or {}
+    bounds, zoom = state.get("bounds"), state.get("zoom")
+    try:
+        sw, ne = bounds["_southWest"], bounds["_northEast"]
+        bbox = (sw["lng"], sw["lat"], ne["lng"], ne["lat"])
+    except (TypeError, KeyError):
+        return KOREA_BBOX, 7
+    # 같은 화면이 rerun마다 다른 캐시 키가 되지 않도록 반올림
+    return tuple(round(v, 3) for v in bbox), int(zoom or 7)
+
+
+def render_station_map(station_type: str, key: str = "station_cluster_map", height: int = 420) -> None:
+    bbox, zoom = _view_from_state(key)
+    data = load_station_clusters(bbox, zoom, station_type)
+    if not data:
+        st.caption("충전소 지도를 불러오지 못했어요.")
+        return
+
+    st.caption(f"지도 범위 안 충전소 {data['total']:,}곳")
+    st_folium(
+        copy.deepcopy(build_station_base_map()),
+        key=key,
+        height=height,
+        use_container_width=True,
+        feature_group_to_add=_cluster_layer(data),
+        returned_objects=["bounds", "zoom"],
+    )
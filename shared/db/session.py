@@ -1,42 +1,48 @@
 import os
+import threading
 from pathlib import Path
 
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 
-# ✅ backend/.env 파일을 정확히 지정해서 로드
-ENV_PATH = Path(__file__).resolve().parents[3] / "backend" / ".env"
-load_dotenv(ENV_PATH, override=True)
-
-# 환경변수에서 DB 접속 정보 읽기
-DB_HOST = os.getenv("DB_HOST")
-DB_PORT = os.getenv("DB_PORT", "3306")
-DB_NAME = os.getenv("DB_NAME")
-DB_USER = os.getenv("DB_USER")
-DB_PASSWORD = os.getenv("DB_PASSWORD")
-
-# 🔎 로드 확인용 (성공 확인 후 삭제 가능)
-print("ENV_PATH =", ENV_PATH)
-print("DB_HOST loaded =", DB_HOST)
-
-# MySQL 연결 URL
-DATABASE_URL = (
-    f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}"
-    f"@{DB_HOST}:{DB_PORT}/{DB_NAME}?charset=utf8mb4"
-)
+# backend/.env (엔진을 처음 만들 때 읽음)
+ENV_PATH = Path(__file__).resolve().parents[2] / "backend" / ".env"
+
+_engine = None
+_lock = threading.Lock()
+
+
+def _database_url() -> str:
+    load_dotenv(ENV_PATH, override=True)
+    return (
+        f"mysql+pymysql://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}"
+        f"@{os.getenv('DB_HOST')}:{os.getenv('DB_PORT', '3306')}/{os.getenv('DB_NAME')}?charset=utf8mb4"
+    )
+
+
+def get_engine() -> Engine:
+    """SQLAlchemy 엔진 (import 시점이 아니라 처음 호출할 때 생성)"""
+    global _engine
+    if _engine is None:
+        with _lock:
+            if _engine is None:
+                _engine = create_engine(_database_url(), pool_pre_ping=True)
+                SessionLocal.configure(bind=_engine)
+    return _engine
+
+
+class _LazySessionmaker(sessionmaker):
+    def __call__(self, **local_kw):
+        get_engine()
+        return super().__call__(**local_kw)
 
-# SQLAlchemy 엔진 생성
-engine = create_engine(
-    DATABASE_URL,
-    pool_pre_ping=True,
-)
 
 # DB 세션 생성기
-SessionLocal = sessionmaker(
+SessionLocal = _LazySessionmaker(
     autocommit=False,
     autoflush=False,
-    bind=engine,
 )
 
 # ORM 베이스 클래스
@@ -48,4 +54,4 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()